@@ -4,7 +4,9 @@ import logging
 import os
 import re
 import warnings
+from collections.abc import Callable, Iterable
 from datetime import UTC, datetime, time, timedelta
+from itertools import batched
 from pathlib import Path
 from typing import Any
 
@@ -21,19 +23,37 @@ from requests.structures import CaseInsensitiveDict
 from requests_toolbelt.multipart import decoder
 
 from caselawclient import xquery_type_dicts as query_dicts
-from caselawclient.identifier_resolution import IdentifierResolutions
+from caselawclient.identifier_resolution import (
+    IdentifierResolutionCache,
+    IdentifierResolutionKind,
+    IdentifierResolutions,
+)
+from caselawclient.managers import fclid, materialisation, publish
 from caselawclient.models.documents import (
     DOCUMENT_COLLECTION_URI_JUDGMENT,
     DOCUMENT_COLLECTION_URI_PRESS_SUMMARY,
     Document,
 )
-from caselawclient.models.documents.versions import VersionAnnotation, VersionType
+from caselawclient.models.documents.versions import (
+    VersionAnnotation,
+    VersionDetailsDict,
+    VersionType,
+    render_version_details,
+)
 from caselawclient.models.judgments import Judgment
 from caselawclient.models.press_summaries import PressSummary
 from caselawclient.models.utilities import move
 from caselawclient.models.utilities.dates import require_aware_utc
 from caselawclient.search_parameters import SearchParameters
-from caselawclient.types import DocumentIdentifierSlug, DocumentIdentifierValue, DocumentLock, DocumentURIString
+from caselawclient.search_response_cache import SearchResponseCache
+from caselawclient.types import (
+    DocumentIdentifierSlug,
+    DocumentIdentifierValue,
+    DocumentLock,
+    DocumentSkeleton,
+    DocumentURIString,
+    PropertyWrite,
+)
 from caselawclient.xml_helpers import Element
 from caselawclient.xquery_type_dicts import (
     CheckContentHashUniqueByUriDict,
@@ -79,6 +99,12 @@ DEFAULT_USER_AGENT = f"ds-caselaw-marklogic-api-client/{VERSION}"
 
 DEBUG: bool = bool(os.getenv("DEBUG", default=None))
 
+IDENTIFIER_RESOLUTION_BATCH_SIZE = 500
+""" The most identifiers to resolve in a single query; larger requests are split into several queries. """
+
+IDENTIFIER_RESOLUTION_PROPERTIES = frozenset({"identifiers", "published"})
+""" Document properties which the identifier resolution view is built from. """
+
 logger = logging.getLogger(__name__)
 
 
@@ -203,7 +229,15 @@ class MarklogicApiClient:
         password: str,
         use_https: bool,
         user_agent: str = DEFAULT_USER_AGENT,
+        identifier_resolution_cache: IdentifierResolutionCache | None = None,
+        search_response_cache: SearchResponseCache | None = None,
     ) -> None:
+        """
+        :param identifier_resolution_cache: If given, identifier resolutions are cached here, and removed from it when
+            this client changes a document's identifiers, publishes, unpublishes, moves or deletes it
+        :param search_response_cache: If given, responses to searches which can't show unpublished documents are
+            cached here. The caller owns the cache, and should close it when it is no longer needed
+        """
         self.host = host
         self.username = username
         self.password = password
@@ -219,6 +253,8 @@ class MarklogicApiClient:
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
         self.user_agent = user_agent
+        self.identifier_resolution_cache = identifier_resolution_cache
+        self.search_response_cache = search_response_cache
 
     def get_press_summaries_for_document_uri(
         self,
@@ -553,9 +589,7 @@ class MarklogicApiClient:
         judgment_uri: DocumentURIString,
     ) -> requests.Response:
         uri = self._format_uri_for_marklogic(judgment_uri)
-        content_with_id = f"https://caselaw.nationalarchives.gov.uk/id/{judgment_uri.lstrip('/')}"
-        content_without_id = f"https://caselaw.nationalarchives.gov.uk/{judgment_uri.lstrip('/')}"
-        content_with_xml = f"https://caselaw.nationalarchives.gov.uk/{judgment_uri.lstrip('/')}/data.xml"
+        content_with_id, content_without_id, content_with_xml = self._this_uri_values(judgment_uri)
         vars: query_dicts.SetMetadataThisUriDict = {
             "uri": uri,
             "content_with_id": content_with_id,
@@ -565,6 +599,16 @@ class MarklogicApiClient:
 
         return self._send_to_eval(vars, "set_metadata_this_uri.xqy")
 
+    @staticmethod
+    def _this_uri_values(judgment_uri: DocumentURIString) -> tuple[str, str, str]:
+        """The values of the FRBR `uri` and `this` elements for the work, expression and manifestation of a document."""
+        path = judgment_uri.lstrip("/")
+        return (
+            f"https://caselaw.nationalarchives.gov.uk/id/{path}",
+            f"https://caselaw.nationalarchives.gov.uk/{path}",
+            f"https://caselaw.nationalarchives.gov.uk/{path}/data.xml",
+        )
+
     def save_locked_judgment_xml(
         self,
         judgment_uri: DocumentURIString,
@@ -662,6 +706,28 @@ class MarklogicApiClient:
 
         return self._send_to_eval(vars, "list_judgment_versions.xqy")
 
+    def list_versions_detailed(
+        self,
+        judgment_uri: DocumentURIString,
+        include_size: bool = False,
+    ) -> list[VersionDetailsDict]:
+        """
+        List every version of a document with its creation time and annotation, in a single request.
+
+        :param include_size: Also return the size of each version. This requires MarkLogic to serialise every version, so
+            only ask for it where sizes are shown.
+
+        :return: A list of versions, most recent first
+        """
+        uri = self._format_uri_for_marklogic(judgment_uri)
+        vars: query_dicts.ListJudgmentVersionsDetailedDict = {"uri": uri, "include_size": include_size}
+
+        return render_version_details(
+            get_multipart_strings_from_marklogic_response(
+                self._send_to_eval(vars, "list_judgment_versions_detailed.xqy"),
+            ),
+        )
+
     def checkout_judgment(
         self,
         judgment_uri: DocumentURIString,
@@ -915,6 +981,29 @@ class MarklogicApiClient:
             return None
         return etree.fromstring(value)
 
+    def get_property_as_node_for_documents(
+        self, document_uris: list[DocumentURIString], name: str
+    ) -> dict[DocumentURIString, Element | None]:
+        """
+        Get the same property of many documents in one request, as `get_property_as_node` does for one.
+
+        :return: The value of the property for each document, or `None` if the document has no such property
+        """
+        vars: query_dicts.GetPropertyAsNodeForDocumentsDict = {
+            "uris": [self._format_uri_for_marklogic(uri) for uri in document_uris],
+            "name": name,
+        }
+
+        properties: dict[DocumentURIString, Element | None] = {}
+        for result in get_multipart_strings_from_marklogic_response(
+            self._send_to_eval(vars, "get_property_as_node_for_documents.xqy"),
+        ):
+            property_result = etree.fromstring(result.encode("utf-8"))
+            uri = MarkLogicDocumentURIString(property_result.get("uri", "")).as_document_uri()
+            properties[uri] = property_result[0] if len(property_result) else None
+
+        return properties
+
     def get_version_annotation(self, judgment_uri: DocumentURIString) -> str:
         uri = self._format_uri_for_marklogic(judgment_uri)
         vars: query_dicts.GetVersionAnnotationDict = {
@@ -945,7 +1034,9 @@ class MarklogicApiClient:
             "name": name,
         }
 
-        return self._send_to_eval(vars, "set_property.xqy")
+        response = self._send_to_eval(vars, "set_property.xqy")
+        self._invalidate_identifier_resolutions_for_property(judgment_uri, name)
+        return response
 
     def set_property_as_node(
         self,
@@ -961,7 +1052,9 @@ class MarklogicApiClient:
             "name": name,
         }
 
-        return self._send_to_eval(vars, "set_property_as_node.xqy")
+        response = self._send_to_eval(vars, "set_property_as_node.xqy")
+        self._invalidate_identifier_resolutions_for_property(judgment_uri, name)
+        return response
 
     def set_boolean_property(
         self,
@@ -981,7 +1074,9 @@ class MarklogicApiClient:
 
         Since XML has no concept of boolean, the actual value in the database is set to `"true"` or `"false"`.
         """
-        return self._send_to_eval(vars, "set_boolean_property.xqy")
+        response = self._send_to_eval(vars, "set_boolean_property.xqy")
+        self._invalidate_identifier_resolutions_for_property(judgment_uri, name)
+        return response
 
     def get_boolean_property(self, judgment_uri: DocumentURIString, name: str) -> bool:
         """
@@ -1021,6 +1116,48 @@ class MarklogicApiClient:
 
         return None
 
+    def set_properties(self, writes: list[PropertyWrite]) -> requests.Response | None:
+        """
+        Set many properties, across any number of documents, in a single request to MarkLogic.
+
+        If the same property of the same document appears more than once, only the last value is written. The writes are
+        grouped by document, and each document's properties are written through DLS in a single update.
+
+        :return: The response from MarkLogic, or `None` if there was nothing to write
+        :raises DocumentNotFoundError: One of the documents does not exist or is not managed, in which case nothing is
+            written
+        """
+        documents: dict[MarkLogicDocumentURIString, dict[str, dict[str, str]]] = {}
+
+        for write in writes:
+            uri = self._format_uri_for_marklogic(write.document_uri)
+            if isinstance(write.value, bool):
+                value, property_type = ("true" if write.value else "false"), "boolean"
+            elif isinstance(write.value, datetime):
+                value, property_type = require_aware_utc(write.value, name=write.name).isoformat(), "datetime"
+            elif isinstance(write.value, str):
+                value, property_type = write.value, "string"
+            else:
+                value, property_type = etree.tostring(write.value).decode(), "node"
+
+            properties = documents.setdefault(uri, {})
+            properties.pop(write.name, None)
+            properties[write.name] = {"name": write.name, "value": value, "type": property_type}
+
+        if not documents:
+            return None
+
+        # Each document's properties are written in a single update, as several updates to one document would conflict
+        vars: query_dicts.SetPropertiesDict = {
+            "documents": [
+                {"uri": uri, "properties": list(properties.values())} for uri, properties in documents.items()
+            ]
+        }
+        response = self._send_to_eval(vars, "set_properties.xqy")
+        for write in writes:
+            self._invalidate_identifier_resolutions_for_property(write.document_uri, write.name)
+        return response
+
     def set_published(
         self,
         judgment_uri: DocumentURIString,
@@ -1099,7 +1236,9 @@ class MarklogicApiClient:
     def delete_judgment(self, judgment_uri: DocumentURIString) -> requests.Response:
         uri = self._format_uri_for_marklogic(judgment_uri)
         vars: query_dicts.DeleteJudgmentDict = {"uri": uri}
-        return self._send_to_eval(vars, "delete_judgment.xqy")
+        response = self._send_to_eval(vars, "delete_judgment.xqy")
+        self._invalidate_identifier_resolutions(judgment_uri)
+        return response
 
     def copy_document(
         self,
@@ -1115,6 +1254,33 @@ class MarklogicApiClient:
         }
         return self._send_to_eval(vars, "copy_document.xqy")
 
+    def move_document(
+        self,
+        old: DocumentURIString,
+        new: DocumentURIString,
+    ) -> requests.Response:
+        """
+        Move a document to a new URI in a single transaction. The document and its source, transfer and publication
+        properties are copied, the URIs within the document are rewritten, and the original is deleted. If any step
+        fails, none of them take effect.
+
+        :raises MarklogicAPIError: A document already exists at the new URI, or the move failed
+        """
+        old_uri = self._format_uri_for_marklogic(old)
+        new_uri = self._format_uri_for_marklogic(new)
+        content_with_id, content_without_id, content_with_xml = self._this_uri_values(new)
+
+        vars: query_dicts.MoveDocumentDict = {
+            "old_uri": old_uri,
+            "new_uri": new_uri,
+            "content_with_id": content_with_id,
+            "content_without_id": content_without_id,
+            "content_with_xml": content_with_xml,
+        }
+        response = self._send_to_eval(vars, "move_document.xqy")
+        self._invalidate_identifier_resolutions(old, new)
+        return response
+
     def break_checkout(self, judgment_uri: DocumentURIString) -> requests.Response:
         uri = self._format_uri_for_marklogic(judgment_uri)
         vars: query_dicts.BreakJudgmentCheckoutDict = {
@@ -1194,8 +1360,21 @@ class MarklogicApiClient:
         return get_single_string_from_marklogic_response(response)
 
     def search_and_decode_response(self, search_parameters: SearchParameters) -> bytes:
-        response = self.advanced_search(search_parameters)
-        return get_single_bytestring_from_marklogic_response(response)
+        """
+        Perform a search and return the search response XML.
+
+        If this client has a search response cache, searches which can't show unpublished documents are answered from
+        it where possible. Searches which might show unpublished documents are never cached, since their response
+        depends on the user.
+        """
+
+        def search() -> bytes:
+            response = self.advanced_search(search_parameters)
+            return get_single_bytestring_from_marklogic_response(response)
+
+        if self.search_response_cache is None or search_parameters.may_show_unpublished:
+            return search()
+        return self.search_response_cache.get_or_fetch(search_parameters.cache_key, search)
 
     def search_judgments_and_decode_response(
         self,
@@ -1212,6 +1391,40 @@ class MarklogicApiClient:
         """
         return move.update_document_uri(old_uri, new_citation, api_client=self)
 
+    def publish_many(
+        self,
+        uris: list[DocumentURIString],
+        concurrency: int = publish.DEFAULT_CONCURRENCY,
+    ) -> list[publish.BulkOperationResult]:
+        """Publish many documents at once, batching MarkLogic and SNS requests where possible."""
+        return publish.publish_many(self, uris, concurrency=concurrency)
+
+    def unpublish_many(
+        self,
+        uris: list[DocumentURIString],
+        concurrency: int = publish.DEFAULT_CONCURRENCY,
+    ) -> list[publish.BulkOperationResult]:
+        """Unpublish many documents at once, batching MarkLogic and SNS requests where possible."""
+        return publish.unpublish_many(self, uris, concurrency=concurrency)
+
+    def backfill_metadata_materialisation(
+        self,
+        checkpoint_path: str | None = None,
+        concurrency: int = materialisation.DEFAULT_CONCURRENCY,
+    ) -> materialisation.MaterialisationCheckpoint:
+        """Materialise the metadata claims of every document which is behind the current materialisation version."""
+        return materialisation.backfill_metadata_materialisation(
+            self, checkpoint_path=checkpoint_path, concurrency=concurrency
+        )
+
+    def backfill_fclids(
+        self,
+        dry_run: bool = False,
+        concurrency: int = fclid.DEFAULT_CONCURRENCY,
+    ) -> fclid.FCLIDBackfillProgress:
+        """Assign a Find Case Law identifier to every published document which doesn't have one."""
+        return fclid.backfill_fclids(self, dry_run=dry_run, concurrency=concurrency)
+
     def get_combined_stats_table(self) -> list[list[Any]]:
         """Run the combined statistics table xquery and return the result as a list of lists, each representing a table
         row."""
@@ -1364,10 +1577,16 @@ class MarklogicApiClient:
     def get_missing_fclid(
         self,
         maximum_records: int = 50,
+        after_uri: DocumentURIString | None = None,
     ) -> list[str]:
-        """Retrieve the URIs of published documents which do not have an identifier in the `fclid` schema."""
+        """
+        Retrieve the URIs of published documents which do not have an identifier in the `fclid` schema, in URI order.
+
+        :param after_uri: Only return URIs after this one, to fetch the page after one ending with it
+        """
         vars: query_dicts.GetMissingFclidDict = {
             "maximum_records": maximum_records,
+            "after_uri": self._format_uri_for_marklogic(after_uri) if after_uri else None,
         }
 
         results: list[str] = get_multipart_strings_from_marklogic_response(
@@ -1379,11 +1598,66 @@ class MarklogicApiClient:
 
         return results
 
+    def get_pending_metadata_materialisation(
+        self,
+        current_version: str,
+        after_uri: DocumentURIString | None = None,
+        maximum_records: int = 1000,
+    ) -> list[DocumentURIString]:
+        """
+        Retrieve the URIs of documents whose metadata claims were not materialised with `current_version`, in URI order.
+
+        :param after_uri: Only return URIs after this one, to fetch the page after one ending with it
+        """
+        vars: query_dicts.GetPendingMetadataMaterialisationDict = {
+            "current_version": current_version,
+            "after_uri": self._format_uri_for_marklogic(after_uri) if after_uri else None,
+            "maximum_records": maximum_records,
+        }
+
+        results = get_multipart_strings_from_marklogic_response(
+            self._send_to_eval(vars, "get_pending_metadata_materialisation.xqy"),
+        )
+
+        return [MarkLogicDocumentURIString(uri).as_document_uri() for uri in results]
+
+    def get_document_skeletons(self, document_uris: list[DocumentURIString]) -> list[DocumentSkeleton]:
+        """
+        Retrieve the metadata and header of each document, along with its `metadata_fields` property, in one request.
+        This is much smaller than retrieving each full document when only its metadata is needed.
+        """
+        vars: query_dicts.GetDocumentSkeletonsDict = {
+            "uris": [self._format_uri_for_marklogic(uri) for uri in document_uris],
+        }
+
+        skeletons = []
+        for result in get_multipart_strings_from_marklogic_response(
+            self._send_to_eval(vars, "get_document_skeletons.xqy"),
+        ):
+            skeleton = etree.fromstring(result.encode("utf-8"))
+            skeletons.append(
+                DocumentSkeleton(
+                    uri=MarkLogicDocumentURIString(skeleton.get("uri", "")).as_document_uri(),
+                    xml=etree.tostring(skeleton[0]),
+                    metadata_fields=skeleton.find("metadata_fields"),
+                )
+            )
+
+        return skeletons
+
     def resolve_from_identifier_slug(
-        self, identifier_slug: DocumentIdentifierSlug, published_only: bool = True
+        self, identifier_slug: DocumentIdentifierSlug, published_only: bool = True, use_cache: bool = True
     ) -> IdentifierResolutions:
         """Given a PUI/EUI url, look up the precomputed slug and return the
-        MarkLogic document URIs which match that slug. Multiple returns should be anticipated"""
+        MarkLogic document URIs which match that slug. Multiple returns should be anticipated
+
+        :param use_cache: Answer from the identifier resolution cache if possible. Pass `False` where the answer must
+            be current, such as when checking an identifier is unique before saving it."""
+        if use_cache and self.identifier_resolution_cache is not None:
+            cached = self.identifier_resolution_cache.get("slug", identifier_slug, published_only)
+            if cached is not None:
+                return cached
+
         vars: query_dicts.ResolveFromIdentifierSlugDict = {
             "identifier_slug": identifier_slug,
             "published_only": int(published_only),
@@ -1394,13 +1668,25 @@ class MarklogicApiClient:
                 "resolve_from_identifier_slug.xqy",
             ),
         )
-        return IdentifierResolutions.from_marklogic_output(raw_results)
+        resolutions = IdentifierResolutions.from_marklogic_output(raw_results)
+
+        if self.identifier_resolution_cache is not None:
+            self.identifier_resolution_cache.put("slug", identifier_slug, published_only, resolutions)
+        return resolutions
 
     def resolve_from_identifier_value(
-        self, identifier_value: DocumentIdentifierValue, published_only: bool = True
+        self, identifier_value: DocumentIdentifierValue, published_only: bool = True, use_cache: bool = True
     ) -> IdentifierResolutions:
         """Given a PUI/EUI url, look up the precomputed slug and return the
-        MarkLogic document URIs which match that slug. Multiple returns should be anticipated"""
+        MarkLogic document URIs which match that slug. Multiple returns should be anticipated
+
+        :param use_cache: Answer from the identifier resolution cache if possible. Pass `False` where the answer must
+            be current, such as when checking an identifier is unique before saving it."""
+        if use_cache and self.identifier_resolution_cache is not None:
+            cached = self.identifier_resolution_cache.get("value", identifier_value, published_only)
+            if cached is not None:
+                return cached
+
         vars: query_dicts.ResolveFromIdentifierValueDict = {
             "identifier_value": identifier_value,
             "published_only": int(published_only),
@@ -1411,8 +1697,126 @@ class MarklogicApiClient:
                 "resolve_from_identifier_value.xqy",
             ),
         )
-        return IdentifierResolutions.from_marklogic_output(raw_results)
+        resolutions = IdentifierResolutions.from_marklogic_output(raw_results)
+
+        if self.identifier_resolution_cache is not None:
+            self.identifier_resolution_cache.put("value", identifier_value, published_only, resolutions)
+        return resolutions
+
+    def resolve_many_slugs(
+        self, identifier_slugs: Iterable[DocumentIdentifierSlug], published_only: bool = True, use_cache: bool = True
+    ) -> dict[DocumentIdentifierSlug, IdentifierResolutions]:
+        """
+        Resolve many identifier slugs at once, as `resolve_from_identifier_slug` does for one, using as few queries as
+        possible.
+
+        :param use_cache: Answer from the identifier resolution cache if possible, as with `resolve_from_identifier_slug`
+
+        :return: The resolutions for each of the given slugs, which are empty for slugs which don't resolve
+        """
+
+        def query(slugs: list[str]) -> list[str]:
+            vars: query_dicts.ResolveManyFromIdentifierSlugsDict = {
+                "identifier_slugs": slugs,
+                "published_only": int(published_only),
+            }
+            return get_multipart_strings_from_marklogic_response(
+                self._send_to_eval(vars, "resolve_many_from_identifier_slugs.xqy"),
+            )
+
+        resolutions = self._resolve_many("slug", identifier_slugs, published_only, query, use_cache)
+        return {DocumentIdentifierSlug(slug): resolved for slug, resolved in resolutions.items()}
+
+    def resolve_many_values(
+        self,
+        identifier_values: Iterable[DocumentIdentifierValue],
+        published_only: bool = True,
+        use_cache: bool = True,
+    ) -> dict[DocumentIdentifierValue, IdentifierResolutions]:
+        """
+        Resolve many identifier values at once, as `resolve_from_identifier_value` does for one, using as few queries
+        as possible.
+
+        :param use_cache: Answer from the identifier resolution cache if possible, as with
+            `resolve_from_identifier_value`
+
+        :return: The resolutions for each of the given values, which are empty for values which don't resolve
+        """
+
+        def query(values: list[str]) -> list[str]:
+            vars: query_dicts.ResolveManyFromIdentifierValuesDict = {
+                "identifier_values": values,
+                "published_only": int(published_only),
+            }
+            return get_multipart_strings_from_marklogic_response(
+                self._send_to_eval(vars, "resolve_many_from_identifier_values.xqy"),
+            )
+
+        resolutions = self._resolve_many("value", identifier_values, published_only, query, use_cache)
+        return {DocumentIdentifierValue(value): resolved for value, resolved in resolutions.items()}
+
+    def _resolve_many(
+        self,
+        kind: IdentifierResolutionKind,
+        keys: Iterable[str],
+        published_only: bool,
+        query: Callable[[list[str]], list[str]],
+        use_cache: bool,
+    ) -> dict[str, IdentifierResolutions]:
+        """
+        Resolve each key, taking what we can from the identifier resolution cache if `use_cache` is set and querying for
+        the rest in batches of at most `IDENTIFIER_RESOLUTION_BATCH_SIZE`.
+        """
+        resolutions: dict[str, IdentifierResolutions] = {}
+        uncached: list[str] = []
+        for key in dict.fromkeys(keys):
+            cached = (
+                self.identifier_resolution_cache.get(kind, key, published_only)
+                if use_cache and self.identifier_resolution_cache is not None
+                else None
+            )
+            if cached is None:
+                resolutions[key] = IdentifierResolutions()
+                uncached.append(key)
+            else:
+                resolutions[key] = cached
+
+        for batch in batched(uncached, IDENTIFIER_RESOLUTION_BATCH_SIZE):
+            for resolution in IdentifierResolutions.from_marklogic_output(query(list(batch))):
+                key = resolution.identifier_slug if kind == "slug" else resolution.identifier_value
+                if key in resolutions:
+                    resolutions[key].append(resolution)
+
+        if self.identifier_resolution_cache is not None:
+            for key in uncached:
+                self.identifier_resolution_cache.put(kind, key, published_only, resolutions[key])
+
+        return resolutions
+
+    def _invalidate_identifier_resolutions(self, *document_uris: DocumentURIString) -> None:
+        """Remove cached identifier resolutions which may have been changed by a change to these documents."""
+        if self.identifier_resolution_cache is not None:
+            for document_uri in document_uris:
+                self.identifier_resolution_cache.invalidate_document(self._format_uri_for_marklogic(document_uri))
+
+    def _invalidate_identifier_resolutions_for_property(self, document_uri: DocumentURIString, name: str) -> None:
+        if name in IDENTIFIER_RESOLUTION_PROPERTIES:
+            self._invalidate_identifier_resolutions(document_uri)
 
     def get_next_document_sequence_number(self) -> int:
         """Increment the MarkLogic sequence number by one and return the value."""
         return int(self._eval_and_decode({}, "get_next_document_sequence_number.xqy"))
+
+    def reserve_document_sequence_numbers(self, count: int) -> range:
+        """
+        Increment the MarkLogic sequence number by `count` in a single transaction, reserving every number in between
+        for the caller.
+
+        :return: The reserved sequence numbers
+        """
+        if count < 1:
+            raise ValueError(f"Cannot reserve {count} sequence numbers; at least one must be reserved")
+
+        vars: query_dicts.ReserveDocumentSequenceNumbersDict = {"count": count}
+        last_reserved = int(self._eval_and_decode(vars, "reserve_document_sequence_numbers.xqy"))
+        return range(last_reserved - count + 1, last_reserved + 1)
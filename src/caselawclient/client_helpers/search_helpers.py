@@ -1,9 +1,19 @@
+import math
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
+
 from lxml import etree
 
 from caselawclient.Client import MarklogicApiClient
-from caselawclient.responses.search_response import SearchResponse
+from caselawclient.responses.search_response import SearchResponse, StreamingSearchResponse
+from caselawclient.responses.search_result import SearchResult
 from caselawclient.search_parameters import SearchParameters
 
+DEFAULT_SEARCH_PREFETCH = 2
+""" The default number of pages to fetch ahead of the page being iterated over. """
+
 
 def search_judgments_and_parse_response(
     api_client: MarklogicApiClient,
@@ -41,3 +51,108 @@ def search_and_parse_response(
         etree.fromstring(api_client.search_and_decode_response(search_parameters)),
         api_client,
     )
+
+
+def search_and_stream_response(
+    api_client: MarklogicApiClient,
+    search_parameters: SearchParameters,
+) -> StreamingSearchResponse:
+    """
+    Search using the given search parameters, returning a response which parses its results one at a time.
+
+    This suits large page sizes, where holding every result of `search_and_parse_response` in a single tree would use
+    a lot of memory.
+
+    :param api_client: An instance of MarklogicApiClient used to make the search request
+    :param search_parameters: An instance of SearchParameters containing the search parameters
+
+    :return: The search response as a StreamingSearchResponse object
+    """
+    return StreamingSearchResponse(api_client.search_and_decode_response(search_parameters), api_client)
+
+
+def search_facets(
+    api_client: MarklogicApiClient,
+    search_parameters: SearchParameters,
+) -> SearchResponse:
+    """
+    Search using the given search parameters, but only fetch the total and facets, without any results.
+
+    The search is made with a page size of 0, so MarkLogic returns no results or snippets, only the total and facets.
+    This suits filter lists, which need the number of results for each court or year but not the results themselves.
+
+    :param api_client: An instance of MarklogicApiClient used to make the search request
+    :param search_parameters: An instance of SearchParameters. It is not changed; the search is made with a copy.
+
+    :return: The parsed search response, whose `results` will be empty
+    """
+    return search_and_parse_response(api_client, replace(search_parameters, page=1, page_size=0))
+
+
+def _search_page(
+    api_client: MarklogicApiClient,
+    search_parameters: SearchParameters,
+    page: int,
+    hydrate_metadata: bool,
+) -> SearchResponse:
+    response = search_and_parse_response(api_client, replace(search_parameters, page=page))
+    if hydrate_metadata and response.results:
+        SearchResult.prefetch_metadata(api_client, response.results)
+    return response
+
+
+def iter_search(
+    api_client: MarklogicApiClient,
+    search_parameters: SearchParameters,
+    prefetch: int = DEFAULT_SEARCH_PREFETCH,
+    hydrate_metadata: bool = False,
+) -> Iterator[SearchResult]:
+    """
+    Iterate over every result of a search, starting from `search_parameters.page`, fetching each page in turn.
+
+    While the results of one page are being consumed, up to `prefetch` later pages are fetched in the background.
+    Iteration stops at the last page given by the search's `total`, or at the first empty page if the total changes
+    while iterating.
+
+    :param api_client: An instance of MarklogicApiClient used to make the search requests
+    :param search_parameters: An instance of SearchParameters. It is not changed; each page is requested with a copy.
+    :param prefetch: The number of pages to fetch ahead. If 0, each page is only fetched once the previous page has
+        been consumed.
+    :param hydrate_metadata: Fetch the metadata of each page of results in a single query, as part of fetching the page
+
+    :return: An iterator of search results, in the order MarkLogic returns them
+    """
+    first_page = max(1, search_parameters.page)
+    first_response = _search_page(api_client, search_parameters, first_page, hydrate_metadata)
+    last_page = math.ceil(first_response.total / search_parameters.page_size) if search_parameters.page_size else 0
+
+    yield from first_response.results
+    if not first_response.results:
+        return
+
+    pages = iter(range(first_page + 1, last_page + 1))
+    if prefetch < 1:
+        for page in pages:
+            response = _search_page(api_client, search_parameters, page, hydrate_metadata)
+            if not response.results:
+                return
+            yield from response.results
+        return
+
+    executor = ThreadPoolExecutor(max_workers=prefetch)
+    pending: deque[Future[SearchResponse]] = deque()
+    try:
+        while len(pending) < prefetch and (next_page := next(pages, None)) is not None:
+            pending.append(executor.submit(_search_page, api_client, search_parameters, next_page, hydrate_metadata))
+
+        while pending:
+            response = pending.popleft().result()
+            if not response.results:
+                return
+            if (next_page := next(pages, None)) is not None:
+                pending.append(
+                    executor.submit(_search_page, api_client, search_parameters, next_page, hydrate_metadata)
+                )
+            yield from response.results
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
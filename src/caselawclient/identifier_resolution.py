@@ -1,5 +1,11 @@
 import json
-from typing import NamedTuple
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Literal, NamedTuple
 
 from caselawclient.models.identifiers import Identifier
 from caselawclient.models.identifiers.unpacker import IDENTIFIER_NAMESPACE_MAP
@@ -40,7 +46,8 @@ class IdentifierResolution(NamedTuple):
     @staticmethod
     def from_marklogic_output(raw_row: str) -> "IdentifierResolution":
         row = json.loads(raw_row)
-        identifier_namespace = row["documents.compiled_url_slugs.identifier_namespace"]
+        # There are only a handful of namespaces, so share one copy of each between every resolution
+        identifier_namespace = sys.intern(row["documents.compiled_url_slugs.identifier_namespace"])
         return IdentifierResolution(
             identifier_uuid=row["documents.compiled_url_slugs.identifier_uuid"],
             document_uri=MarkLogicDocumentURIString(row["documents.compiled_url_slugs.document_uri"]),
@@ -50,3 +57,163 @@ class IdentifierResolution(NamedTuple):
             identifier_namespace=identifier_namespace,
             identifier_type=IDENTIFIER_NAMESPACE_MAP[identifier_namespace],
         )
+
+
+IdentifierResolutionKind = Literal["slug", "value"]
+""" Whether a resolution was looked up by identifier slug or by identifier value. """
+
+_CacheKey = tuple[IdentifierResolutionKind, str, bool]
+
+
+@dataclass(frozen=True)
+class IdentifierResolutionCacheStats:
+    """A snapshot of how an `IdentifierResolutionCache` has performed."""
+
+    hits: int
+    """ Lookups answered from the cache with at least one resolution. """
+
+    negative_hits: int
+    """ Lookups answered from the cache with a remembered miss. """
+
+    misses: int
+    """ Lookups which were not in the cache, or whose entry had expired. """
+
+    evictions: int
+    """ Entries removed to keep the cache within its maximum size. """
+
+    invalidations: int
+    """ Entries removed because a document they refer to has changed. """
+
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.negative_hits + self.misses
+        return (self.hits + self.negative_hits) / lookups if lookups else 0.0
+
+
+class IdentifierResolutionCache:
+    """
+    A thread-safe, size-limited cache of identifier slugs and values to their resolutions.
+
+    Lookups which found nothing are also cached, but for a shorter time, so that repeated requests for identifiers
+    which don't exist don't each cost a query. Entries are removed when a document they refer to changes; since a
+    change to one document can make any missing identifier resolve, every remembered miss is removed at the same time.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl: float = 300.0,
+        negative_ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param max_entries: The number of entries to keep before evicting the least recently used
+        :param ttl: How long to keep lookups which found at least one resolution, in seconds
+        :param negative_ttl: How long to keep lookups which found nothing, in seconds
+        :param clock: A source of the current time in seconds, which only needs to increase
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[_CacheKey, tuple[float, IdentifierResolutions]] = OrderedDict()
+        self._keys_by_document: dict[MarkLogicDocumentURIString, set[_CacheKey]] = {}
+        self._negative_keys: set[_CacheKey] = set()
+
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(
+        self,
+        kind: IdentifierResolutionKind,
+        key: str,
+        published_only: bool,
+    ) -> IdentifierResolutions | None:
+        """
+        :return: A copy of the cached resolutions, which may be empty if the lookup is known to find nothing, or `None`
+            if the lookup is not cached
+        """
+        cache_key = (kind, key, published_only)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    self._remove(cache_key)
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(cache_key)
+            if entry[1]:
+                self._hits += 1
+            else:
+                self._negative_hits += 1
+            return IdentifierResolutions(entry[1])
+
+    def put(
+        self,
+        kind: IdentifierResolutionKind,
+        key: str,
+        published_only: bool,
+        resolutions: IdentifierResolutions,
+    ) -> None:
+        cache_key = (kind, key, published_only)
+        expires_at = self._clock() + (self.ttl if resolutions else self.negative_ttl)
+        with self._lock:
+            self._remove(cache_key)
+            self._entries[cache_key] = (expires_at, IdentifierResolutions(resolutions))
+            if resolutions:
+                for resolution in resolutions:
+                    self._keys_by_document.setdefault(resolution.document_uri, set()).add(cache_key)
+            else:
+                self._negative_keys.add(cache_key)
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate_document(self, document_uri: MarkLogicDocumentURIString) -> None:
+        """Forget every lookup which resolved to this document, and every lookup which found nothing."""
+        with self._lock:
+            stale_keys = self._keys_by_document.get(document_uri, set()) | self._negative_keys
+            for cache_key in stale_keys:
+                self._remove(cache_key)
+            self._invalidations += len(stale_keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_document.clear()
+            self._negative_keys.clear()
+
+    @property
+    def stats(self) -> IdentifierResolutionCacheStats:
+        with self._lock:
+            return IdentifierResolutionCacheStats(
+                hits=self._hits,
+                negative_hits=self._negative_hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+            )
+
+    def _remove(self, cache_key: _CacheKey) -> None:
+        """Remove an entry and its index references. The lock must already be held."""
+        entry = self._entries.pop(cache_key, None)
+        if entry is None:
+            return
+
+        self._negative_keys.discard(cache_key)
+        for resolution in entry[1]:
+            keys = self._keys_by_document.get(resolution.document_uri)
+            if keys is not None:
+                keys.discard(cache_key)
+                if not keys:
+                    del self._keys_by_document[resolution.document_uri]
@@ -0,0 +1,169 @@
+"""
+Assign a Find Case Law identifier to every published document which doesn't have one.
+
+`Document.assign_fclid_if_missing()` loads a full document and increments the MarkLogic sequence for each identifier
+it mints. The backfill here instead pages through the documents which are missing an FCLID, fetches only their
+identifiers in batches, mints FCLIDs from blocks of reserved sequence numbers, and writes the new identifiers back to
+MarkLogic in batches.
+"""
+
+import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import batched
+from typing import TYPE_CHECKING
+
+from caselawclient.errors import MarklogicAPIError
+from caselawclient.models.identifiers.fclid import DEFAULT_SEQUENCE_BLOCK_SIZE, FCLIDAllocator, FindCaseLawIdentifier
+from caselawclient.models.identifiers.unpacker import unpack_all_identifiers_from_etree
+from caselawclient.types import DocumentURIString, PropertyWrite
+from caselawclient.xquery_type_dicts import MarkLogicDocumentURIString
+
+if TYPE_CHECKING:
+    from caselawclient.Client import MarklogicApiClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 500
+""" The number of documents missing an FCLID to list at a time. """
+
+IDENTIFIER_BATCH_SIZE = 50
+""" The number of documents whose identifiers are fetched and written in a single request. """
+
+DEFAULT_CONCURRENCY = 4
+""" The default number of batches to work on at once. """
+
+
+@dataclass
+class FCLIDBackfillProgress:
+    """The progress of an FCLID backfill."""
+
+    dry_run: bool = False
+    """ If true, FCLIDs are not minted or saved, and `assigned_uris` lists the documents which would be assigned one. """
+
+    after_uri: DocumentURIString | None = None
+    """ The last URI in the most recently completed page. """
+
+    assigned_uris: list[DocumentURIString] = field(default_factory=list)
+
+    failed_uris: list[DocumentURIString] = field(default_factory=list)
+    """ Documents which could not be assigned an FCLID. """
+
+    @property
+    def assigned_count(self) -> int:
+        return len(self.assigned_uris)
+
+
+def _assign_batch(
+    api_client: "MarklogicApiClient",
+    allocator: FCLIDAllocator,
+    uris: tuple[DocumentURIString, ...],
+    dry_run: bool,
+) -> tuple[list[DocumentURIString], list[DocumentURIString]]:
+    """
+    Mint and save an FCLID for each document in a batch which doesn't already have one.
+
+    New FCLIDs come from a reserved block of the document sequence, so they are unique without needing to be checked
+    against MarkLogic.
+
+    :return: The URIs which were assigned an FCLID, and the URIs which failed
+    """
+    try:
+        identifiers_by_uri = api_client.get_property_as_node_for_documents(list(uris), "identifiers")
+    except MarklogicAPIError as e:
+        logger.warning("Unable to fetch identifiers for a batch of %s documents: %s", len(uris), e)
+        return [], list(uris)
+
+    writes: list[PropertyWrite] = []
+    assigned: list[DocumentURIString] = []
+    failed: list[DocumentURIString] = []
+    for uri in uris:
+        if uri not in identifiers_by_uri:
+            failed.append(uri)
+            continue
+
+        try:
+            identifiers = unpack_all_identifiers_from_etree(identifiers_by_uri[uri])
+            if identifiers.of_type(FindCaseLawIdentifier):
+                # An FCLID was assigned since this page was listed
+                continue
+            if not dry_run:
+                identifiers.add(allocator.mint())
+                writes.append(PropertyWrite(uri, "identifiers", identifiers.as_etree))
+        except Exception as e:  # noqa: BLE001 - a failure for one document should not stop the others
+            logger.warning("Unable to assign an FCLID to %s: %s", uri, e)
+            failed.append(uri)
+        else:
+            assigned.append(uri)
+
+    if writes:
+        try:
+            api_client.set_properties(writes)
+        except MarklogicAPIError as e:
+            logger.warning("Unable to write identifiers for a batch of %s documents: %s", len(writes), e)
+            failed += assigned
+            assigned = []
+
+    return assigned, failed
+
+
+def backfill_fclids(
+    api_client: "MarklogicApiClient",
+    page_size: int = DEFAULT_PAGE_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    block_size: int = DEFAULT_SEQUENCE_BLOCK_SIZE,
+    dry_run: bool = False,
+    maximum_documents: int | None = None,
+    on_progress: Callable[[FCLIDBackfillProgress], None] | None = None,
+) -> FCLIDBackfillProgress:
+    """
+    Assign an FCLID to every published document which doesn't have one.
+
+    :param page_size: The number of documents missing an FCLID to list at a time
+    :param concurrency: The number of batches of documents to fetch, assign and write at once
+    :param block_size: The number of sequence numbers to reserve from MarkLogic at a time
+    :param dry_run: List the documents which would be assigned an FCLID, without minting or saving anything
+    :param maximum_documents: Stop once at least this many documents have been attempted
+    :param on_progress: Called with the progress so far after each page
+
+    :return: The progress made, including any documents which failed
+    """
+    progress = FCLIDBackfillProgress(dry_run=dry_run)
+    allocator = FCLIDAllocator(api_client, block_size=block_size)
+    attempted = 0
+
+    logger.info("Start FCLID backfill%s", " (dry run)" if dry_run else "")
+    while maximum_documents is None or attempted < maximum_documents:
+        uris = [
+            MarkLogicDocumentURIString(uri).as_document_uri()
+            for uri in api_client.get_missing_fclid(maximum_records=page_size, after_uri=progress.after_uri)
+        ]
+        if not uris:
+            break
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(
+                executor.map(
+                    lambda batch: _assign_batch(api_client, allocator, batch, dry_run),
+                    batched(uris, IDENTIFIER_BATCH_SIZE),
+                )
+            )
+
+        for assigned, failed in results:
+            progress.assigned_uris += assigned
+            progress.failed_uris += failed
+        progress.after_uri = uris[-1]
+        attempted += len(uris)
+
+        logger.info(
+            "%s %s documents so far, %s failed, up to %s",
+            "Would assign FCLIDs to" if dry_run else "Assigned FCLIDs to",
+            progress.assigned_count,
+            len(progress.failed_uris),
+            progress.after_uri,
+        )
+        if on_progress:
+            on_progress(progress)
+
+    return progress
@@ -0,0 +1,192 @@
+"""
+Bring the metadata claims of every document up to date with `CURRENT_METADATA_MATERIALISATION_VERSION`.
+
+`Document.materialise_metadata_claims()` needs a fully loaded document. The backfill here instead pages through the
+documents which are behind, fetches only the metadata and header of each in batches, materialises their claims locally,
+and writes the results back to MarkLogic in batches. Progress can be saved to a checkpoint file so that an interrupted
+backfill picks up where it left off.
+"""
+
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from itertools import batched
+from typing import TYPE_CHECKING, Self
+
+from caselawclient.errors import MarklogicAPIError
+from caselawclient.models.documents.body import DocumentBody
+from caselawclient.models.documents.metadata.fields.exceptions import MetadataFieldValidationException
+from caselawclient.models.documents.metadata.fields.unpacker import unpack_all_metadata_fields_from_etree
+from caselawclient.models.documents.metadata.materialisation import (
+    CURRENT_METADATA_MATERIALISATION_VERSION,
+    LATEST_METADATA_MATERIALISATION_VERSION_PROPERTY,
+    METADATA_FIELD_CLASSES,
+)
+from caselawclient.types import DocumentSkeleton, DocumentURIString, PropertyWrite
+
+if TYPE_CHECKING:
+    from caselawclient.Client import MarklogicApiClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 500
+""" The number of pending documents to list at a time. Progress is checkpointed after each page. """
+
+SKELETON_BATCH_SIZE = 50
+""" The number of documents to fetch, materialise and write in a single batch. """
+
+DEFAULT_CONCURRENCY = 4
+""" The default number of batches to work on at once. """
+
+
+@dataclass
+class MaterialisationCheckpoint:
+    """The progress of a metadata materialisation backfill."""
+
+    after_uri: DocumentURIString | None = None
+    """ The last URI in the most recently completed page; the backfill resumes after it. """
+
+    materialised_count: int = 0
+
+    failed_uris: list[DocumentURIString] = field(default_factory=list)
+    """ Documents which could not be materialised, and which will not be retried when resuming. """
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> Self:
+        """Load a checkpoint from a file, or start from the beginning if the file does not exist."""
+        try:
+            with open(path) as f:
+                return cls(**json.load(f))
+        except FileNotFoundError:
+            return cls()
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write this checkpoint to a file, replacing any previous checkpoint in a single step."""
+        temporary_path = f"{os.fspath(path)}.tmp"
+        with open(temporary_path, "w") as f:
+            json.dump(asdict(self), f)
+        os.replace(temporary_path, path)
+
+
+class _SkeletonDocument:
+    """Just enough of a `Document` to materialise its metadata claims."""
+
+    def __init__(self, skeleton: DocumentSkeleton):
+        self.uri = skeleton.uri
+        self.body = DocumentBody(skeleton.xml)
+        self.metadata_fields = unpack_all_metadata_fields_from_etree(skeleton.metadata_fields)
+
+
+def _materialise(skeleton: DocumentSkeleton) -> list[PropertyWrite]:
+    """
+    Materialise the metadata claims for a document, returning the property writes needed to store them.
+
+    :raises MetadataFieldValidationException: The document's metadata fields are not valid, so cannot be saved
+    """
+    document = _SkeletonDocument(skeleton)
+    for metadata_class in METADATA_FIELD_CLASSES:
+        metadata_class(document).materialise_body_claims()
+
+    validations = document.metadata_fields.validate_ids_match_keys()
+    if not validations.success:
+        raise MetadataFieldValidationException(
+            "Unable to save metadata fields; validation constraints not met: " + ", ".join(validations.messages)
+        )
+
+    return [
+        PropertyWrite(skeleton.uri, "metadata_fields", document.metadata_fields.as_etree),
+        PropertyWrite(
+            skeleton.uri, LATEST_METADATA_MATERIALISATION_VERSION_PROPERTY, CURRENT_METADATA_MATERIALISATION_VERSION
+        ),
+    ]
+
+
+def _materialise_batch(
+    api_client: "MarklogicApiClient",
+    uris: tuple[DocumentURIString, ...],
+) -> tuple[list[DocumentURIString], list[DocumentURIString]]:
+    """
+    Fetch, materialise and store the metadata claims for a batch of documents.
+
+    :return: The URIs which were materialised, and the URIs which failed
+    """
+    try:
+        skeletons = api_client.get_document_skeletons(list(uris))
+    except MarklogicAPIError as e:
+        logger.warning("Unable to fetch a batch of %s documents: %s", len(uris), e)
+        return [], list(uris)
+
+    writes: list[PropertyWrite] = []
+    materialised: list[DocumentURIString] = []
+    for skeleton in skeletons:
+        try:
+            writes += _materialise(skeleton)
+        except Exception as e:  # noqa: BLE001 - a failure for one document should not stop the others
+            logger.warning("Unable to materialise metadata claims for %s: %s", skeleton.uri, e)
+        else:
+            materialised.append(skeleton.uri)
+
+    if writes:
+        try:
+            api_client.set_properties(writes)
+        except MarklogicAPIError as e:
+            logger.warning("Unable to write metadata claims for a batch of %s documents: %s", len(materialised), e)
+            materialised = []
+
+    materialised_uris = set(materialised)
+    return materialised, [uri for uri in uris if uri not in materialised_uris]
+
+
+def backfill_metadata_materialisation(
+    api_client: "MarklogicApiClient",
+    checkpoint_path: str | os.PathLike[str] | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    maximum_documents: int | None = None,
+) -> MaterialisationCheckpoint:
+    """
+    Materialise the metadata claims of every document which is behind `CURRENT_METADATA_MATERIALISATION_VERSION`.
+
+    :param checkpoint_path: A file to save progress to after each page, and to resume from if it already exists
+    :param page_size: The number of pending documents to list at a time
+    :param concurrency: The number of batches of documents to fetch, materialise and write at once
+    :param maximum_documents: Stop once at least this many documents have been attempted in this run
+
+    :return: The progress made, including any documents which failed
+    """
+    checkpoint = MaterialisationCheckpoint.load(checkpoint_path) if checkpoint_path else MaterialisationCheckpoint()
+    attempted = 0
+
+    logger.info("Start metadata materialisation backfill after %s", checkpoint.after_uri or "the first document")
+    while maximum_documents is None or attempted < maximum_documents:
+        uris = api_client.get_pending_metadata_materialisation(
+            CURRENT_METADATA_MATERIALISATION_VERSION,
+            after_uri=checkpoint.after_uri,
+            maximum_records=page_size,
+        )
+        if not uris:
+            break
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(
+                executor.map(lambda batch: _materialise_batch(api_client, batch), batched(uris, SKELETON_BATCH_SIZE))
+            )
+
+        for materialised, failed in results:
+            checkpoint.materialised_count += len(materialised)
+            checkpoint.failed_uris += failed
+        checkpoint.after_uri = uris[-1]
+        attempted += len(uris)
+
+        if checkpoint_path:
+            checkpoint.save(checkpoint_path)
+        logger.info(
+            "Materialised metadata claims for %s documents so far, %s failed, up to %s",
+            checkpoint.materialised_count,
+            len(checkpoint.failed_uris),
+            checkpoint.after_uri,
+        )
+
+    return checkpoint
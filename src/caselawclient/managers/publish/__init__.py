@@ -0,0 +1,251 @@
+"""
+Publish and unpublish many documents at once.
+
+`Document.publish()` and `Document.unpublish()` work through each step for one document at a time. The functions here
+perform the same steps for many documents: documents are loaded and their assets copied concurrently, properties are
+written to MarkLogic in batches, and announcements are sent to SNS in batches.
+"""
+
+import datetime
+import logging
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from itertools import batched
+from typing import TYPE_CHECKING
+
+from caselawclient.errors import MarklogicAPIError
+from caselawclient.models.utilities.aws import announce_document_event, publish_documents, unpublish_documents
+from caselawclient.models.utilities.sns import SNSBatchPublisher, SNSBatchPublishError
+from caselawclient.types import DocumentURIString, PropertyWrite
+
+if TYPE_CHECKING:
+    from caselawclient.Client import MarklogicApiClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 8
+""" The default number of documents to work on at once. This should not exceed the client's HTTP connection pool. """
+
+PROPERTY_WRITE_BATCH_SIZE = 100
+""" The number of documents whose properties are written to MarkLogic in a single request. """
+
+
+@dataclass
+class BulkOperationResult:
+    """The outcome of publishing or unpublishing a single document as part of a bulk operation."""
+
+    uri: DocumentURIString
+
+    error: Exception | None = None
+    """ The exception which stopped this document being processed, if any. """
+
+    enrichment_requested: bool = False
+    """ Whether enrichment was requested for this document after it was published. """
+
+    timings: dict[str, float] = field(default_factory=dict)
+    """
+    The time spent in each stage, in seconds. Stages which are batched across documents (`properties` and `announce`)
+    record the time taken by the whole batch.
+    """
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+    @property
+    def duration(self) -> float:
+        return sum(self.timings.values())
+
+
+@contextmanager
+def _timed(result: BulkOperationResult, stage: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        result.timings[stage] = result.timings.get(stage, 0.0) + time.perf_counter() - start
+
+
+def _prepare_publication(
+    api_client: "MarklogicApiClient",
+    result: BulkOperationResult,
+    now: datetime.datetime,
+) -> list[PropertyWrite]:
+    """Validate a document and copy its assets, returning the property writes needed to mark it as published."""
+    with _timed(result, "load"):
+        document = api_client.get_document_by_uri(result.uri)
+
+    with _timed(result, "validate"):
+        document.assert_is_publishable()
+        document.assign_fclid_if_missing()
+
+    with _timed(result, "assets"):
+        publish_documents(result.uri)
+
+    writes = [PropertyWrite(result.uri, "published", True)]
+    if not document.first_published_datetime:
+        writes.append(PropertyWrite(result.uri, "first_published_datetime", now))
+    writes.append(PropertyWrite(result.uri, "latest_published_datetime", now))
+
+    # This mirrors `Document.enrich(accept_failures=True)`, which records the attempt even if enrichment isn't possible
+    if not document.enriched_recently:
+        writes.append(PropertyWrite(result.uri, "last_sent_to_enrichment", now.isoformat()))
+        result.enrichment_requested = document.can_enrich
+
+    return writes
+
+
+def _prepare_unpublication(api_client: "MarklogicApiClient", result: BulkOperationResult) -> list[PropertyWrite]:
+    """Release a document's checkout and remove its public assets, returning the property writes to unpublish it."""
+    with _timed(result, "checkout"):
+        api_client.break_checkout(result.uri)
+
+    with _timed(result, "assets"):
+        unpublish_documents(result.uri)
+
+    return [PropertyWrite(result.uri, "published", False)]
+
+
+def _prepare_concurrently(
+    results: list[BulkOperationResult],
+    prepare: Callable[[BulkOperationResult], list[PropertyWrite]],
+    concurrency: int,
+) -> list[tuple[BulkOperationResult, list[PropertyWrite]]]:
+    """Run `prepare` for each document in a thread pool, recording any failure against that document's result."""
+
+    def prepare_safely(result: BulkOperationResult) -> list[PropertyWrite]:
+        try:
+            return prepare(result)
+        except Exception as e:  # noqa: BLE001 - a failure for one document should not stop the others
+            logger.warning("Unable to prepare %s: %s", result.uri, e)
+            result.error = e
+            return []
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        prepared = list(zip(results, executor.map(prepare_safely, results), strict=True))
+
+    return [(result, writes) for result, writes in prepared if result.success]
+
+
+def _write_properties(
+    api_client: "MarklogicApiClient",
+    prepared: list[tuple[BulkOperationResult, list[PropertyWrite]]],
+) -> list[BulkOperationResult]:
+    """Write the properties for each document in batches, returning the results for documents which succeeded."""
+    written: list[BulkOperationResult] = []
+
+    for batch in batched(prepared, PROPERTY_WRITE_BATCH_SIZE):
+        start = time.perf_counter()
+        try:
+            api_client.set_properties([write for _, writes in batch for write in writes])
+        except MarklogicAPIError as e:
+            logger.warning("Unable to write properties for a batch of %s documents: %s", len(batch), e)
+            for result, _ in batch:
+                result.error = e
+        else:
+            written += [result for result, _ in batch]
+
+        elapsed = time.perf_counter() - start
+        for result, _ in batch:
+            result.timings["properties"] = elapsed
+
+    return written
+
+
+def _announce(
+    results: list[BulkOperationResult],
+    status: str,
+    publisher: SNSBatchPublisher | None,
+) -> None:
+    """Announce a change to each document, and request enrichment where needed, as a batch."""
+    own_publisher = publisher is None
+    batch_publisher = publisher or SNSBatchPublisher(flush_at_exit=False)
+    previously_failed_count = len(batch_publisher.failed_messages)
+
+    start = time.perf_counter()
+    for result in results:
+        announce_document_event(uri=result.uri, status=status, publisher=batch_publisher)
+        if result.enrichment_requested:
+            announce_document_event(uri=result.uri, status="enrich", enrich=True, publisher=batch_publisher)
+
+    try:
+        if own_publisher:
+            batch_publisher.close()
+        else:
+            batch_publisher.flush()
+    except SNSBatchPublishError:
+        # Messages which failed when a full batch was sent during queueing are not included in the exception, but every
+        # failure is recorded on the publisher, so use that instead.
+        pass
+
+    failed_messages = batch_publisher.failed_messages[previously_failed_count:]
+    for result in results:
+        failed_for_document = [
+            message
+            for message in failed_messages
+            if message.message_attributes["uri_reference"].get("StringValue") == result.uri
+        ]
+        if failed_for_document:
+            result.error = SNSBatchPublishError(f"Unable to announce {result.uri}", failed_for_document)
+
+    elapsed = time.perf_counter() - start
+    for result in results:
+        result.timings["announce"] = elapsed
+
+
+def publish_many(
+    api_client: "MarklogicApiClient",
+    uris: list[DocumentURIString],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    publisher: SNSBatchPublisher | None = None,
+) -> list[BulkOperationResult]:
+    """
+    Publish many documents, performing the same steps as `Document.publish()` for each.
+
+    A document which fails validation or any other step is not published, and the failure is recorded in its result;
+    the other documents are unaffected. If a document's announcement cannot be sent its properties will already have
+    been set, so it will be published but its result will still record the failure.
+
+    :param concurrency: The number of documents to load, validate and copy assets for at once
+    :param publisher: An SNS publisher to queue announcements on. If not given, a new publisher is used and closed.
+
+    :return: A result for each of the given URIs, in the same order
+    """
+    results = [BulkOperationResult(uri) for uri in uris]
+    now = datetime.datetime.now(datetime.UTC)
+
+    logger.info("Start bulk publication of %s documents", len(results))
+    prepared = _prepare_concurrently(results, lambda result: _prepare_publication(api_client, result, now), concurrency)
+    published = _write_properties(api_client, prepared)
+    _announce(published, "publish", publisher)
+    logger.info("Bulk publication complete: %s of %s succeeded", sum(r.success for r in results), len(results))
+
+    return results
+
+
+def unpublish_many(
+    api_client: "MarklogicApiClient",
+    uris: list[DocumentURIString],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    publisher: SNSBatchPublisher | None = None,
+) -> list[BulkOperationResult]:
+    """
+    Unpublish many documents, performing the same steps as `Document.unpublish()` for each.
+
+    :param concurrency: The number of documents to release checkouts and remove assets for at once
+    :param publisher: An SNS publisher to queue announcements on. If not given, a new publisher is used and closed.
+
+    :return: A result for each of the given URIs, in the same order
+    """
+    results = [BulkOperationResult(uri) for uri in uris]
+
+    logger.info("Start bulk unpublication of %s documents", len(results))
+    prepared = _prepare_concurrently(results, lambda result: _prepare_unpublication(api_client, result), concurrency)
+    unpublished = _write_properties(api_client, prepared)
+    _announce(unpublished, "unpublish", publisher)
+    logger.info("Bulk unpublication complete: %s of %s succeeded", sum(r.success for r in results), len(results))
+
+    return results
@@ -2,14 +2,15 @@ import datetime
 import logging
 import os
 import warnings
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, ClassVar, Optional
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from ds_caselaw_utils import courts
-from ds_caselaw_utils.courts import CourtNotFoundException
-from ds_caselaw_utils.types import CourtCode, NeutralCitationString
+from ds_caselaw_utils.types import NeutralCitationString
+from lxml import etree
 from pydantic import TypeAdapter
-from requests_toolbelt.multipart import decoder
 
 from caselawclient.errors import (
     DocumentNotFoundError,
@@ -37,12 +38,18 @@ from caselawclient.models.documents.metadata.types.date import DateMetadata
 from caselawclient.models.documents.metadata.types.judges import JudgesMetadata
 from caselawclient.models.documents.metadata.types.jurisdiction import JurisdictionMetadata
 from caselawclient.models.documents.metadata.types.name import NameMetadata
-from caselawclient.models.documents.versions import AnnotationDataDict, VersionAnnotation, VersionType
+from caselawclient.models.documents.versions import (
+    AnnotationDataDict,
+    DocumentVersion,
+    VersionAnnotation,
+    VersionDetailsDict,
+    VersionType,
+)
 from caselawclient.models.identifiers import Identifier
 from caselawclient.models.identifiers.exceptions import IdentifierValidationException
 from caselawclient.models.identifiers.fclid import FindCaseLawIdentifier, FindCaseLawIdentifierSchema
 from caselawclient.models.identifiers.unpacker import unpack_all_identifiers_from_etree
-from caselawclient.models.utilities import VersionsDict, extract_version, render_versions
+from caselawclient.models.utilities import extract_version
 from caselawclient.models.utilities.aws import (
     ParserInstructionsDict,
     announce_document_event,
@@ -56,7 +63,10 @@ from caselawclient.models.utilities.aws import (
     restore_assets_from_consignment_archive,
     unpublish_documents,
 )
-from caselawclient.types import DocumentURIString, SuccessFailureMessageTuple, TDRMetadataDict
+from caselawclient.models.utilities.courts import find_court
+from caselawclient.models.utilities.dates import require_aware_utc
+from caselawclient.types import DocumentURIString, PropertyWrite, SuccessFailureMessageTuple, TDRMetadataDict
+from caselawclient.xml_helpers import Element
 
 from .body import DocumentBody
 from .exceptions import (
@@ -73,6 +83,18 @@ logger = logging.getLogger(__name__)
 MINIMUM_ENRICHMENT_TIME = datetime.timedelta(minutes=20)
 
 
+def _normalise_property_value(value: str | bool | datetime.datetime | Element) -> str | bytes:
+    """Convert a property value to the form it is stored in, so that values can be compared."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime.datetime):
+        return require_aware_utc(value).isoformat()
+    if isinstance(value, str):
+        return value
+    # Node properties store the contents of the given root node, not the root node itself
+    return b"".join(etree.tostring(child, method="c14n") for child in value)
+
+
 class GatewayTimeoutGettingHTMLWithQuery(RuntimeWarning):
     pass
 
@@ -167,6 +189,17 @@ class Document:
         """
         self.uri: DocumentURIString = uri
         self.api_client: MarklogicApiClient = api_client
+        self._pending_property_writes: list[PropertyWrite] | None = None
+
+        self._stored_property_values: dict[str, str | bytes] = {}
+        """ Property values known to be stored in MarkLogic, as loaded or last written, in normalised form. """
+
+        self._loaded_body_hash: str | None = None
+        """ The canonical hash of the body as it was loaded or last saved. """
+
+        self.skipped_writes: Counter[str] = Counter()
+        """ The number of writes skipped because they would not have changed anything, by property name or `body`. """
+
         if not self.document_exists():
             raise DocumentNotFoundError(f"Document {self.uri} does not exist")
 
@@ -207,17 +240,19 @@ class Document:
                 search_query=search_query,
             ),
         )
+        # Only the hash is kept, as keeping the fetched bytes until a save would hold a second copy of every body
+        self._loaded_body_hash = self.body.canonical_hash
 
     def _initialise_identifiers(self) -> None:
         """Load this document's identifiers from MarkLogic."""
 
-        identifiers_element_as_etree = self.api_client.get_property_as_node(self.uri, "identifiers")
+        identifiers_element_as_etree = self._get_property_as_node("identifiers")
         self.identifiers = unpack_all_identifiers_from_etree(identifiers_element_as_etree)
 
     def _initialise_metadata_fields(self) -> None:
         """Load this document's metadata_fields property from MarkLogic."""
 
-        metadata_fields_element = self.api_client.get_property_as_node(self.uri, "metadata_fields")
+        metadata_fields_element = self._get_property_as_node("metadata_fields")
         self.metadata_fields = unpack_all_metadata_fields_from_etree(metadata_fields_element)
 
     def _initialise_metadata(self) -> None:
@@ -262,11 +297,15 @@ class Document:
 
     @cached_property
     def is_published(self) -> bool:
-        return self.api_client.get_published(self.uri)
+        is_published = self.api_client.get_published(self.uri)
+        # A missing property is also unpublished, so we only know the stored value if it is published
+        if is_published is True:
+            self._remember_stored_property("published", True)
+        return is_published
 
     @cached_property
     def is_held(self) -> bool:
-        return self.api_client.get_property(self.uri, "editor-hold") == "true"
+        return self._get_property("editor-hold") == "true"
 
     @cached_property
     def is_locked(self) -> bool:
@@ -278,15 +317,15 @@ class Document:
 
     @cached_property
     def source_name(self) -> str:
-        return self.api_client.get_property(self.uri, "source-name")
+        return self._get_property("source-name")
 
     @cached_property
     def source_email(self) -> str:
-        return self.api_client.get_property(self.uri, "source-email")
+        return self._get_property("source-email")
 
     @cached_property
     def consignment_reference(self) -> str:
-        return self.api_client.get_property(self.uri, "transfer-consignment-reference")
+        return self._get_property("transfer-consignment-reference")
 
     @property
     def docx_url(self) -> str:
@@ -300,17 +339,12 @@ class Document:
 
     @cached_property
     def assigned_to(self) -> str:
-        return self.api_client.get_property(self.uri, "assigned-to")
+        return self._get_property("assigned-to")
 
     @cached_property
-    def versions(self) -> list[VersionsDict]:
-        versions_response = self.api_client.list_judgment_versions(self.uri)
-
-        try:
-            decoded_versions = decoder.MultipartDecoder.from_response(versions_response)
-            return render_versions(decoded_versions.parts)
-        except AttributeError:
-            return []
+    def versions(self) -> list[VersionDetailsDict]:
+        """The versions of this document, most recent first, with the creation time and annotation of each."""
+        return self.api_client.list_versions_detailed(self.uri)
 
     @cached_property
     def versions_as_documents(self) -> list["Document"]:
@@ -319,18 +353,41 @@ class Document:
            * the most recent
            * the highest numbered
 
+        Every version is loaded from MarkLogic. Where only the version numbers, creation times or annotations are
+        needed, use `version_references` instead.
+
         Note that this is only valid on the managed document -- a `DLS-DOCUMENTVERSION` error will occur if the document
         this is called on is itself a version.
         """
+        return [version.document for version in self.version_references]
+
+    @cached_property
+    def version_references(self) -> list[DocumentVersion]:
+        """
+        Returns a list of `DocumentVersion`s for the versions of the document, most recent first. Each knows its number,
+        URI, creation time and annotation, and is only loaded from MarkLogic if its `document` is used.
+
+        Note that this is only valid on the managed document, as with `versions_as_documents`.
+        """
         if self.is_version:
             raise NotSupportedOnVersion(
                 f"Cannot get versions of a version for {self.uri}",
             )
-        docs = []
-        for version in self.versions:
-            doc_uri = DocumentURIString(version["uri"])
-            docs.append(self.api_client.get_document_by_uri(doc_uri))
-        return docs
+        return [
+            DocumentVersion(
+                self.api_client,
+                DocumentURIString(version["uri"]),
+                version["version"],
+                created=version.get("created"),
+                annotation=version.get("annotation"),
+            )
+            for version in self.versions
+        ]
+
+    @cached_property
+    def versions_by_number(self) -> dict[int, DocumentVersion]:
+        """The versions of the document, keyed by version number."""
+        return {version.version_number: version for version in self.version_references}
 
     @cached_property
     def version_number(self) -> int:
@@ -373,11 +430,7 @@ class Document:
     def has_valid_court(self) -> bool:
         court = self.metadata["court"].value
         jurisdiction = self.metadata["jurisdiction"].value
-        court_code = CourtCode(f"{court}/{jurisdiction}") if jurisdiction != "" else CourtCode(court)
-        try:
-            return bool(courts.get_by_code(court_code))
-        except CourtNotFoundException:
-            return False
+        return find_court(court, jurisdiction) is not None
 
     @cached_property
     def is_publishable(self) -> bool:
@@ -431,7 +484,7 @@ class Document:
 
         :return: The datetime value in the database for "first published".
         """
-        return self.api_client.get_datetime_property(self.uri, "first_published_datetime")
+        return self._get_datetime_property("first_published_datetime")
 
     @cached_property
     def first_published_datetime_display(self) -> datetime.datetime | None:
@@ -455,7 +508,7 @@ class Document:
 
         :return: The datetime value in the database for "latest published".
         """
-        return self.api_client.get_datetime_property(self.uri, "latest_published_datetime")
+        return self._get_datetime_property("latest_published_datetime")
 
     @cached_property
     def has_ever_been_published(self) -> bool:
@@ -514,16 +567,102 @@ class Document:
 
         return DOCUMENT_STATUS_NEW
 
+    @contextmanager
+    def changes(self) -> Iterator[None]:
+        """
+        Group changes to this document's properties into a single write.
+
+        Within the block, property changes are recorded rather than sent to MarkLogic straight away. When the block
+        exits they are all written in one request, and so in one transaction. If the block raises an exception, the
+        recorded changes are discarded. A block opened inside another joins the outer block.
+
+        ``` python
+        with document.changes():
+            document.hold()
+            document.save_identifiers()
+        ```
+        """
+        if self._pending_property_writes is not None:
+            yield
+            return
+
+        self._pending_property_writes = []
+        try:
+            yield
+            writes = self._pending_property_writes
+        finally:
+            self._pending_property_writes = None
+
+        self.api_client.set_properties(writes)
+        for write in writes:
+            self._remember_stored_property(write.name, write.value)
+
+    def _remember_stored_property(self, name: str, value: str | bool | datetime.datetime | Element) -> None:
+        self._stored_property_values[name] = _normalise_property_value(value)
+
+    def _get_property(self, name: str) -> str:
+        value = self.api_client.get_property(self.uri, name)
+        if isinstance(value, str):
+            self._remember_stored_property(name, value)
+        return value
+
+    def _get_property_as_node(self, name: str) -> Element | None:
+        value = self.api_client.get_property_as_node(self.uri, name)
+        if value is not None:
+            self._remember_stored_property(name, value)
+        return value
+
+    def _get_datetime_property(self, name: str) -> datetime.datetime | None:
+        value = self.api_client.get_datetime_property(self.uri, name)
+        if isinstance(value, datetime.datetime):
+            self._remember_stored_property(name, value)
+        return value
+
+    def _write_property(
+        self,
+        name: str,
+        value: str | bool | datetime.datetime | Element,
+        write: Callable[[], object],
+    ) -> None:
+        """
+        Set a property on this document by calling `write`, unless it already has this value. Within a `changes()`
+        block, the write is recorded to be made when the block exits instead.
+        """
+        current_value = self._stored_property_values.get(name)
+        for pending_write in self._pending_property_writes or []:
+            if pending_write.name == name:
+                current_value = _normalise_property_value(pending_write.value)
+
+        if current_value == _normalise_property_value(value):
+            logger.debug("Not writing property %s of %s, as its value is unchanged", name, self.uri)
+            self.skipped_writes[name] += 1
+            return
+
+        if self._pending_property_writes is not None:
+            self._pending_property_writes.append(PropertyWrite(self.uri, name, value))
+            return
+
+        write()
+        self._remember_stored_property(name, value)
+
+    def _set_property(self, name: str, value: str) -> None:
+        self._write_property(name, value, lambda: self.api_client.set_property(self.uri, name, value))
+
+    def _set_property_as_node(self, name: str, value: Element) -> None:
+        self._write_property(name, value, lambda: self.api_client.set_property_as_node(self.uri, name, value))
+
+    def _set_boolean_property(self, name: str, value: bool) -> None:
+        self._write_property(name, value, lambda: self.api_client.set_boolean_property(self.uri, name, value))
+
+    def _set_datetime_property(self, name: str, value: datetime.datetime) -> None:
+        self._write_property(name, value, lambda: self.api_client.set_datetime_property(self.uri, name, value))
+
     def force_enrich(self) -> None:
         """
         Request enrichment of the document, but do no checks
         """
         now = datetime.datetime.now(datetime.timezone.utc)
-        self.api_client.set_property(
-            self.uri,
-            "last_sent_to_enrichment",
-            now.isoformat(),
-        )
+        self._set_property("last_sent_to_enrichment", now.isoformat())
 
         if not self.can_enrich:
             msg = f"{self.uri} cannot be enriched"
@@ -595,24 +734,33 @@ class Document:
         """
         Save the document's XML representation back to MarkLogic as a new version.
 
-        Creates a new version with type EDIT, recording the changes made to the document.
+        Creates a new version with type EDIT, recording the changes made to the document. If the body is unchanged
+        since it was loaded, no new version is created.
         Also materialises body-derived DOCUMENT metadata claims and persists them.
 
         :param message: Human-readable message describing the changes made.
         """
-        # Create annotation for this version
-        annotation = VersionAnnotation(
-            version_type=VersionType.EDIT,
-            automated=False,
-            message=message,
-        )
+        body_hash = self.body.canonical_hash
+        if body_hash == self._loaded_body_hash:
+            # Saving an unchanged body would only create an empty version
+            logger.info("Not saving body of %s, as it is unchanged", self.uri)
+            self.skipped_writes["body"] += 1
+        else:
+            # Create annotation for this version
+            annotation = VersionAnnotation(
+                version_type=VersionType.EDIT,
+                automated=False,
+                message=message,
+            )
+
+            # Update the document XML in MarkLogic
+            self.api_client.update_document_xml(
+                self.uri,
+                self.body.content_as_xml_tree,
+                annotation,
+            )
+            self._loaded_body_hash = body_hash
 
-        # Update the document XML in MarkLogic
-        self.api_client.update_document_xml(
-            self.uri,
-            self.body.content_as_xml_tree,
-            annotation,
-        )
         self.materialise_metadata_claims()
 
     @property
@@ -629,12 +777,11 @@ class Document:
         """
         for field in self.metadata.values():
             field.materialise_body_claims()
-        self.save_metadata_fields()
-        self.api_client.set_property(
-            self.uri,
-            LATEST_METADATA_MATERIALISATION_VERSION_PROPERTY,
-            CURRENT_METADATA_MATERIALISATION_VERSION,
-        )
+        with self.changes():
+            self.save_metadata_fields()
+            self._set_property(
+                LATEST_METADATA_MATERIALISATION_VERSION_PROPERTY, CURRENT_METADATA_MATERIALISATION_VERSION
+            )
 
     def publish(self) -> None:
         """
@@ -647,22 +794,23 @@ class Document:
         self.assert_is_publishable()
 
         logger.info("Start publication process")
-        ## Make sure the document has an FCLID
-        self.assign_fclid_if_missing()
+        with self.changes():
+            ## Make sure the document has an FCLID
+            self.assign_fclid_if_missing()
 
-        ## Copy the document assets into the appropriate place in S3
-        publish_documents(self.uri)
+            ## Copy the document assets into the appropriate place in S3
+            publish_documents(self.uri)
 
-        ## Set the fact the document is published
-        self.api_client.set_published(self.uri, True)
+            ## Set the fact the document is published
+            self._set_boolean_property("published", True)
 
-        ## If necessary, set the first published date
-        now = datetime.datetime.now(datetime.timezone.utc)
-        if not self.first_published_datetime:
-            self.api_client.set_datetime_property(self.uri, "first_published_datetime", now)
+            ## If necessary, set the first published date
+            now = datetime.datetime.now(datetime.timezone.utc)
+            if not self.first_published_datetime:
+                self._set_datetime_property("first_published_datetime", now)
 
-        ## Always update the latest published date
-        self.api_client.set_datetime_property(self.uri, "latest_published_datetime", now)
+            ## Always update the latest published date
+            self._set_datetime_property("latest_published_datetime", now)
 
         ## Announce the publication on the event bus
         announce_document_event(
@@ -678,17 +826,17 @@ class Document:
     def unpublish(self) -> None:
         self.api_client.break_checkout(self.uri)
         unpublish_documents(self.uri)
-        self.api_client.set_published(self.uri, False)
+        self._set_boolean_property("published", False)
         announce_document_event(
             uri=self.uri,
             status="unpublish",
         )
 
     def hold(self) -> None:
-        self.api_client.set_property(self.uri, "editor-hold", "true")
+        self._set_property("editor-hold", "true")
 
     def unhold(self) -> None:
-        self.api_client.set_property(self.uri, "editor-hold", "false")
+        self._set_property("editor-hold", "false")
 
     @cached_property
     def safe_to_delete(self) -> bool:
@@ -711,7 +859,7 @@ class Document:
         else:
             raise DocumentNotSafeForDeletion
 
-    def _get_restore_metadata_source_version(self, version_number: int) -> Optional["Document"]:
+    def _get_restore_metadata_source_version(self, version_number: int) -> DocumentVersion | None:
         """Find the latest version that should source metadata during restore.
 
         Args:
@@ -724,8 +872,8 @@ class Document:
         metadata_source_version = None
         prior_submission_types = {VersionType.SUBMISSION.value, VersionType.RESTORE.value}
 
-        # self.versions_as_documents is pre-sorted with newest first.
-        for document in self.versions_as_documents:
+        # self.version_references is pre-sorted with newest first.
+        for document in self.version_references:
             if document.version_number > version_number:
                 continue
 
@@ -753,24 +901,17 @@ class Document:
         payload = metadata_source_version_document.structured_annotation.get("payload") or {}
         return payload.get("tre_raw_metadata") or None
 
-    def _get_version(self, version_number: int) -> Optional["Document"]:
+    def _get_version(self, version_number: int) -> DocumentVersion | None:
         """Find a specific version from the document history.
 
         Args:
             version_number: Version number to retrieve.
 
         Returns:
-            The version document matching `version_number`, or `None` if it does
-            not exist.
+            The version matching `version_number`, or `None` if it does not
+            exist.
         """
-        version_document = None
-
-        for document in self.versions_as_documents:
-            if document.version_number == version_number:
-                version_document = document
-                break
-
-        return version_document
+        return self.versions_by_number.get(version_number)
 
     def _set_tdr_metadata(self, tdr_metadata: TDRMetadataDict) -> None:
         """Store TDR metadata values on document properties.
@@ -781,25 +922,14 @@ class Document:
         Raises:
             KeyError: A required TDR metadata key is missing.
         """
-        self.api_client.set_property(
-            self.uri,
-            name="source-organisation",
-            value=tdr_metadata["Source-Organization"],
-        )
-        self.api_client.set_property(self.uri, name="source-name", value=tdr_metadata["Contact-Name"])
-        self.api_client.set_property(self.uri, name="source-email", value=tdr_metadata["Contact-Email"])
+        with self.changes():
+            self._set_property("source-organisation", tdr_metadata["Source-Organization"])
+            self._set_property("source-name", tdr_metadata["Contact-Name"])
+            self._set_property("source-email", tdr_metadata["Contact-Email"])
 
-        # Store TDR data
-        self.api_client.set_property(
-            self.uri,
-            name="transfer-consignment-reference",
-            value=tdr_metadata["Internal-Sender-Identifier"],
-        )
-        self.api_client.set_property(
-            self.uri,
-            name="transfer-received-at",
-            value=tdr_metadata["Consignment-Completed-Datetime"],
-        )
+            # Store TDR data
+            self._set_property("transfer-consignment-reference", tdr_metadata["Internal-Sender-Identifier"])
+            self._set_property("transfer-received-at", tdr_metadata["Consignment-Completed-Datetime"])
 
         # These have potentially been updated so remove from cache.
         self.__dict__.pop("source_name", None)
@@ -896,6 +1026,8 @@ class Document:
         # These will have changed so remove from cache.
         self.__dict__.pop("versions", None)
         self.__dict__.pop("versions_as_documents", None)
+        self.__dict__.pop("version_references", None)
+        self.__dict__.pop("versions_by_number", None)
         self._initialise_document_body()
 
     def move(self, new_citation: NeutralCitationString) -> None:
@@ -905,7 +1037,7 @@ class Document:
         "Send an SNS notification that triggers reparsing, also sending all editor-modifiable metadata and URI"
 
         now = datetime.datetime.now(datetime.timezone.utc)
-        self.api_client.set_property(self.uri, "last_sent_to_parser", now.isoformat())
+        self._set_property("last_sent_to_parser", now.isoformat())
 
         checked_date: str | None = (
             self.metadata["date"].value.isoformat()
@@ -944,7 +1076,7 @@ class Document:
         # note that we set 'last_sent_to_parser' even if we can't send it to the parser
         # it means 'last tried to reparse' much more consistently.
         now = datetime.datetime.now(datetime.timezone.utc)
-        self.api_client.set_property(self.uri, "last_sent_to_parser", now.isoformat())
+        self._set_property("last_sent_to_parser", now.isoformat())
         if self.can_reparse:
             self.force_reparse()
             return True
@@ -971,7 +1103,7 @@ class Document:
         """Validate the identifiers, and if the validation passes save them to MarkLogic"""
         validations = self.validate_identifiers()
         if validations.success is True:
-            self.api_client.set_property_as_node(self.uri, "identifiers", self.identifiers.as_etree)
+            self._set_property_as_node("identifiers", self.identifiers.as_etree)
         else:
             raise IdentifierValidationException(
                 "Unable to save identifiers; validation constraints not met: " + ", ".join(validations.messages)
@@ -984,7 +1116,7 @@ class Document:
         """Validate metadata fields, and if validation passes save them to MarkLogic."""
         validations = self.validate_metadata_fields()
         if validations.success is True:
-            self.api_client.set_property_as_node(self.uri, "metadata_fields", self.metadata_fields.as_etree)
+            self._set_property_as_node("metadata_fields", self.metadata_fields.as_etree)
         else:
             raise MetadataFieldValidationException(
                 "Unable to save metadata fields; validation constraints not met: " + ", ".join(validations.messages)
@@ -12,6 +12,7 @@ from caselawclient.models.utilities.dates import parse_string_date_as_utc
 from caselawclient.types import DocumentCategory
 from caselawclient.xml_helpers import DEFAULT_NAMESPACES, Element
 
+from .diff import BodyChange, diff_trees
 from .xml import XML
 
 
@@ -201,6 +202,19 @@ class DocumentBody:
         """Get the XML tree representation of the document."""
         return self._xml.xml_as_tree
 
+    @property
+    def canonical_hash(self) -> str:
+        """A hash of the document's canonical XML, used to tell whether it has been changed since it was loaded."""
+        return self._xml.canonical_hash
+
+    def diff(self, other: "DocumentBody") -> list[BodyChange]:
+        """
+        Find the structural differences between this body and another, such as an earlier version of the same document.
+
+        :return: A list of the elements which were added, removed or changed, in document order
+        """
+        return diff_trees(self.content_as_xml_tree, other.content_as_xml_tree)
+
     @cached_property
     def has_content(self) -> bool:
         """Does this XML contain rendered document content?
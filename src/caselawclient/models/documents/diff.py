@@ -0,0 +1,185 @@
+"""
+Structural comparison of two document bodies.
+
+Every element in each tree is given a hash of its tag, attributes, text and the hashes of its children, so two
+elements with the same hash are known to be identical without looking inside them. Comparing two versions of a
+document therefore only descends into the parts which have changed.
+"""
+
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from enum import Enum
+from typing import Any
+
+from lxml import etree
+
+from caselawclient.xml_helpers import DEFAULT_NAMESPACES, Element
+
+_PREFIXES = {namespace: prefix for prefix, namespace in DEFAULT_NAMESPACES.items()}
+
+
+class ChangeType(Enum):
+    ADDED = "added"
+    """ The element only exists in the other body. """
+
+    REMOVED = "removed"
+    """ The element only exists in this body. """
+
+    CHANGED = "changed"
+    """ The element exists in both bodies, but its attributes or its own text differ. """
+
+
+def _subtree_hashes(root: Element) -> dict[Element, int]:
+    """
+    Hash every element beneath and including `root`, such that two elements in the same process have the same hash only
+    if they and all their descendants are identical (barring a 64-bit collision).
+
+    Python's built-in hashing is used rather than `hashlib`, because hashing is the bulk of the work in a comparison and
+    the hashes are never stored or compared between processes.
+    """
+    hashes: dict[Element, int] = {}
+    # The hashes and following text of the children of each element which is currently open, innermost last
+    open_children: list[list[Any]] = [[]]
+
+    for event, node in etree.iterwalk(root, events=("start", "end", "comment", "pi")):
+        if event == "start":
+            open_children.append([])
+            continue
+
+        if event == "end":
+            attributes = node.attrib
+            node_hash = hash(
+                (
+                    node.tag,
+                    tuple(sorted(attributes.items())) if attributes else None,
+                    node.text,
+                    tuple(open_children.pop()),
+                )
+            )
+            hashes[node] = node_hash
+            open_children[-1].append(node_hash)
+
+        # Comments and processing instructions are ignored, apart from the text which follows them
+        open_children[-1].append(node.tail)
+
+    return hashes
+
+
+def _own_content(element: Element) -> tuple[Any, ...]:
+    """
+    The parts of an element which don't belong to any child element: its tag, attributes and text, including the text
+    between its children. Differences in whitespace alone are ignored, so that adding or removing a child is not
+    reported as a change to its parent.
+    """
+    text = " ".join([element.text or "", *(child.tail or "" for child in element)]).split()
+    return element.tag, sorted(element.attrib.items()), text
+
+
+def _xpath(element: Element) -> str:
+    """An XPath which selects exactly this element, using the prefixes from `DEFAULT_NAMESPACES`."""
+    steps: list[str] = []
+    node: Element | None = element
+    while node is not None:
+        qname = etree.QName(node)
+        prefix = _PREFIXES.get(qname.namespace or "")
+        name = f"{prefix}:{qname.localname}" if prefix else qname.localname
+        position = sum(1 for _ in node.itersiblings(node.tag, preceding=True)) + 1
+        steps.append(f"{name}[{position}]")
+        node = node.getparent()
+    return "/" + "/".join(reversed(steps))
+
+
+@dataclass(frozen=True)
+class BodyChange:
+    """A single difference between two document bodies."""
+
+    change_type: ChangeType
+    this_element: Element | None
+    that_element: Element | None
+
+    @property
+    def xpath(self) -> str:
+        """The location of the change; in this body unless the element was added, in which case in the other body."""
+        if self.this_element is not None:
+            return _xpath(self.this_element)
+        if self.that_element is not None:
+            return _xpath(self.that_element)
+        raise ValueError("A change must have an element in at least one body")
+
+    @property
+    def in_metadata(self) -> bool:
+        """Is this change within the document's `<meta>` section, rather than its content?"""
+        return "/akn:meta[" in self.xpath
+
+    @property
+    def this_text(self) -> str | None:
+        return "".join(self.this_element.itertext()) if self.this_element is not None else None
+
+    @property
+    def that_text(self) -> str | None:
+        return "".join(self.that_element.itertext()) if self.that_element is not None else None
+
+
+class _Differ:
+    def __init__(self, this_root: Element, that_root: Element):
+        self.this_root = this_root
+        self.that_root = that_root
+        self.this_hashes = _subtree_hashes(this_root)
+        self.that_hashes = _subtree_hashes(that_root)
+        self.changes: list[BodyChange] = []
+
+    def diff(self) -> list[BodyChange]:
+        if self.this_root.tag != self.that_root.tag:
+            self.changes.append(BodyChange(ChangeType.CHANGED, self.this_root, self.that_root))
+        else:
+            self._compare(self.this_root, self.that_root)
+        return self.changes
+
+    def _compare(self, this: Element, that: Element) -> None:
+        if self.this_hashes[this] == self.that_hashes[that]:
+            return
+
+        this_children = [child for child in this if isinstance(child.tag, str)]
+        that_children = [child for child in that if isinstance(child.tag, str)]
+
+        if _own_content(this) != _own_content(that):
+            self.changes.append(BodyChange(ChangeType.CHANGED, this, that))
+
+        matcher = SequenceMatcher(
+            None,
+            [self.this_hashes[child] for child in this_children],
+            [self.that_hashes[child] for child in that_children],
+            autojunk=False,
+        )
+        for operation, this_start, this_end, that_start, that_end in matcher.get_opcodes():
+            if operation != "equal":
+                self._compare_runs(this_children[this_start:this_end], that_children[that_start:that_end])
+
+    def _compare_runs(self, these: list[Element], those: list[Element]) -> None:
+        """Pair up elements with the same tag in two runs of differing siblings, and compare each pair."""
+        remaining = list(those)
+        for this in these:
+            that = next((candidate for candidate in remaining if candidate.tag == this.tag), None)
+            if that is None:
+                self.changes.append(BodyChange(ChangeType.REMOVED, this, None))
+                continue
+            # Anything skipped over to reach the matching element must have been inserted
+            skipped = remaining.index(that)
+            self.changes += [BodyChange(ChangeType.ADDED, None, added) for added in remaining[:skipped]]
+            remaining = remaining[skipped + 1 :]
+            self._compare(this, that)
+
+        self.changes += [BodyChange(ChangeType.ADDED, None, added) for added in remaining]
+
+
+def diff_trees(this_root: Element, that_root: Element) -> list[BodyChange]:
+    """
+    Find the differences between two XML trees.
+
+    Identical subtrees are skipped without being examined. Changes are reported at the most specific element possible:
+    an element whose own text or attributes differ is `CHANGED`, and elements which only appear in one tree are `ADDED`
+    or `REMOVED`.
+
+    :return: A list of changes in document order
+    """
+    return _Differ(this_root, that_root).diff()
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
-from typing import TYPE_CHECKING, ClassVar, Generic, TypeVar
+from typing import TYPE_CHECKING, ClassVar, Generic, Protocol, TypeVar
 
 from caselawclient.models.documents.metadata.fields.field import (
     MetadataCategoryValue,
@@ -10,12 +10,23 @@ from caselawclient.models.documents.metadata.fields.field import (
 from caselawclient.models.documents.metadata.fields.source import MetadataSource
 
 if TYPE_CHECKING:
-    from caselawclient.models.documents import Document
+    from caselawclient.models.documents.body import DocumentBody
+    from caselawclient.models.documents.metadata.fields.collection import MetadataFieldsCollection
     from caselawclient.models.documents.metadata.fields.resolution import ResolvedMetadataField
 
 T = TypeVar("T")
 
 
+class MetadataSubject(Protocol):
+    """
+    The parts of a document which metadata is read from and materialised into. `Document` is the usual subject, but
+    anything with a body and metadata fields will do.
+    """
+
+    body: "DocumentBody"
+    metadata_fields: "MetadataFieldsCollection"
+
+
 class Metadata(ABC):
     key: ClassVar[str]
     title: ClassVar[str]
@@ -27,7 +38,7 @@ class Metadata(ABC):
     LOGIC_VERSION: ClassVar[int] = 2
     """Bump when this field's body-extraction / materialisation rules change."""
 
-    def __init__(self, document: "Document") -> None:
+    def __init__(self, document: MetadataSubject) -> None:
         self.document = document
 
     def _resolve_claims(self) -> "ResolvedMetadataField":
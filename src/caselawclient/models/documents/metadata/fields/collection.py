@@ -1,3 +1,5 @@
+from collections import Counter
+
 from lxml import etree
 
 from caselawclient.models.documents.metadata.fields.exceptions import (
@@ -6,33 +8,67 @@ from caselawclient.models.documents.metadata.fields.exceptions import (
 from caselawclient.models.documents.metadata.fields.field import MetadataField, MetadataFieldValue
 from caselawclient.models.documents.metadata.fields.resolution import ResolvedMetadataField
 from caselawclient.models.documents.metadata.fields.source import MetadataSource
+from caselawclient.models.utilities.indexed_dict import IndexedDict
 from caselawclient.types import SuccessFailureMessageTuple
 from caselawclient.xml_helpers import Element
 
 
-class MetadataFieldsCollection(dict[str, MetadataField]):
-    """Collection of metadata claims keyed by claim id."""
+class MetadataFieldsCollection(IndexedDict[str, MetadataField]):
+    """Collection of metadata claims keyed by claim id.
+
+    Claims are also indexed by name, and resolutions are cached until a claim with that name is added, rejected,
+    restored or removed through the collection. Rejecting or restoring a `MetadataField` directly will not update the
+    cache, so use `reject()` and `restore()` here instead.
+    """
+
+    def _reset_indexes(self) -> None:
+        self._by_name: dict[str, dict[str, MetadataField]] = {}
+        self._claim_counts: Counter[tuple[str, MetadataFieldValue, MetadataSource]] = Counter()
+        self._resolved: dict[str, ResolvedMetadataField] = {}
+
+    def __setitem__(self, key: str, field: MetadataField) -> None:
+        if key in self:
+            self._unindex(key, self[key])
+        super().__setitem__(key, field)
+        self._by_name.setdefault(field.name, {})[key] = field
+        self._claim_counts[(field.name, field.value, field.source)] += 1
+        self._resolved.pop(field.name, None)
+
+    def __delitem__(self, key: str) -> None:
+        self._unindex(key, self[key])
+        super().__delitem__(key)
+
+    def _unindex(self, key: str, field: MetadataField) -> None:
+        del self._by_name[field.name][key]
+        self._claim_counts[(field.name, field.value, field.source)] -= 1
+        self._resolved.pop(field.name, None)
 
     def add(self, field: MetadataField) -> None:
         self[field.id] = field
 
     def by_name(self, name: str) -> list[MetadataField]:
-        return [field for field in self.values() if field.name == name]
+        return list(self._by_name.get(name, {}).values())
 
     def has_claim(self, name: str, value: MetadataFieldValue, source: MetadataSource) -> bool:
         """True if any claim (including rejected) matches name, value, and source."""
-        return any(field.value == value and field.source is source for field in self.by_name(name))
+        return self._claim_counts[(name, value, source)] > 0
 
     def resolve(self, name: str) -> ResolvedMetadataField:
-        return ResolvedMetadataField(name=name, claims=self.by_name(name))
+        if name not in self._resolved:
+            self._resolved[name] = ResolvedMetadataField(name=name, claims=self.by_name(name))
+        return self._resolved[name]
 
     def reject(self, field_id: str) -> None:
         """Soft-delete a claim by id."""
-        self[field_id].reject()
+        field = self[field_id]
+        field.reject()
+        self._resolved.pop(field.name, None)
 
     def restore(self, field_id: str) -> None:
         """Undo soft-delete for a claim by id."""
-        self[field_id].restore()
+        field = self[field_id]
+        field.restore()
+        self._resolved.pop(field.name, None)
 
     def remove(self, field_id: str) -> None:
         """Hard-remove a claim. Only allowed for editor-sourced claims.
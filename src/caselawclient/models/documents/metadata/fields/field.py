@@ -1,3 +1,4 @@
+import sys
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Union
@@ -11,7 +12,7 @@ from caselawclient.xml_helpers import Element
 MetadataFieldValue = Union[str, "MetadataCategoryValue"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MetadataCategoryValue:
     """Structured value for a ``category`` metadata claim."""
 
@@ -24,8 +25,13 @@ class MetadataField:
 
     There is no in-place update API. To change an editor-sourced value, remove the
     existing claim and add a new one (new id and timestamp).
+
+    Claims are held in memory in large numbers, so they use ``__slots__``, and field names are interned so that every
+    claim for the same field shares one string.
     """
 
+    __slots__ = ("id", "name", "rejected", "source", "timestamp", "value")
+
     def __init__(
         self,
         name: str,
@@ -37,7 +43,7 @@ class MetadataField:
         rejected: bool = False,
     ) -> None:
         self.id = id or str(uuid4())
-        self.name = name
+        self.name = sys.intern(name)
         self.value = value
         self.source = source
         self.timestamp = timestamp if timestamp is not None else datetime.now(UTC)
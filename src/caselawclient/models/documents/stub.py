@@ -1,11 +1,12 @@
 import os
 from typing import Literal, cast
 
-from ds_caselaw_utils.courts import courts
-from ds_caselaw_utils.types import CourtCode
+from ds_caselaw_utils.courts import CourtNotFoundException
 from saxonche import PySaxonProcessor
 from typing_extensions import TypedDict
 
+from caselawclient.models.utilities.courts import find_court
+
 
 class PartyData(TypedDict):
     role: Literal["Claimant", "Respondent", "Appellant", "Defendant"]
@@ -29,7 +30,9 @@ class RendererStubData(EditorStubData):
 
 
 def add_other_stub_fields(editor_data: EditorStubData) -> RendererStubData:
-    court = courts.get_court_by_code(CourtCode(editor_data["court_code"].upper()))
+    court = find_court(editor_data["court_code"].upper())
+    if court is None:
+        raise CourtNotFoundException()
     return {
         **editor_data,
         "court_url": court.identifier_iri,
@@ -1,9 +1,19 @@
+import datetime
 import json
 from enum import Enum
-from typing import Any, TypedDict
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, TypedDict
 
+from pydantic import TypeAdapter, ValidationError
 from typing_extensions import NotRequired
 
+from caselawclient.models.utilities import VersionsDict, extract_version
+from caselawclient.types import DocumentURIString, MarkLogicDocumentURIString
+
+if TYPE_CHECKING:
+    from caselawclient.Client import MarklogicApiClient
+    from caselawclient.models.documents import Document
+
 
 class AnnotationDataDict(TypedDict):
     type: str
@@ -14,6 +24,40 @@ class AnnotationDataDict(TypedDict):
     automated: bool
 
 
+class VersionDetailsDict(VersionsDict):
+    created: datetime.datetime | None
+    annotation: AnnotationDataDict | None
+    """ The structured annotation for this version, or `None` if it has no annotation or one which isn't structured. """
+    size: int | None
+    """ The length of the serialised version in characters, or `None` if it was not requested. """
+
+
+def _parse_annotation(annotation: str) -> AnnotationDataDict | None:
+    if not annotation:
+        return None
+    try:
+        return TypeAdapter(AnnotationDataDict).validate_json(annotation)
+    except ValidationError:
+        return None
+
+
+def render_version_details(raw_versions: list[str]) -> list[VersionDetailsDict]:
+    """Render the JSON objects returned by `list_judgment_versions_detailed.xqy`, most recent version first."""
+    versions: list[VersionDetailsDict] = []
+    for raw_version in raw_versions:
+        version = json.loads(raw_version)
+        versions.append(
+            {
+                "uri": MarkLogicDocumentURIString(version["uri"]).as_document_uri(),
+                "version": extract_version(version["uri"]),
+                "created": datetime.datetime.fromisoformat(version["created"]) if version["created"] else None,
+                "annotation": _parse_annotation(version["annotation"]),
+                "size": version.get("size"),
+            }
+        )
+    return sorted(versions, key=lambda d: -d["version"])
+
+
 class VersionType(Enum):
     """Valid types of version."""
 
@@ -115,3 +159,47 @@ class VersionAnnotation:
 
     def __str__(self) -> str:
         return self.as_json
+
+
+class DocumentVersion:
+    """
+    A lightweight reference to one version of a document, built from the detailed version listing.
+
+    The version number, URI, creation time and annotation are known without any further requests. The version itself is
+    only loaded from MarkLogic when `document` is used.
+    """
+
+    def __init__(
+        self,
+        api_client: "MarklogicApiClient",
+        uri: DocumentURIString,
+        version_number: int,
+        created: datetime.datetime | None = None,
+        annotation: AnnotationDataDict | None = None,
+    ):
+        """
+        :param created: When this version was created, if known
+        :param annotation: The structured annotation for this version, if already known
+        """
+        self.api_client = api_client
+        self.uri = uri
+        self.version_number = version_number
+        self.created = created
+        self._annotation = annotation
+
+    def __repr__(self) -> str:
+        return f"<DocumentVersion {self.uri}>"
+
+    @cached_property
+    def document(self) -> "Document":
+        """The full version, loaded from MarkLogic."""
+        return self.api_client.get_document_by_uri(self.uri)
+
+    @cached_property
+    def structured_annotation(self) -> AnnotationDataDict:
+        """
+        :raises ValidationError: The annotation for this version isn't structured, as with `Document`
+        """
+        if self._annotation is not None:
+            return self._annotation
+        return TypeAdapter(AnnotationDataDict).validate_json(self.api_client.get_version_annotation(self.uri))
@@ -1,4 +1,5 @@
 import os
+from hashlib import sha256
 
 from lxml import etree
 
@@ -42,6 +43,14 @@ class XML:
         """
         return str(etree.tostring(self.xml_as_tree).decode(encoding="utf-8"))
 
+    @property
+    def canonical_hash(self) -> str:
+        """
+        :return: A SHA-256 hash of the canonical (C14N) form of this document's XML, which only changes when the
+            document's content does, regardless of how it was serialised.
+        """
+        return sha256(etree.tostring(self.xml_as_tree, method="c14n")).hexdigest()
+
     @property
     def root_element(self) -> str:
         return str(self.xml_as_tree.tag)
@@ -11,6 +11,7 @@ from .exceptions import IdentifierValidationException
 
 if TYPE_CHECKING:
     from caselawclient.Client import MarklogicApiClient
+    from caselawclient.identifier_resolution import IdentifierResolutions
     from caselawclient.models.documents import Document
 
 IDENTIFIER_PACKABLE_ATTRIBUTES: list[str] = [
@@ -85,7 +86,14 @@ class IdentifierSchema(ABC):
 
 
 class Identifier(ABC):
-    """A base class for subclasses representing a concrete identifier."""
+    """
+    A base class for subclasses representing a concrete identifier.
+
+    Identifiers are held in memory in large numbers, so they use `__slots__` rather than a per-instance `__dict__`.
+    Subclasses should declare an empty `__slots__` to keep this saving.
+    """
+
+    __slots__ = ("_url_slug", "deprecated", "uuid", "value")
 
     schema: type[IdentifierSchema]
 
@@ -125,6 +133,7 @@ class Identifier(ABC):
             self.uuid = "id-" + str(uuid4())
 
         self.deprecated = deprecated
+        self._url_slug: DocumentIdentifierSlug | None = None
 
     @property
     def as_xml_tree(self) -> Element:
@@ -145,8 +154,11 @@ class Identifier(ABC):
         return identifier_root
 
     @property
-    def url_slug(self) -> str:
-        return self.schema.compile_identifier_url_slug(self.value)
+    def url_slug(self) -> DocumentIdentifierSlug:
+        """The URL slug for this identifier, which is compiled the first time it is needed."""
+        if self._url_slug is None:
+            self._url_slug = self.schema.compile_identifier_url_slug(self.value)
+        return self._url_slug
 
     @property
     def score(self) -> float:
@@ -166,14 +178,21 @@ class Identifier(ABC):
 
         nb: We don't need to check that the identifier value is unique within a parent `Identifiers` object, because `Identifiers.add()` will only allow one value per namespace.
         """
-        resolutions = [
+        return self.validate_globally_unique_among(
+            api_client.resolve_from_identifier_value(identifier_value=self.value, published_only=False, use_cache=False)
+        )
+
+    def validate_globally_unique_among(self, resolutions: "IdentifierResolutions") -> SuccessFailureMessageTuple:
+        """
+        Check that none of the given resolutions of this identifier's value, including unpublished ones, are a different
+        identifier in the same scheme.
+        """
+        conflicting_resolutions = [
             resolution
-            for resolution in api_client.resolve_from_identifier_value(
-                identifier_value=self.value, published_only=False
-            )
+            for resolution in resolutions
             if resolution.identifier_namespace == self.schema.namespace and resolution.identifier_uuid != self.uuid
         ]
-        if len(resolutions) > 0:
+        if len(conflicting_resolutions) > 0:
             return SuccessFailureMessageTuple(
                 False,
                 [f'Identifiers in scheme "{self.schema.namespace}" must be unique; "{self.value}" already exists!'],
@@ -195,11 +214,21 @@ class Identifier(ABC):
         return SuccessFailureMessageTuple(True, [])
 
     def perform_all_validations(
-        self, document_type: type["Document"], api_client: "MarklogicApiClient"
+        self,
+        document_type: type["Document"],
+        api_client: "MarklogicApiClient",
+        resolutions: "IdentifierResolutions | None" = None,
     ) -> SuccessFailureMessageTuple:
-        """Perform all validations on a given identifier"""
+        """
+        Perform all validations on a given identifier
+
+        :param resolutions: The resolutions of this identifier's value, including unpublished ones, if they have
+            already been fetched. If not given, they are fetched from MarkLogic.
+        """
         validations = [
-            self.validate_require_globally_unique(api_client=api_client),
+            self.validate_require_globally_unique(api_client=api_client)
+            if resolutions is None
+            else self.validate_globally_unique_among(resolutions),
             self.validate_valid_for_document_type(document_type=document_type),
         ]
 
@@ -2,7 +2,8 @@ from typing import TYPE_CHECKING
 
 from lxml import etree
 
-from caselawclient.types import SuccessFailureMessageTuple
+from caselawclient.models.utilities.indexed_dict import IndexedDict
+from caselawclient.types import DocumentIdentifierValue, SuccessFailureMessageTuple
 from caselawclient.xml_helpers import Element
 
 from . import Identifier, IdentifierSchema
@@ -21,7 +22,26 @@ SUPPORTED_IDENTIFIER_TYPES: list[type["Identifier"]] = [
 ]
 
 
-class IdentifiersCollection(dict[str, Identifier]):
+class IdentifiersCollection(IndexedDict[str, Identifier]):
+    """
+    A document's identifiers, keyed by UUID.
+
+    The identifiers of each type, and their ordering by score, are cached until an identifier is added or removed
+    through the collection. Deprecating an identifier in place will not update the cached ordering.
+    """
+
+    def _reset_indexes(self) -> None:
+        self._of_type: dict[type[Identifier], list[Identifier]] = {}
+        self._by_score: dict[type[Identifier] | None, list[Identifier]] = {}
+
+    def __setitem__(self, key: str, identifier: Identifier) -> None:
+        super().__setitem__(key, identifier)
+        self._forget_cached_orderings()
+
+    def _forget_cached_orderings(self) -> None:
+        self._of_type.clear()
+        self._by_score.clear()
+
     def validate_uuids_match_keys(self) -> SuccessFailureMessageTuple:
         for uuid, identifier in self.items():
             if uuid != identifier.uuid:
@@ -78,13 +98,28 @@ class IdentifiersCollection(dict[str, Identifier]):
     def _perform_identifier_level_validations(
         self, document_type: type["Document"], api_client: "MarklogicApiClient"
     ) -> SuccessFailureMessageTuple:
-        """Perform identifier validations at the individual identifier level."""
+        """
+        Perform identifier validations at the individual identifier level. The values of every identifier are resolved
+        in a single query, rather than one query per identifier. The identifier resolution cache is bypassed: this
+        client removes entries when it changes a document's identifiers, but a cached answer could still miss a
+        document which another client has since given one of these values.
+        """
 
         success = True
         messages: list[str] = []
 
+        resolutions = api_client.resolve_many_values(
+            [DocumentIdentifierValue(identifier.value) for identifier in self.values()],
+            published_only=False,
+            use_cache=False,
+        )
+
         for identifier in self.values():
-            validations = identifier.perform_all_validations(document_type=document_type, api_client=api_client)
+            validations = identifier.perform_all_validations(
+                document_type=document_type,
+                api_client=api_client,
+                resolutions=resolutions[DocumentIdentifierValue(identifier.value)],
+            )
             if validations.success is False:
                 success = False
 
@@ -129,11 +164,18 @@ class IdentifiersCollection(dict[str, Identifier]):
             super().__delitem__(key.uuid)
         else:
             super().__delitem__(key)
+        self._forget_cached_orderings()
+
+    def _identifiers_of_type(self, identifier_type: type[Identifier]) -> list[Identifier]:
+        if identifier_type not in self._of_type:
+            self._of_type[identifier_type] = [
+                identifier for identifier in self.values() if isinstance(identifier, identifier_type)
+            ]
+        return self._of_type[identifier_type]
 
     def of_type(self, identifier_type: type[Identifier]) -> list[Identifier]:
         """Return a list of all identifiers of a given type."""
-        uuids = self.keys()
-        return [self[uuid] for uuid in list(uuids) if isinstance(self[uuid], identifier_type)]
+        return list(self._identifiers_of_type(identifier_type))
 
     def delete_type(self, deleted_identifier_type: type[Identifier]) -> None:
         "For when we want an identifier to be the only valid identifier of that type, delete the others first"
@@ -159,8 +201,13 @@ class IdentifiersCollection(dict[str, Identifier]):
 
         :return: Return a list of identifiers, sorted by their score in descending order.
         """
-        identifiers = self.of_type(type) if type else list(self.values())
-        return sorted(identifiers, key=lambda v: v.score, reverse=True)
+        return list(self._identifiers_by_score(type))
+
+    def _identifiers_by_score(self, type: type[Identifier] | None = None) -> list[Identifier]:
+        if type not in self._by_score:
+            identifiers = self._identifiers_of_type(type) if type else self.values()
+            self._by_score[type] = sorted(identifiers, key=lambda v: v.score, reverse=True)
+        return self._by_score[type]
 
     def preferred(self, type: type[Identifier] | None = None) -> Identifier | None:
         """
@@ -168,6 +215,7 @@ class IdentifiersCollection(dict[str, Identifier]):
 
         :return: Return the highest scoring identifier of the given type (or of any type, if none is specified). Returns `None` if no identifier is available.
         """
-        if len(self.by_score(type)) == 0:
+        identifiers = self._identifiers_by_score(type)
+        if len(identifiers) == 0:
             return None
-        return self.by_score(type)[0]
+        return identifiers[0]
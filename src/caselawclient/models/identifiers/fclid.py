@@ -1,4 +1,5 @@
 import re
+import threading
 from typing import TYPE_CHECKING
 
 from sqids import Sqids
@@ -21,6 +22,9 @@ sqids = Sqids(
     alphabet=FCLID_ALPHABET,
 )
 
+DEFAULT_SEQUENCE_BLOCK_SIZE = 100
+""" The default number of sequence numbers an `FCLIDAllocator` reserves from MarkLogic at a time. """
+
 
 class FindCaseLawIdentifierSchema(IdentifierSchema):
     """
@@ -44,12 +48,57 @@ class FindCaseLawIdentifierSchema(IdentifierSchema):
         return DocumentIdentifierSlug("tna." + value)
 
     @classmethod
-    def mint(cls, api_client: "MarklogicApiClient") -> "FindCaseLawIdentifier":
-        """Generate a totally new Find Case Law identifier."""
+    def mint(
+        cls, api_client: "MarklogicApiClient", allocator: "FCLIDAllocator | None" = None
+    ) -> "FindCaseLawIdentifier":
+        """
+        Generate a totally new Find Case Law identifier.
+
+        :param allocator: If given, take the sequence number from this allocator's reserved block instead of
+            incrementing the sequence in MarkLogic
+        """
+        if allocator is not None:
+            return allocator.mint()
+
         next_sequence_number = api_client.get_next_document_sequence_number()
         new_identifier = sqids.encode([next_sequence_number])
         return FindCaseLawIdentifier(value=new_identifier)
 
 
 class FindCaseLawIdentifier(Identifier):
+    __slots__ = ()
+
     schema = FindCaseLawIdentifierSchema
+
+
+class FCLIDAllocator:
+    """
+    Mint Find Case Law identifiers from blocks of sequence numbers reserved from MarkLogic, rather than incrementing
+    the sequence in MarkLogic once per identifier. A new block is reserved whenever the current one is used up.
+
+    An allocator can be shared between threads. Any numbers left in its block when it is discarded are never used,
+    which leaves a gap in the sequence but does not affect uniqueness.
+    """
+
+    def __init__(self, api_client: "MarklogicApiClient", block_size: int = DEFAULT_SEQUENCE_BLOCK_SIZE):
+        self.api_client = api_client
+        self.block_size = block_size
+
+        self._lock = threading.Lock()
+        self._reserved = iter(range(0))
+
+        self.reservation_count = 0
+        """ The number of blocks which have been reserved from MarkLogic. """
+
+    def next_sequence_number(self) -> int:
+        with self._lock:
+            sequence_number = next(self._reserved, None)
+            if sequence_number is None:
+                self._reserved = iter(self.api_client.reserve_document_sequence_numbers(self.block_size))
+                self.reservation_count += 1
+                sequence_number = next(self._reserved)
+            return sequence_number
+
+    def mint(self) -> FindCaseLawIdentifier:
+        """Generate a totally new Find Case Law identifier from the reserved block."""
+        return FindCaseLawIdentifier(value=sqids.encode([self.next_sequence_number()]))
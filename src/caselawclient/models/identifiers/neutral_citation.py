@@ -1,4 +1,6 @@
 import re
+from functools import lru_cache
+from typing import NamedTuple
 
 from ds_caselaw_utils import neutral_url
 from ds_caselaw_utils.types import NeutralCitationString
@@ -24,6 +26,53 @@ TODO: When these capture groups are being used in anger (eg to build URL slugs)
 """
 
 
+NCN_PARSE_CACHE_SIZE = 4096
+""" The number of distinct NCN values whose parse results are remembered. """
+
+
+class ParsedNeutralCitation(NamedTuple):
+    """The components of a neutral citation, and the URL slug it converts to."""
+
+    year: str | None
+    court: str | None
+    first_qualifier: str | None
+    number: str | None
+    second_qualifier: str | None
+
+    url_slug: DocumentIdentifierSlug | None
+    """ The NCN-based URL slug, or `None` if this value can't be converted to one. """
+
+    @property
+    def matches_pattern(self) -> bool:
+        """Does the value match `VALID_NCN_PATTERN`?"""
+        return self.year is not None
+
+
+def parse_neutral_citation(value: str) -> ParsedNeutralCitation:
+    """
+    Split a neutral citation into its components and convert it to a URL slug, remembering the result so that the
+    same value is only parsed once.
+    """
+    # Identifier values are a subclass of str, which would otherwise be cached separately from the same plain string
+    return _parse_neutral_citation(str(value))
+
+
+@lru_cache(maxsize=NCN_PARSE_CACHE_SIZE)
+def _parse_neutral_citation(value: str) -> ParsedNeutralCitation:
+    match = VALID_NCN_PATTERN.match(value)
+    year, court, first_qualifier, number, second_qualifier = match.groups()[1:] if match else (None,) * 5
+    url_slug = neutral_url(NeutralCitationString(value))  # TODO: At some point this should move out of utils.
+
+    return ParsedNeutralCitation(
+        year=year,
+        court=court,
+        first_qualifier=first_qualifier,
+        number=number,
+        second_qualifier=second_qualifier,
+        url_slug=DocumentIdentifierSlug(url_slug) if url_slug else None,
+    )
+
+
 class NCNValidationException(IdentifierValidationException):
     pass
 
@@ -52,26 +101,28 @@ class NeutralCitationNumberSchema(IdentifierSchema):
 
     @classmethod
     def validate_identifier_value(cls, value: str) -> bool:
+        parsed = parse_neutral_citation(value)
+
         # Quick check to see if the NCN matches the expected pattern
-        if not bool(VALID_NCN_PATTERN.match(value)):
+        if not parsed.matches_pattern:
             raise NCNDoesNotMatchExpectedPatternException(f"NCN '{value}' is not in the expected format")
 
-        # Can we convert this to a URL? neutral_url returns False if not.
+        # Can we convert this to a URL?
         # This functionally tests to see if the court exists, since only valid patterns (where we know how to match the court code) will convert
-        if not neutral_url(NeutralCitationString(value)):
+        if not parsed.url_slug:
             raise NCNCannotConvertToValidURLSlugException(f"NCN '{value}' cannot be converted to an NCN-based URL slug")
 
         return True
 
     @classmethod
     def compile_identifier_url_slug(cls, value: str) -> DocumentIdentifierSlug:
-        ncn_based_uri_string = neutral_url(
-            NeutralCitationString(value)
-        )  # TODO: At some point this should move out of utils and into this class.
+        ncn_based_uri_string = parse_neutral_citation(value).url_slug
         if not ncn_based_uri_string:
             raise NCNCannotConvertToValidURLSlugException(f"NCN '{value}' cannot be converted to an NCN-based URL slug")
-        return DocumentIdentifierSlug(ncn_based_uri_string)
+        return ncn_based_uri_string
 
 
 class NeutralCitationNumber(Identifier):
+    __slots__ = ()
+
     schema = NeutralCitationNumberSchema
@@ -21,4 +21,6 @@ class PressSummaryRelatedNCNIdentifierSchema(NeutralCitationNumberSchema):
 
 
 class PressSummaryRelatedNCNIdentifier(NeutralCitationNumber):
+    __slots__ = ()
+
     schema = PressSummaryRelatedNCNIdentifierSchema
@@ -17,6 +17,7 @@ from mypy_boto3_sns.client import SNSClient
 from mypy_boto3_sns.type_defs import MessageAttributeValueTypeDef
 from typing_extensions import NotRequired
 
+from caselawclient.models.utilities.sns import SNSBatchPublisher, SNSMessage
 from caselawclient.types import DocumentURIString
 
 env = environ.Env()
@@ -328,9 +329,18 @@ def delete_documents_from_private_bucket(uri: DocumentURIString) -> None:
     delete_from_bucket(uri, env("PRIVATE_ASSET_BUCKET"))
 
 
-def announce_document_event(uri: DocumentURIString, status: str, enrich: bool = False) -> None:
-    client = create_sns_client()
+def announce_document_event(
+    uri: DocumentURIString,
+    status: str,
+    enrich: bool = False,
+    publisher: SNSBatchPublisher | None = None,
+) -> None:
+    """
+    Announce a change to a document on the announce SNS topic.
 
+    :param publisher: If given, queue the announcement on this publisher to be sent as part of a batch, rather than
+        publishing it immediately.
+    """
     message_attributes: dict[str, MessageAttributeValueTypeDef] = {}
     message_attributes["update_type"] = {
         "DataType": "String",
@@ -346,14 +356,20 @@ def announce_document_event(uri: DocumentURIString, status: str, enrich: bool =
             "StringValue": "1",
         }
 
-    logger.info("Announcing document event for %s with status %s and enrich %s", uri, status, enrich)
-    client.publish(
-        TopicArn=env("SNS_TOPIC"),  # this is the ANNOUNCE SNS topic
-        Message=json.dumps({"uri_reference": uri, "status": status}),
-        Subject=f"Updated: {uri} {status}",
-        MessageAttributes=message_attributes,
+    message = SNSMessage(
+        topic_arn=env("SNS_TOPIC"),  # this is the ANNOUNCE SNS topic
+        message=json.dumps({"uri_reference": uri, "status": status}),
+        subject=f"Updated: {uri} {status}",
+        message_attributes=message_attributes,
     )
 
+    logger.info("Announcing document event for %s with status %s and enrich %s", uri, status, enrich)
+    if publisher is not None:
+        publisher.enqueue(message)
+        return
+
+    message.publish(create_sns_client())
+
 
 def upload_asset_to_private_bucket(body: bytes, s3_key: str) -> None:
     """Upload an asset to the private bucket."""
@@ -423,9 +439,14 @@ def request_parse(
     uri: DocumentURIString,
     reference: str | None,
     parser_instructions: ParserInstructionsDict | None = None,
+    publisher: SNSBatchPublisher | None = None,
 ) -> None:
-    client = create_sns_client()
+    """
+    Ask the parser to parse a document's source file again.
 
+    :param publisher: If given, queue the request on this publisher to be sent as part of a batch, rather than
+        publishing it immediately.
+    """
     if parser_instructions is None:
         parser_instructions = ParserInstructionsDict({})
 
@@ -447,8 +468,14 @@ def request_parse(
         },
     }
 
-    client.publish(
-        TopicArn=env("REPARSE_SNS_TOPIC"),
-        Message=json.dumps(message_to_send),
-        Subject=f"Reparse request: {uri}",
+    message = SNSMessage(
+        topic_arn=env("REPARSE_SNS_TOPIC"),
+        message=json.dumps(message_to_send),
+        subject=f"Reparse request: {uri}",
     )
+
+    if publisher is not None:
+        publisher.enqueue(message)
+        return
+
+    message.publish(create_sns_client())
@@ -0,0 +1,28 @@
+from functools import lru_cache
+
+from ds_caselaw_utils import courts
+from ds_caselaw_utils.courts import Court, CourtNotFoundException
+from ds_caselaw_utils.types import CourtCode, JurisdictionCode
+
+COURT_LOOKUP_CACHE_SIZE = 1024
+""" The number of court and jurisdiction code pairs to remember. There are only a few hundred valid pairs. """
+
+
+@lru_cache(maxsize=COURT_LOOKUP_CACHE_SIZE)
+def find_court(court_code: str, jurisdiction_code: str = "") -> Court | None:
+    """
+    Find a court by its code and, if one is given, its jurisdiction.
+
+    Lookups are remembered, including lookups which found nothing, so that repeatedly checking the same codes doesn't
+    repeatedly raise and catch `CourtNotFoundException`.
+
+    :return: The court, which includes the jurisdiction if one was given, or `None` if there is no such court
+    """
+    try:
+        if jurisdiction_code:
+            return courts.get_court_with_jurisdiction_by_code(
+                CourtCode(court_code), JurisdictionCode(jurisdiction_code)
+            )
+        return courts.get_court_by_code(CourtCode(court_code))
+    except CourtNotFoundException:
+        return None
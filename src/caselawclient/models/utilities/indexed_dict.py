@@ -0,0 +1,75 @@
+from collections.abc import Iterable, Mapping
+from typing import Any, Self, TypeVar, overload
+
+K = TypeVar("K")
+V = TypeVar("V")
+T = TypeVar("T")
+
+
+class IndexedDict(dict[K, V]):
+    """
+    A dict which keeps indexes or caches of its contents up to date.
+
+    The methods `dict` implements in C don't call an overridden `__setitem__` or `__delitem__`, so this routes every
+    change through them instead, including those made by `update`, `pop`, `popitem`, `setdefault`, `|=`, the
+    constructor, copying and unpickling. Subclasses only need to maintain their indexes in `__setitem__` and
+    `__delitem__`, and create them empty in `_reset_indexes`, which is also called by `clear`.
+    """
+
+    def __init__(self, *args: Any, **kwargs: V) -> None:
+        super().__init__()
+        self._reset_indexes()
+        self.update(*args, **kwargs)
+
+    def _reset_indexes(self) -> None:
+        """Create empty indexes, for a collection with nothing in it."""
+
+    def update(self, *args: Any, **kwargs: V) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    @overload
+    def pop(self, key: K, /) -> V: ...
+
+    @overload
+    def pop(self, key: K, default: V, /) -> V: ...
+
+    @overload
+    def pop(self, key: K, default: T, /) -> V | T: ...
+
+    def pop(self, key: K, /, *default: Any) -> Any:
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+    def popitem(self) -> tuple[K, V]:
+        if not self:
+            raise KeyError(f"popitem(): {type(self).__name__} is empty")
+        key = next(reversed(self))
+        value = self[key]
+        del self[key]
+        return key, value
+
+    def setdefault(self, key: K, default: V, /) -> V:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def clear(self) -> None:
+        super().clear()
+        self._reset_indexes()
+
+    def __ior__(self, other: Mapping[K, V] | Iterable[tuple[K, V]]) -> Self:  # type: ignore[override,misc]
+        self.update(other)
+        return self
+
+    def copy(self) -> Self:
+        return type(self)(self)
+
+    def __reduce__(self) -> tuple[type[Self], tuple[dict[K, V]]]:
+        # Rebuild copies through the constructor, rather than copying the indexes and then adding every item again
+        return type(self), (dict(self),)
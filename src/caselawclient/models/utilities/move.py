@@ -1,5 +1,6 @@
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
+import botocore.exceptions
 import ds_caselaw_utils as caselawutils
 from ds_caselaw_utils.types import NeutralCitationString
 
@@ -45,47 +46,18 @@ def update_document_uri(
         )
 
     try:
-        api_client.copy_document(source_uri, new_uri)
-        set_metadata(source_uri, new_uri, api_client)
-        copy_assets(source_uri, new_uri)
-        api_client.set_judgment_this_uri(new_uri)
+        api_client.move_document(source_uri, new_uri)
     except MarklogicAPIError as e:
         raise MoveJudgmentError(
-            f"Failure when attempting to copy judgment from {source_uri} to {new_uri}: {e}",
+            f"Failure when attempting to move judgment from {source_uri} to {new_uri}: {e}",
         )
 
+    # Only copy assets once the move has committed, so a failed move doesn't leave orphaned assets at the new URI
     try:
-        api_client.delete_judgment(source_uri)
-    except MarklogicAPIError as e:
+        copy_assets(source_uri, new_uri)
+    except (botocore.exceptions.BotoCoreError, botocore.exceptions.ClientError) as e:
         raise MoveJudgmentError(
-            f"Failure when attempting to delete judgment from {source_uri}: {e}",
+            f"Judgment was moved from {source_uri} to {new_uri}, but its assets could not be copied: {e}",
         )
 
     return new_uri
-
-
-def set_metadata(old_uri: DocumentURIString, new_uri: DocumentURIString, api_client: Any) -> None:
-    source_organisation = api_client.get_property(old_uri, "source-organisation")
-    source_name = api_client.get_property(old_uri, "source-name")
-    source_email = api_client.get_property(old_uri, "source-email")
-    transfer_consignment_reference = api_client.get_property(
-        old_uri,
-        "transfer-consignment-reference",
-    )
-    transfer_received_at = api_client.get_property(old_uri, "transfer-received-at")
-    for key, value in [
-        ("source-organisation", source_organisation),
-        ("source-name", source_name),
-        ("source-email", source_email),
-        ("transfer-consignment-reference", transfer_consignment_reference),
-        ("transfer-received-at", transfer_received_at),
-    ]:
-        if value is not None:
-            api_client.set_property(new_uri, key, value)
-
-    """
-    `published` is a boolean property and set differently, technically
-    these failures should be unpublished but copy the property just in case.
-    """
-    published = api_client.get_published(old_uri)
-    api_client.set_boolean_property(new_uri, "published", bool(published))
@@ -0,0 +1,275 @@
+"""
+Batched publishing of messages to SNS topics.
+
+`announce_document_event` and `request_parse` publish a single message per call. When many documents are being
+processed at once, pass an `SNSBatchPublisher` to those functions and messages will instead be queued and sent using
+`publish_batch`, up to ten messages per request.
+
+``` python
+with SNSBatchPublisher() as publisher:
+    for uri in uris:
+        announce_document_event(uri=uri, status="publish", publisher=publisher)
+```
+"""
+
+import atexit
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import TYPE_CHECKING, Self
+
+import botocore.exceptions
+
+if TYPE_CHECKING:
+    from mypy_boto3_sns.client import SNSClient
+    from mypy_boto3_sns.type_defs import (
+        MessageAttributeValueTypeDef,
+        PublishBatchRequestEntryTypeDef,
+        PublishInputTypeDef,
+    )
+
+logger = logging.getLogger(__name__)
+
+SNS_PUBLISH_BATCH_MAXIMUM_SIZE = 10
+""" The maximum number of messages SNS will accept in a single `publish_batch` request. """
+
+
+class SNSBatchPublishError(Exception):
+    """One or more messages could not be published to SNS, even after retrying."""
+
+    def __init__(self, message: str, failed_messages: list["SNSMessage"]):
+        super().__init__(message)
+        self.failed_messages = failed_messages
+
+
+@dataclass
+class SNSMessage:
+    """A single message waiting to be published to an SNS topic."""
+
+    topic_arn: str
+    message: str
+    subject: str | None = None
+    message_attributes: dict[str, "MessageAttributeValueTypeDef"] = field(default_factory=dict)
+
+    def as_batch_entry(self, entry_id: str) -> "PublishBatchRequestEntryTypeDef":
+        """Render this message as an entry in a `publish_batch` request."""
+        entry: PublishBatchRequestEntryTypeDef = {"Id": entry_id, "Message": self.message}
+        if self.subject:
+            entry["Subject"] = self.subject
+        if self.message_attributes:
+            entry["MessageAttributes"] = self.message_attributes
+        return entry
+
+    def publish(self, client: "SNSClient") -> None:
+        """Publish this message on its own, rather than as part of a batch."""
+        request: PublishInputTypeDef = {"TopicArn": self.topic_arn, "Message": self.message}
+        if self.subject:
+            request["Subject"] = self.subject
+        if self.message_attributes:
+            request["MessageAttributes"] = self.message_attributes
+        client.publish(**request)
+
+
+class SNSBatchPublisher:
+    """
+    Queue SNS messages and publish them in batches.
+
+    Full batches are sent as soon as they are queued. Partial batches are sent when `flush()` is called, when the
+    publisher is used as a context manager and the context exits, every `flush_interval` seconds if a background
+    interval is set, and when the interpreter shuts down.
+    """
+
+    def __init__(
+        self,
+        client: "SNSClient | None" = None,
+        flush_interval: float | None = None,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        flush_at_exit: bool = True,
+    ):
+        """
+        :param client: The SNS client to publish with. Defaults to the shared client from `create_sns_client()`.
+        :param flush_interval: If set, flush any queued messages in a background thread this often, in seconds.
+        :param max_retries: How many times to retry messages which SNS failed to publish for reasons other than a
+            fault in the message itself.
+        :param retry_backoff: The delay before the first retry, in seconds. This doubles with each subsequent retry.
+        :param flush_at_exit: Flush any queued messages when the interpreter shuts down.
+        """
+        self._client = client
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+        self._queue: list[SNSMessage] = []
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._worker: threading.Thread | None = None
+
+        self.published_count = 0
+        """ The number of messages which have been successfully published. """
+
+        self.failed_messages: list[SNSMessage] = []
+        """ Messages which could not be published, even after retrying. """
+
+        if flush_interval is not None:
+            self._worker = threading.Thread(
+                target=self._flush_periodically,
+                args=(flush_interval,),
+                name="sns-batch-publisher",
+                daemon=True,
+            )
+            self._worker.start()
+
+        self._flush_at_exit = flush_at_exit
+        if flush_at_exit:
+            atexit.register(self._flush_at_shutdown)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def client(self) -> "SNSClient":
+        if self._client is None:
+            from caselawclient.models.utilities.aws import create_sns_client
+
+            self._client = create_sns_client()
+        return self._client
+
+    @property
+    def pending_count(self) -> int:
+        """The number of messages which are queued but not yet published."""
+        with self._lock:
+            return len(self._queue)
+
+    def enqueue(self, message: SNSMessage) -> None:
+        """Queue a message for publication, sending any batches which are now full."""
+        if self._closed.is_set():
+            raise RuntimeError("Cannot enqueue a message on a closed SNSBatchPublisher")
+
+        with self._lock:
+            self._queue.append(message)
+            full_batches = self._take_batches(only_full=True)
+
+        for batch in full_batches:
+            self._publish_batch(batch)
+
+    def flush(self) -> None:
+        """
+        Publish every queued message.
+
+        :raises SNSBatchPublishError: One or more messages could not be published, even after retrying
+        """
+        with self._lock:
+            batches = self._take_batches(only_full=False)
+
+        failed: list[SNSMessage] = []
+        for batch in batches:
+            failed += self._publish_batch(batch)
+
+        if failed:
+            raise SNSBatchPublishError(f"{len(failed)} message(s) could not be published to SNS", failed)
+
+    def close(self) -> None:
+        """Stop any background flushing and publish every queued message."""
+        self._closed.set()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+        if self._flush_at_exit:
+            atexit.unregister(self._flush_at_shutdown)
+            self._flush_at_exit = False
+        self.flush()
+
+    def _take_batches(self, only_full: bool) -> list[list[SNSMessage]]:
+        """Remove messages from the queue, grouped into batches for a single topic. Must be called holding the lock."""
+        messages_by_topic: dict[str, list[SNSMessage]] = {}
+        for message in self._queue:
+            messages_by_topic.setdefault(message.topic_arn, []).append(message)
+
+        batches: list[list[SNSMessage]] = []
+        remaining: list[SNSMessage] = []
+        for messages in messages_by_topic.values():
+            for start in range(0, len(messages), SNS_PUBLISH_BATCH_MAXIMUM_SIZE):
+                batch = messages[start : start + SNS_PUBLISH_BATCH_MAXIMUM_SIZE]
+                if only_full and len(batch) < SNS_PUBLISH_BATCH_MAXIMUM_SIZE:
+                    remaining += batch
+                else:
+                    batches.append(batch)
+
+        self._queue = remaining
+        return batches
+
+    def _publish_batch(self, batch: list[SNSMessage]) -> list[SNSMessage]:
+        """
+        Publish a batch of messages for a single topic, retrying any which fail for reasons other than a fault in the
+        message itself.
+
+        :return: A list of the messages which could not be published
+        """
+        pending = dict(enumerate(batch))
+        failed: list[SNSMessage] = []
+        attempt = 0
+
+        while True:
+            retryable: dict[int, SNSMessage] = {}
+            permanently_failed: list[SNSMessage] = []
+
+            try:
+                response = self.client.publish_batch(
+                    TopicArn=batch[0].topic_arn,
+                    PublishBatchRequestEntries=[message.as_batch_entry(str(key)) for key, message in pending.items()],
+                )
+            except botocore.exceptions.ClientError as e:
+                logger.warning("Unable to publish batch of %s messages to SNS: %s", len(pending), e)
+                retryable = pending
+            else:
+                with self._lock:
+                    self.published_count += len(response.get("Successful", []))
+                for failure in response.get("Failed", []):
+                    message = pending[int(failure["Id"])]
+                    if failure.get("SenderFault"):
+                        logger.error(
+                            "SNS rejected message to %s: %s %s",
+                            message.topic_arn,
+                            failure.get("Code"),
+                            failure.get("Message"),
+                        )
+                        permanently_failed.append(message)
+                    else:
+                        retryable[int(failure["Id"])] = message
+
+            failed += permanently_failed
+
+            if retryable and attempt < self.max_retries:
+                time.sleep(self.retry_backoff * (2**attempt))
+                attempt += 1
+                pending = retryable
+                continue
+
+            failed += retryable.values()
+            with self._lock:
+                self.failed_messages += failed
+            return failed
+
+    def _flush_periodically(self, interval: float) -> None:
+        while not self._closed.wait(interval):
+            try:
+                self.flush()
+            except SNSBatchPublishError:
+                logger.exception("Background flush of SNS messages failed")
+
+    def _flush_at_shutdown(self) -> None:
+        try:
+            self.close()
+        except SNSBatchPublishError:
+            logger.exception("Unable to publish queued SNS messages at shutdown")
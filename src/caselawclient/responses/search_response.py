@@ -1,8 +1,25 @@
+import json
+from collections.abc import Iterable, Iterator
+from functools import cached_property
+from io import BytesIO
+from typing import TextIO
+
+from lxml import etree
+
 from caselawclient.Client import MarklogicApiClient
-from caselawclient.responses.search_result import SearchResult
+from caselawclient.responses.search_result import SearchResult, SearchResultRecord
 from caselawclient.xml_helpers import Element
 
 
+def _write_jsonl(results: Iterable[SearchResult], stream: TextIO) -> int:
+    count = 0
+    for result in results:
+        stream.write(json.dumps(result.as_record(), ensure_ascii=False))
+        stream.write("\n")
+        count += 1
+    return count
+
+
 class SearchResponse:
     """
     Represents a search response obtained from XML data.
@@ -31,10 +48,10 @@ class SearchResponse:
             self.node.xpath("//search:response/@total", namespaces=self.NAMESPACES)[0],
         )
 
-    @property
+    @cached_property
     def results(self) -> list[SearchResult]:
         """
-        Converts the SearchResponse to a list of SearchResult objects.
+        Converts the SearchResponse to a list of SearchResult objects. The list is built the first time it is needed.
 
         :return: The list of search results
         """
@@ -44,17 +61,143 @@ class SearchResponse:
         )
         return [SearchResult(result, self.client) for result in results]
 
+    def to_records(self) -> list[SearchResultRecord]:
+        """
+        Summarise every result as a dictionary which can be serialised to JSON. This is a convenience, which reads the
+        same single extraction pass as each result's properties do.
+
+        :return: A record for each result, in order
+        """
+        return [result.as_record() for result in self.results]
+
+    def to_jsonl(self, stream: TextIO) -> int:
+        """
+        Write a JSON record for every result to a stream, one per line.
+
+        :return: The number of records written
+        """
+        return _write_jsonl(self.results, stream)
+
     @property
     def facets(self) -> dict[str, str]:
         """
-        Returns search facets from the SearchResponse as a dictionary
+        Returns search facets from the SearchResponse as a dictionary. Values from every facet are combined, so if two
+        facets have a value with the same name only one count is kept; `named_facets` keeps them apart.
 
         :return: A flattened dictionary of search facet values
         """
-        # TODO: preserve the name of the facet (e.g. "court", "year")
         results = self.node.xpath(
             "//search:response/search:facet/search:facet-value",
             namespaces={"search": "http://marklogic.com/appservices/search"},
         )
         facets_dictionary = {result.attrib["name"]: result.attrib["count"] for result in results}
         return facets_dictionary
+
+    @property
+    def named_facets(self) -> dict[str, dict[str, int]]:
+        """
+        Returns search facets from the SearchResponse, grouped by the name of each facet (e.g. "court", "year").
+
+        :return: A dictionary of facet names to dictionaries of facet values and their counts
+        """
+        facets = self.node.xpath("//search:response/search:facet", namespaces=self.NAMESPACES)
+        return {
+            facet.attrib["name"]: {
+                value.attrib["name"]: int(value.attrib["count"])
+                for value in facet.xpath("search:facet-value", namespaces=self.NAMESPACES)
+            }
+            for facet in facets
+        }
+
+
+_SEARCH_NAMESPACE = SearchResponse.NAMESPACES["search"]
+_RESULT_TAG = f"{{{_SEARCH_NAMESPACE}}}result"
+_FACET_VALUE_TAG = f"{{{_SEARCH_NAMESPACE}}}facet-value"
+
+
+class StreamingSearchResponse:
+    """
+    Represents a search response which is parsed incrementally, rather than loaded into a single tree.
+
+    This has the same `total`, `results` and `facets` as `SearchResponse`, but `results` is an iterator which parses
+    one result at a time. Each result is detached from the response as it is yielded, so results which the caller has
+    finished with can be freed, and the tree never holds more than one result. This makes it suitable for export jobs
+    which request very large pages.
+    """
+
+    def __init__(self, content: bytes, client: MarklogicApiClient) -> None:
+        """
+        :param content: The search response XML, as returned by `MarklogicApiClient.search_and_decode_response`
+        """
+        self.content = content
+        self.client = client
+
+    def _iterparse(
+        self, events: tuple[str, ...], tag: str | tuple[str, ...] | None = None
+    ) -> Iterator[tuple[str, Element]]:
+        parsed_events: Iterator[tuple[str, Element]] = etree.iterparse(BytesIO(self.content), events=events, tag=tag)
+        return parsed_events
+
+    @cached_property
+    def total(self) -> int:
+        """
+        The total number of search results, read from the root element without parsing any further.
+
+        :return: The total number of search results
+        """
+        for _, response in self._iterparse(("start",)):
+            return int(response.attrib["total"])
+        raise ValueError("Search response is empty")
+
+    @property
+    def results(self) -> Iterator[SearchResult]:
+        """
+        Parse the search results one at a time. Each access starts a new pass over the response.
+
+        :return: An iterator of search results, in the order they appear in the response
+        """
+        for _, result in self._iterparse(("end",), tag=_RESULT_TAG):
+            parent = result.getparent()
+            if parent is not None:
+                parent.remove(result)
+            yield SearchResult(result, self.client)
+
+    def to_jsonl(self, stream: TextIO) -> int:
+        """
+        Write a JSON record for every result to a stream, one per line, parsing each result only as it is written.
+
+        :return: The number of records written
+        """
+        return _write_jsonl(self.results, stream)
+
+    @cached_property
+    def facets(self) -> dict[str, str]:
+        """
+        Returns search facets as a flattened dictionary, like `SearchResponse.facets`. The response is parsed without
+        building a tree, and only facet values are looked at, so reading the facets never holds any result in memory.
+
+        :return: A flattened dictionary of search facet values
+        """
+        collector = _FacetValueCollector()
+        etree.parse(BytesIO(self.content), etree.XMLParser(target=collector))
+        return collector.facets
+
+
+class _FacetValueCollector:
+    """An lxml parser target which keeps only the name and count of each facet value, and builds no tree."""
+
+    def __init__(self) -> None:
+        self.facets: dict[str, str] = {}
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        if tag == _FACET_VALUE_TAG:
+            self.facets[attrib["name"]] = attrib["count"]
+
+    def end(self, tag: str) -> None:
+        pass
+
+    def data(self, data: str) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
@@ -1,23 +1,26 @@
 import logging
 import os
+from copy import deepcopy
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from enum import Enum
-from functools import cached_property
-from typing import Any
+from typing import Any, TypedDict
 
 from dateutil import parser as dateparser
 from dateutil.parser import ParserError
-from ds_caselaw_utils.courts import Court, CourtNotFoundException, courts
-from ds_caselaw_utils.types import CourtCode, JurisdictionCode
+from ds_caselaw_utils.courts import Court
 from lxml import etree
 
 from caselawclient.Client import MarklogicApiClient
+from caselawclient.models.identifiers import Identifier
 from caselawclient.models.identifiers.collection import IdentifiersCollection
+from caselawclient.models.identifiers.exceptions import IdentifierValidationException
 from caselawclient.models.identifiers.neutral_citation import NeutralCitationNumber
-from caselawclient.models.identifiers.press_summary_ncn import PressSummaryRelatedNCNIdentifier
-from caselawclient.models.identifiers.unpacker import unpack_all_identifiers_from_etree
+from caselawclient.models.identifiers.unpacker import IDENTIFIER_NAMESPACE_MAP, unpack_all_identifiers_from_etree
+from caselawclient.models.utilities.courts import find_court
 from caselawclient.types import DocumentURIString
 from caselawclient.xml_helpers import Element, get_xpath_match_string
+from caselawclient.xquery_type_dicts import MarkLogicDocumentURIString
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +51,8 @@ class SearchResultMetadata:
     Represents the metadata of a search result.
     """
 
+    __slots__ = ("last_modified", "node")
+
     def __init__(self, node: Element, last_modified: str):
         self.node = node
         self.last_modified = last_modified
@@ -141,11 +146,31 @@ class SearchResultMetadata:
         return get_xpath_match_string(self.node, path, fallback=fallback)
 
 
+class SearchResultRecord(TypedDict):
+    """A JSON-serialisable summary of a search result, as produced by `SearchResult.as_record()`."""
+
+    uri: str
+    slug: str | None
+    neutral_citation: str | None
+    name: str
+    court_code: str
+    jurisdiction_code: str
+    court_name: str | None
+    date: str | None
+    transformation_date: str
+    content_hash: str
+
+
 class SearchResult:
     """
     Represents a search result obtained from XML data.
+
+    A search can return many results, so they use `__slots__` rather than a per-instance `__dict__`, and cache their
+    fields, identifiers and metadata in slots of their own.
     """
 
+    __slots__ = ("_fields", "_identifiers", "_metadata", "client", "node")
+
     NAMESPACES: dict[str, str] = {
         "search": "http://marklogic.com/appservices/search",
         "uk": "https://caselaw.nationalarchives.gov.uk/akn",
@@ -160,40 +185,59 @@ class SearchResult:
 
         self.node = node
         self.client = client
+        self._fields: SearchResultFields | None = None
+        self._identifiers: IdentifiersCollection | None = None
+        self._metadata: SearchResultMetadata | None = None
 
     def __repr__(self) -> str:
         try:
             slug = self.slug
-        except RuntimeError:
+        except (RuntimeError, IdentifierValidationException):
             slug = "**NO SLUG**"
         name = self.name or "**NO NAME**"
         return f"<SearchResult {self.uri} {slug} {name} {self.date}>"
 
+    @property
+    def fields(self) -> "SearchResultFields":
+        """
+        :return: The fields of this result which are read directly from its XML, extracted the first time any of them
+            is needed
+        """
+        if self._fields is None:
+            self._fields = SearchResultFields.from_node(self.node)
+        return self._fields
+
     @property
     def uri(self) -> DocumentURIString:
         """
         :return: The URI of the search result
         """
 
-        return DocumentURIString(
-            self._get_xpath_match_string("@uri").lstrip("/").split(".xml")[0],
-        )
+        return self.fields.uri
 
     @property
     def identifiers(self) -> IdentifiersCollection:
-        identifiers_etrees = self._get_xpath(".//identifiers")
-        count = len(identifiers_etrees)
-        if count != 1:
-            logger.warning("%s //identifiers nodes found in search result, expected 1.", count)
-        identifiers_etree = None if not identifiers_etrees else identifiers_etrees[0]
-        return unpack_all_identifiers_from_etree(identifiers_etree)
-
-    @cached_property
+        if self._identifiers is None:
+            identifiers_etrees = self._get_xpath(".//identifiers")
+            count = len(identifiers_etrees)
+            if count != 1:
+                logger.warning("%s //identifiers nodes found in search result, expected 1.", count)
+            identifiers_etree = None if not identifiers_etrees else identifiers_etrees[0]
+            self._identifiers = unpack_all_identifiers_from_etree(identifiers_etree)
+        return self._identifiers
+
+    @property
     def slug(self) -> str:
-        preferred = self.identifiers.preferred()
-        if not preferred:
+        """
+        :return: The URL slug of the preferred identifier of the search result
+
+        :raises IdentifierValidationException: The preferred identifier can't be converted to a URL slug
+        """
+        preferred = self.fields.preferred_identifier
+        if preferred is None:
             raise RuntimeError("No preferred identifier for search result")
-        return str(preferred.url_slug)
+        identifier_type, value = preferred
+        return str(identifier_type.schema.compile_identifier_url_slug(value))
 
     @property
     def neutral_citation(self) -> str | None:
@@ -201,13 +245,7 @@ class SearchResult:
         :return: If present, the value of preferred neutral citation of the document.
         """
 
-        preferred_ncn = self.identifiers.preferred(type=NeutralCitationNumber)
-
-        # If the result doesn't have a preferred NCN, maybe it has a preferred press summary related NCN?
-        if not preferred_ncn:
-            preferred_ncn = self.identifiers.preferred(type=PressSummaryRelatedNCNIdentifier)
-
-        return preferred_ncn.value if preferred_ncn else None
+        return self.fields.neutral_citation
 
     @property
     def name(self) -> str:
@@ -215,7 +253,7 @@ class SearchResult:
         :return: The title of the search result's document
         """
 
-        return self._get_xpath_match_string("search:extracted/akn:FRBRname/@value")
+        return self.fields.name
 
     @property
     def court(
@@ -225,16 +263,11 @@ class SearchResult:
         :return: The court of the search result
         """
         court: Court | None = None
-        court_code = self._get_xpath_match_string("search:extracted/uk:court/text()")
-        jurisdiction_code = self._get_xpath_match_string(
-            "search:extracted/uk:jurisdiction/text()",
-        )
+        court_code = self.fields.court_code
+        jurisdiction_code = self.fields.jurisdiction_code
         if jurisdiction_code:
-            try:
-                court = courts.get_court_with_jurisdiction_by_code(
-                    CourtCode(court_code), JurisdictionCode(jurisdiction_code)
-                )
-            except CourtNotFoundException:
+            court = find_court(court_code, jurisdiction_code)
+            if court is None:
                 logger.warning(
                     "Court not found with court code %s and jurisdiction code %s for judgment with NCN %s, falling back to court.",
                     court_code,
@@ -242,15 +275,13 @@ class SearchResult:
                     self.neutral_citation,
                 )
         if court is None:
-            try:
-                court = courts.get_by_code(CourtCode(court_code))
-            except CourtNotFoundException:
+            court = find_court(court_code)
+            if court is None:
                 logger.warning(
                     "Court not found with court code %s for judgment with NCN %s, returning None.",
                     court_code,
                     self.neutral_citation,
                 )
-                court = None
         return court
 
     @property
@@ -259,19 +290,7 @@ class SearchResult:
         :return: The date of the search result
         """
 
-        date_string = self._get_xpath_match_string(
-            "search:extracted/akn:FRBRdate[(@name='judgment' or @name='decision')]/@date",
-        )
-        try:
-            date = dateparser.parse(date_string)
-        except ParserError as e:
-            logger.warning(
-                'Unable to parse document date "%s". Full error: %s',
-                date_string,
-                e,
-            )
-            date = None
-        return date
+        return self.fields.date
 
     @property
     def transformation_date(self) -> str:
@@ -279,9 +298,7 @@ class SearchResult:
         :return: The transformation date of the search result
         """
 
-        return self._get_xpath_match_string(
-            "search:extracted/akn:FRBRdate[@name='transform']/@date",
-        )
+        return self.fields.transformation_date
 
     @property
     def content_hash(self) -> str:
@@ -289,7 +306,7 @@ class SearchResult:
         :return: The content hash of the search result
         """
 
-        return self._get_xpath_match_string("search:extracted/uk:hash/text()")
+        return self.fields.content_hash
 
     @property
     def matches(self) -> str:
@@ -301,18 +318,165 @@ class SearchResult:
         xslt_transform = etree.XSLT(etree.parse(file_path))
         return str(xslt_transform(self.node))
 
-    @cached_property
+    @property
     def metadata(self) -> SearchResultMetadata:
         """
         :return: A `SearchResultMetadata` instance representing the metadata of this result
         """
-        response_text = self.client.get_properties_for_search_results([self.uri])
-        last_modified = self.client.get_last_modified(self.uri)
-        root = etree.fromstring(response_text)
-        return SearchResultMetadata(root, last_modified)
+        if self._metadata is None:
+            response_text = self.client.get_properties_for_search_results([self.uri])
+            last_modified = self.client.get_last_modified(self.uri)
+            root = etree.fromstring(response_text)
+            self._metadata = SearchResultMetadata(root, last_modified)
+        return self._metadata
 
-    def _get_xpath_match_string(self, path: str) -> str:
-        return get_xpath_match_string(self.node, path, namespaces=self.NAMESPACES)
+    def as_record(self) -> SearchResultRecord:
+        """
+        Summarise this result as a dictionary which can be serialised to JSON. Every field, including the preferred
+        slug and neutral citation, comes from a single extraction pass over the result. If the preferred identifier
+        can't be converted to a slug, the slug is `None` so that one bad result doesn't stop a whole page.
+        """
+        fields = self.fields
+        try:
+            slug: str | None = self.slug
+        except RuntimeError:
+            slug = None
+        except IdentifierValidationException as e:
+            logger.warning("Unable to find the slug of search result %s: %s", fields.uri, e)
+            slug = None
+        court = self.court
+        return {
+            "uri": fields.uri,
+            "slug": slug,
+            "neutral_citation": fields.neutral_citation,
+            "name": fields.name,
+            "court_code": fields.court_code,
+            "jurisdiction_code": fields.jurisdiction_code,
+            "court_name": court.name if court else None,
+            "date": fields.date.isoformat() if fields.date else None,
+            "transformation_date": fields.transformation_date,
+            "content_hash": fields.content_hash,
+        }
+
+    @staticmethod
+    def prefetch_metadata(client: MarklogicApiClient, results: list["SearchResult"]) -> None:
+        """
+        Fetch the metadata for many search results in a single query, so that reading `metadata` for each of them
+        doesn't make two queries per result.
+
+        :param results: The search results to fetch metadata for. Results which already have their metadata are skipped.
+        """
+        pending = {result.uri: result for result in results if result._metadata is None}  # noqa: SLF001
+        if not pending:
+            return
+
+        root = etree.fromstring(client.get_properties_for_search_results(list(pending)))
+        for property_result in root.iterfind("property-result"):
+            uri = MarkLogicDocumentURIString(property_result.get("uri", "")).as_document_uri()
+            if uri in pending:
+                # SearchResultMetadata searches from the root of its tree, so each result needs a tree of its own
+                pending[uri]._metadata = SearchResultMetadata(  # noqa: SLF001
+                    deepcopy(property_result), property_result.get("last-modified", "")
+                )
 
     def _get_xpath(self, path: str) -> Any:
         return self.node.xpath(path, namespaces=self.NAMESPACES)
+
+
+def _compile_xpath(path: str) -> etree.XPath:
+    # Smart strings keep a reference to the node they came from, which would keep every result's tree alive
+    return etree.XPath(f"string({path})", namespaces=SearchResult.NAMESPACES, smart_strings=False)
+
+
+_URI_XPATH = _compile_xpath("@uri")
+_NAME_XPATH = _compile_xpath("search:extracted/akn:FRBRname/@value")
+_COURT_CODE_XPATH = _compile_xpath("search:extracted/uk:court/text()")
+_JURISDICTION_CODE_XPATH = _compile_xpath("search:extracted/uk:jurisdiction/text()")
+_DATE_XPATH = _compile_xpath("search:extracted/akn:FRBRdate[(@name='judgment' or @name='decision')]/@date")
+_TRANSFORMATION_DATE_XPATH = _compile_xpath("search:extracted/akn:FRBRdate[@name='transform']/@date")
+_CONTENT_HASH_XPATH = _compile_xpath("search:extracted/uk:hash/text()")
+_IDENTIFIER_NODES_XPATH = etree.XPath("(.//identifiers)[1]/identifier")
+
+
+def _preferred_identifier_and_neutral_citation(
+    node: Element,
+) -> tuple[tuple[type[Identifier], str] | None, str | None]:
+    """
+    Find the type and value of a search result's preferred identifier, and the value of its preferred neutral
+    citation, as `IdentifiersCollection.preferred` would, but without unpacking each identifier into an `Identifier`
+    first. The preferred identifier's slug is left to be compiled when it is needed, as that can fail for an
+    identifier which is not valid.
+    """
+    preferred: tuple[float, type[Identifier], str] | None = None
+    preferred_ncn: tuple[float, str] | None = None
+
+    for identifier_node in _IDENTIFIER_NODES_XPATH(node):
+        identifier_type = IDENTIFIER_NAMESPACE_MAP.get(identifier_node.findtext("namespace", ""))
+        if identifier_type is None:
+            continue
+        value = identifier_node.findtext("value", "")
+        # Scored in the same way as `Identifier.score`
+        deprecated = identifier_node.findtext("deprecated", "").lower() == "true"
+        score = 0.0 if deprecated else identifier_type.schema.base_score_multiplier
+
+        # Ties go to the first identifier, as sorting by score keeps them in order
+        if preferred is None or score > preferred[0]:
+            preferred = (score, identifier_type, value)
+        # Press summary related NCNs are neutral citations too, so are considered alongside them
+        if issubclass(identifier_type, NeutralCitationNumber) and (preferred_ncn is None or score > preferred_ncn[0]):
+            preferred_ncn = (score, value)
+
+    return (preferred[1], preferred[2]) if preferred else None, preferred_ncn[1] if preferred_ncn else None
+
+
+def _parse_date(date_string: str) -> datetime | None:
+    """
+    Parse a document date. Dates are almost always ISO 8601, which `datetime.fromisoformat` parses far faster than
+    dateutil, so dateutil is only used for anything else.
+    """
+    try:
+        return datetime.fromisoformat(date_string)
+    except ValueError:
+        pass
+
+    try:
+        return dateparser.parse(date_string)
+    except ParserError as e:
+        logger.warning(
+            'Unable to parse document date "%s". Full error: %s',
+            date_string,
+            e,
+        )
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class SearchResultFields:
+    """The fields of a search result which are read directly from its XML."""
+
+    uri: DocumentURIString
+    name: str
+    court_code: str
+    jurisdiction_code: str
+    date: datetime | None
+    transformation_date: str
+    content_hash: str
+    preferred_identifier: tuple[type[Identifier], str] | None
+    """ The type and value of the preferred identifier, from which `SearchResult.slug` is compiled. """
+    neutral_citation: str | None
+
+    @classmethod
+    def from_node(cls, node: Element) -> "SearchResultFields":
+        """Extract every field from a search result's XML in one pass, using precompiled XPaths."""
+        preferred_identifier, neutral_citation = _preferred_identifier_and_neutral_citation(node)
+        return cls(
+            uri=DocumentURIString(str(_URI_XPATH(node)).lstrip("/").split(".xml")[0]),
+            name=str(_NAME_XPATH(node)),
+            court_code=str(_COURT_CODE_XPATH(node)),
+            jurisdiction_code=str(_JURISDICTION_CODE_XPATH(node)),
+            date=_parse_date(str(_DATE_XPATH(node))),
+            transformation_date=str(_TRANSFORMATION_DATE_XPATH(node)),
+            content_hash=str(_CONTENT_HASH_XPATH(node)),
+            preferred_identifier=preferred_identifier,
+            neutral_citation=neutral_citation,
+        )
@@ -1,3 +1,4 @@
+import json
 import re
 from dataclasses import dataclass
 from typing import Any
@@ -54,6 +55,26 @@ class SearchParameters:
             "quoted_phrases": self._quoted_phrases,
         }
 
+    @property
+    def may_show_unpublished(self) -> bool:
+        """Could this search return unpublished documents, depending on who performs it?"""
+        return self.show_unpublished or self.only_unpublished
+
+    @property
+    def cache_key(self) -> str:
+        """
+        A key which is the same for any two sets of parameters which MarkLogic will treat as the same search.
+
+        Courts and collections are sorted, alternative court names are included and unset values take their defaults,
+        in the same way as `as_marklogic_payload`.
+        """
+        payload = self.as_marklogic_payload()
+        payload["court"] = sorted(court for court in payload["court"] or [] if court) or None
+        payload["collections"] = ",".join(
+            sorted(collection for collection in payload["collections"].split(",") if collection)
+        )
+        return json.dumps(payload, sort_keys=True, separators=(",", ":"))
+
     @property
     def _marklogic_collections(self) -> str:
         return ",".join(self.collections or []).replace(" ", "").replace(",,", ",")
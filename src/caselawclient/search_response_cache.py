@@ -0,0 +1,210 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Self
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SearchResponseCacheStats:
+    """A snapshot of how a `SearchResponseCache` has performed."""
+
+    hits: int
+    """ Searches answered from the cache with a response which was still fresh. """
+
+    stale_hits: int
+    """ Searches answered from the cache with a stale response, while a fresh one was fetched in the background. """
+
+    misses: int
+    """ Searches which were not in the cache, or whose response was too old to serve, so had to wait for MarkLogic. """
+
+    refresh_failures: int
+    """ Background refreshes which failed. The stale response is kept, and served until it expires. """
+
+    evictions: int
+    """ Entries removed to keep the cache within its maximum size. """
+
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / lookups if lookups else 0.0
+
+
+class SearchResponseCache:
+    """
+    A thread-safe, size-limited cache of search responses, keyed by `SearchParameters.cache_key`.
+
+    A response is fresh for `ttl` seconds. For a further `stale_ttl` seconds it is still served, but the first search
+    to see it stale starts fetching a fresh response in the background, so popular searches are never held up waiting
+    for MarkLogic once they are cached. Responses older than that are fetched again before being returned.
+
+    Concurrent searches for a response which isn't cached share a single fetch, rather than each asking MarkLogic.
+
+    Only searches which can't show unpublished documents should be cached here, because every user of the cache sees
+    the same responses.
+
+    Stale responses are refreshed on threads owned by the cache, so it should be closed once it is no longer needed,
+    either by calling `close()` or by using it as a context manager. The client it is given to does not close it.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1_000,
+        ttl: float = 60.0,
+        stale_ttl: float = 300.0,
+        refresh_workers: int = 2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param max_entries: The number of responses to keep before evicting the least recently used
+        :param ttl: How long a response is fresh for, in seconds
+        :param stale_ttl: How long a response may be served after it stops being fresh, in seconds
+        :param refresh_workers: The number of stale responses to refresh at once
+        :param clock: A source of the current time in seconds, which only needs to increase
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._refreshing: set[str] = set()
+        self._fetching: dict[str, Future[bytes]] = {}
+        self._generation = 0
+        self._refresh_executor = ThreadPoolExecutor(
+            max_workers=refresh_workers, thread_name_prefix="search-response-cache"
+        )
+
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._refresh_failures = 0
+        self._evictions = 0
+
+    def get_or_fetch(self, key: str, fetch: Callable[[], bytes]) -> bytes:
+        """
+        Return the cached response for a search, calling `fetch` to get it from MarkLogic if needed.
+
+        :param key: The search's `SearchParameters.cache_key`
+        :param fetch: Performs the search and returns its decoded response
+        """
+        now = self._clock()
+        with self._lock:
+            generation = self._generation
+            entry = self._entries.get(key)
+            if entry is not None:
+                fetched_at, content = entry
+                age = now - fetched_at
+                if age < self.ttl:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return content
+                if age < self.ttl + self.stale_ttl:
+                    self._entries.move_to_end(key)
+                    self._stale_hits += 1
+                    if key not in self._refreshing:
+                        self._refreshing.add(key)
+                        try:
+                            self._refresh_executor.submit(self._refresh, key, fetch, generation)
+                        except RuntimeError:
+                            # The cache has been closed, so the stale response is served without being refreshed
+                            self._refreshing.discard(key)
+                    return content
+            self._misses += 1
+            in_flight = self._fetching.get(key)
+            if in_flight is None:
+                in_flight = self._fetching[key] = Future()
+                fetching = True
+            else:
+                fetching = False
+
+        if not fetching:
+            return in_flight.result()
+
+        try:
+            content = fetch()
+        except BaseException as e:
+            self._stop_fetching(key, in_flight)
+            in_flight.set_exception(e)
+            raise
+        # Cache the response before the fetch stops being in flight, so a search arriving in between doesn't fetch again
+        self._put(key, content, generation)
+        self._stop_fetching(key, in_flight)
+        in_flight.set_result(content)
+        return content
+
+    def put(self, key: str, content: bytes) -> None:
+        with self._lock:
+            generation = self._generation
+        self._put(key, content, generation)
+
+    def _put(self, key: str, content: bytes, generation: int) -> None:
+        """Cache a response, unless the cache has been cleared since it was requested."""
+        fetched_at = self._clock()
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries.pop(key, None)
+            self._entries[key] = (fetched_at, content)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove every response. Responses which were already being fetched are not cached when they arrive."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._fetching.clear()
+
+    def close(self) -> None:
+        """Wait for any background refreshes to finish, and stop refreshing stale responses."""
+        self._refresh_executor.shutdown(wait=True)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def stats(self) -> SearchResponseCacheStats:
+        with self._lock:
+            return SearchResponseCacheStats(
+                hits=self._hits,
+                stale_hits=self._stale_hits,
+                misses=self._misses,
+                refresh_failures=self._refresh_failures,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+    def _stop_fetching(self, key: str, in_flight: Future[bytes]) -> None:
+        with self._lock:
+            if self._fetching.get(key) is in_flight:
+                del self._fetching[key]
+
+    def _refresh(self, key: str, fetch: Callable[[], bytes], generation: int) -> None:
+        try:
+            self._put(key, fetch(), generation)
+        except Exception as e:  # noqa: BLE001 - a failed refresh leaves the stale response to be served until it expires
+            logger.warning("Unable to refresh cached search response: %s", e)
+            with self._lock:
+                self._refresh_failures += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
@@ -4,6 +4,8 @@ from typing import Self, TypedDict
 
 from lxml import etree
 
+from caselawclient.xml_helpers import Element
+
 
 @dataclass
 class DocumentCategory:
@@ -115,6 +117,36 @@ class SuccessFailureMessageTuple(tuple[bool, list[str]]):
         return SuccessFailureMessageTuple(self.success and other.success, self.messages + other.messages)
 
 
+@dataclass(frozen=True)
+class PropertyWrite:
+    """
+    A single MarkLogic property to be set on a document as part of a batch; see `MarklogicApiClient.set_properties`.
+
+    The type of `value` determines how the property is stored, in the same way as the individual `set_property`,
+    `set_boolean_property`, `set_datetime_property` and `set_property_as_node` methods.
+    """
+
+    document_uri: DocumentURIString
+    name: str
+    value: str | bool | datetime | Element
+
+
+@dataclass(frozen=True)
+class DocumentSkeleton:
+    """
+    The parts of a document needed to materialise its metadata claims, without the rest of its body; see
+    `MarklogicApiClient.get_document_skeletons`.
+    """
+
+    uri: DocumentURIString
+
+    xml: bytes
+    """ The document's root element, containing only its `<meta>` and `<header>`. """
+
+    metadata_fields: Element | None
+    """ The document's `metadata_fields` property, if it has one. """
+
+
 def SuccessTuple() -> SuccessFailureMessageTuple:
     return SuccessFailureMessageTuple(True, [])
 
@@ -67,6 +67,11 @@ class GetComponentsForDocumentDict(MarkLogicAPIDict):
     parent_uri: DocumentURIString
 
 
+# get_document_skeletons.xqy
+class GetDocumentSkeletonsDict(MarkLogicAPIDict):
+    uris: list[Any]
+
+
 # get_judgment.xqy
 class GetJudgmentDict(MarkLogicAPIDict):
     search_query: Optional[str]
@@ -93,6 +98,7 @@ class GetLastModifiedDict(MarkLogicAPIDict):
 
 # get_missing_fclid.xqy
 class GetMissingFclidDict(MarkLogicAPIDict):
+    after_uri: Optional[MarkLogicDocumentURIString]
     maximum_records: Optional[int]
 
 
@@ -105,6 +111,13 @@ class GetPendingEnrichmentForVersionDict(MarkLogicAPIDict):
     target_parser_minor_version: int
 
 
+# get_pending_metadata_materialisation.xqy
+class GetPendingMetadataMaterialisationDict(MarkLogicAPIDict):
+    after_uri: Optional[MarkLogicDocumentURIString]
+    current_version: str
+    maximum_records: Optional[int]
+
+
 # get_pending_parse_for_version_count.xqy
 class GetPendingParseForVersionCountDict(MarkLogicAPIDict):
     target_major_version: int
@@ -135,6 +148,12 @@ class GetPropertyAsNodeDict(MarkLogicAPIDict):
     uri: MarkLogicDocumentURIString
 
 
+# get_property_as_node_for_documents.xqy
+class GetPropertyAsNodeForDocumentsDict(MarkLogicAPIDict):
+    name: str
+    uris: list[Any]
+
+
 # get_version_annotation.xqy
 class GetVersionAnnotationDict(MarkLogicAPIDict):
     uri: MarkLogicDocumentURIString
@@ -158,6 +177,26 @@ class ListJudgmentVersionsDict(MarkLogicAPIDict):
     uri: MarkLogicDocumentURIString
 
 
+# list_judgment_versions_detailed.xqy
+class ListJudgmentVersionsDetailedDict(MarkLogicAPIDict):
+    include_size: Optional[bool]
+    uri: MarkLogicDocumentURIString
+
+
+# move_document.xqy
+class MoveDocumentDict(MarkLogicAPIDict):
+    content_with_id: str
+    content_with_xml: str
+    content_without_id: str
+    new_uri: MarkLogicDocumentURIString
+    old_uri: MarkLogicDocumentURIString
+
+
+# reserve_document_sequence_numbers.xqy
+class ReserveDocumentSequenceNumbersDict(MarkLogicAPIDict):
+    count: int
+
+
 # resolve_from_identifier_slug.xqy
 class ResolveFromIdentifierSlugDict(MarkLogicAPIDict):
     identifier_slug: DocumentIdentifierSlug
@@ -170,6 +209,18 @@ class ResolveFromIdentifierValueDict(MarkLogicAPIDict):
     published_only: Optional[int]
 
 
+# resolve_many_from_identifier_slugs.xqy
+class ResolveManyFromIdentifierSlugsDict(MarkLogicAPIDict):
+    identifier_slugs: list[Any]
+    published_only: Optional[int]
+
+
+# resolve_many_from_identifier_values.xqy
+class ResolveManyFromIdentifierValuesDict(MarkLogicAPIDict):
+    identifier_values: list[Any]
+    published_only: Optional[int]
+
+
 # restore_version.xqy
 class RestoreVersionDict(MarkLogicAPIDict):
     annotation: str
@@ -229,6 +280,11 @@ class SetMetadataWorkExpressionDateDict(MarkLogicAPIDict):
     uri: MarkLogicDocumentURIString
 
 
+# set_properties.xqy
+class SetPropertiesDict(MarkLogicAPIDict):
+    documents: list[Any]
+
+
 # set_property.xqy
 class SetPropertyDict(MarkLogicAPIDict):
     name: str
@@ -181,6 +181,16 @@ class ApiClientTest(unittest.TestCase):
             "document_exists.xqy",
         )
 
+    @patch("caselawclient.Client.MarklogicApiClient._eval_and_decode")
+    def test_reserve_document_sequence_numbers(self, mock_decode):
+        mock_decode.return_value = "110"
+        assert self.client.reserve_document_sequence_numbers(10) == range(101, 111)
+        mock_decode.assert_called_with({"count": 10}, "reserve_document_sequence_numbers.xqy")
+
+    def test_reserve_no_document_sequence_numbers(self):
+        with pytest.raises(ValueError):
+            self.client.reserve_document_sequence_numbers(0)
+
     @patch("caselawclient.Client.Path")
     def test_eval_calls_request(self, MockPath):
         mock_path_instance = MockPath.return_value
@@ -1,6 +1,7 @@
 import json
 import os
 import unittest
+from datetime import UTC, datetime
 from unittest.mock import patch
 
 from caselawclient.Client import ROOT_DIR, MarklogicApiClient
@@ -58,3 +59,65 @@ class TestGetJudgment(unittest.TestCase):
 
             assert mock_eval.call_args.args[0] == (os.path.join(ROOT_DIR, "xquery", "list_judgment_versions.xqy"))
             assert mock_eval.call_args.kwargs["vars"] == json.dumps(expected_vars)
+
+    def test_list_versions_detailed(self):
+        annotation = {"type": "edit", "calling_function": "f", "calling_agent": "a", "automated": False}
+        raw_versions = [
+            json.dumps(
+                {
+                    "uri": "/ewca/civ/2004/632_xml_versions/1-632.xml",
+                    "created": "2024-01-01T10:00:00.123456Z",
+                    "annotation": "Not structured",
+                    "size": 100,
+                },
+            ),
+            json.dumps(
+                {
+                    "uri": "/ewca/civ/2004/632_xml_versions/2-632.xml",
+                    "created": "2024-02-01T10:00:00.5+00:00",
+                    "annotation": json.dumps(annotation),
+                    "size": 120,
+                },
+            ),
+        ]
+        with (
+            patch.object(self.client, "eval") as mock_eval,
+            patch(
+                "caselawclient.Client.get_multipart_strings_from_marklogic_response",
+                return_value=raw_versions,
+            ),
+        ):
+            versions = self.client.list_versions_detailed(DocumentURIString("ewca/civ/2004/632"), include_size=True)
+
+            assert mock_eval.call_args.args[0] == (
+                os.path.join(ROOT_DIR, "xquery", "list_judgment_versions_detailed.xqy")
+            )
+            assert mock_eval.call_args.kwargs["vars"] == json.dumps(
+                {"uri": "/ewca/civ/2004/632.xml", "include_size": True},
+            )
+
+        assert versions == [
+            {
+                "uri": "ewca/civ/2004/632_xml_versions/2-632",
+                "version": 2,
+                "created": datetime(2024, 2, 1, 10, 0, 0, 500000, tzinfo=UTC),
+                "annotation": annotation,
+                "size": 120,
+            },
+            {
+                "uri": "ewca/civ/2004/632_xml_versions/1-632",
+                "version": 1,
+                "created": datetime(2024, 1, 1, 10, 0, 0, 123456, tzinfo=UTC),
+                "annotation": None,
+                "size": 100,
+            },
+        ]
+
+    def test_list_versions_detailed_does_not_include_size_by_default(self):
+        with patch.object(self.client, "eval") as mock_eval:
+            mock_eval.return_value.content = b""
+            assert self.client.list_versions_detailed(DocumentURIString("ewca/civ/2004/632")) == []
+
+            assert mock_eval.call_args.kwargs["vars"] == json.dumps(
+                {"uri": "/ewca/civ/2004/632.xml", "include_size": False},
+            )
@@ -0,0 +1,35 @@
+import json
+import os
+from unittest.mock import patch
+
+from caselawclient.Client import ROOT_DIR, MarklogicApiClient
+from caselawclient.types import DocumentURIString
+
+
+class TestGetMissingFclid:
+    def setup_method(self):
+        self.client = MarklogicApiClient("", "", "", False)
+
+    def test_get_missing_fclid(self):
+        with (
+            patch.object(self.client, "eval") as mock_eval,
+            patch("caselawclient.Client.get_multipart_strings_from_marklogic_response") as mock_decode,
+        ):
+            mock_decode.return_value = ["/uksc/2025/2.xml", "/uksc/2025/3.xml"]
+
+            result = self.client.get_missing_fclid(maximum_records=2, after_uri=DocumentURIString("uksc/2025/1"))
+
+            assert result == ["/uksc/2025/2.xml", "/uksc/2025/3.xml"]
+            assert mock_eval.call_args.args[0] == os.path.join(ROOT_DIR, "xquery", "get_missing_fclid.xqy")
+            assert json.loads(mock_eval.call_args.kwargs["vars"]) == {
+                "maximum_records": 2,
+                "after_uri": "/uksc/2025/1.xml",
+            }
+
+    def test_get_missing_fclid_from_the_start(self):
+        with (
+            patch.object(self.client, "eval") as mock_eval,
+            patch("caselawclient.Client.get_multipart_strings_from_marklogic_response", return_value=[]),
+        ):
+            assert self.client.get_missing_fclid() == []
+            assert json.loads(mock_eval.call_args.kwargs["vars"]) == {"maximum_records": 50, "after_uri": None}
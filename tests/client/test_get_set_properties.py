@@ -4,9 +4,12 @@ from datetime import UTC, datetime
 from unittest.mock import ANY, patch
 
 import pytest
+from lxml import etree
 
 from caselawclient.Client import ROOT_DIR, MarklogicApiClient
+from caselawclient.errors import DocumentNotFoundError
 from caselawclient.models.documents import DocumentURIString
+from caselawclient.types import PropertyWrite
 
 
 class TestGetSetStringDocumentProperties:
@@ -190,3 +193,144 @@ class TestGetSetDatetimeDocumentProperties:
             pytest.raises(ValueError, match="my-property must be timezone-aware"),
         ):
             self.client.get_datetime_property(DocumentURIString("judgment/uri"), "my-property")
+
+
+class TestSetProperties:
+    """Test cases for setting many document properties in a single request."""
+
+    def setup_method(self):
+        self.client = MarklogicApiClient("", "", "", False)
+
+    def test_set_properties(self):
+        with patch.object(self.client, "eval") as mock_eval:
+            self.client.set_properties(
+                [
+                    PropertyWrite(DocumentURIString("a/1"), "name", "value"),
+                    PropertyWrite(DocumentURIString("a/1"), "published", True),
+                    PropertyWrite(DocumentURIString("a/2"), "when", datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC)),
+                    PropertyWrite(DocumentURIString("a/2"), "node", etree.fromstring("<root><child/></root>")),
+                ]
+            )
+
+            mock_eval.assert_called_with(
+                os.path.join(ROOT_DIR, "xquery", "set_properties.xqy"),
+                vars=json.dumps(
+                    {
+                        "documents": [
+                            {
+                                "uri": "/a/1.xml",
+                                "properties": [
+                                    {"name": "name", "value": "value", "type": "string"},
+                                    {"name": "published", "value": "true", "type": "boolean"},
+                                ],
+                            },
+                            {
+                                "uri": "/a/2.xml",
+                                "properties": [
+                                    {"name": "when", "value": "2025-01-02T03:04:05+00:00", "type": "datetime"},
+                                    {"name": "node", "value": "<root><child/></root>", "type": "node"},
+                                ],
+                            },
+                        ]
+                    }
+                ),
+                accept_header="application/xml",
+                timeout=ANY,
+            )
+
+    def test_set_properties_keeps_last_value_for_repeated_property(self):
+        with patch.object(self.client, "eval") as mock_eval:
+            self.client.set_properties(
+                [
+                    PropertyWrite(DocumentURIString("a/1"), "published", True),
+                    PropertyWrite(DocumentURIString("a/1"), "name", "value"),
+                    PropertyWrite(DocumentURIString("a/1"), "published", False),
+                ]
+            )
+
+            (document,) = json.loads(mock_eval.call_args.kwargs["vars"])["documents"]
+            assert [(p["name"], p["value"]) for p in document["properties"]] == [
+                ("name", "value"),
+                ("published", "false"),
+            ]
+
+    def test_set_properties_groups_writes_to_one_document_together(self):
+        """
+        Given several writes to each of two documents, interleaved as a bulk publish makes them,
+        When `Client.set_properties` is called,
+        Then each document appears once in the payload, with all of its properties, so it is updated only once.
+        """
+        when = datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC)
+        with patch.object(self.client, "eval") as mock_eval:
+            self.client.set_properties(
+                [
+                    write
+                    for uri in ("a/1", "a/2")
+                    for write in (
+                        PropertyWrite(DocumentURIString(uri), "published", True),
+                        PropertyWrite(DocumentURIString(uri), "first_published_datetime", when),
+                        PropertyWrite(DocumentURIString(uri), "latest_published_datetime", when),
+                    )
+                ]
+                + [PropertyWrite(DocumentURIString("a/1"), "last_sent_to_enrichment", when)]
+            )
+
+            documents = json.loads(mock_eval.call_args.kwargs["vars"])["documents"]
+            assert [(document["uri"], [p["name"] for p in document["properties"]]) for document in documents] == [
+                (
+                    "/a/1.xml",
+                    ["published", "first_published_datetime", "latest_published_datetime", "last_sent_to_enrichment"],
+                ),
+                ("/a/2.xml", ["published", "first_published_datetime", "latest_published_datetime"]),
+            ]
+
+    def test_set_properties_with_nothing_to_write(self):
+        with patch.object(self.client, "eval") as mock_eval:
+            assert self.client.set_properties([]) is None
+            mock_eval.assert_not_called()
+
+    def test_set_properties_raises_if_a_document_is_not_managed(self):
+        """
+        Given a write to a document which does not exist or is not DLS-managed (FCL-DOCUMENTNOTFOUND),
+        When `Client.set_properties` is called,
+        Then a DocumentNotFoundError is raised.
+        """
+        with patch.object(self.client, "_send_to_eval") as mock_send_to_eval:
+            mock_send_to_eval.side_effect = DocumentNotFoundError
+            with pytest.raises(DocumentNotFoundError):
+                self.client.set_properties([PropertyWrite(DocumentURIString("a/1"), "name", "value")])
+
+    def test_set_properties_rejects_naive_datetime(self):
+        with pytest.raises(ValueError, match="when must be timezone-aware"):
+            self.client.set_properties([PropertyWrite(DocumentURIString("a/1"), "when", datetime(2025, 1, 2))])
+
+
+class TestGetPropertyAsNodeForDocuments:
+    def setup_method(self):
+        self.client = MarklogicApiClient("", "", "", False)
+
+    def test_get_property_as_node_for_documents(self):
+        with (
+            patch.object(self.client, "eval") as mock_eval,
+            patch("caselawclient.Client.get_multipart_strings_from_marklogic_response") as mock_decode,
+        ):
+            mock_decode.return_value = [
+                '<property-result uri="/a/1.xml"><identifiers><identifier/></identifiers></property-result>',
+                '<property-result uri="/a/2.xml"/>',
+            ]
+
+            result = self.client.get_property_as_node_for_documents(
+                [DocumentURIString("a/1"), DocumentURIString("a/2")], "identifiers"
+            )
+
+            assert mock_eval.call_args.args[0] == os.path.join(
+                ROOT_DIR, "xquery", "get_property_as_node_for_documents.xqy"
+            )
+            assert json.loads(mock_eval.call_args.kwargs["vars"]) == {
+                "uris": ["/a/1.xml", "/a/2.xml"],
+                "name": "identifiers",
+            }
+
+        assert list(result) == ["a/1", "a/2"]
+        assert etree.tostring(result[DocumentURIString("a/1")]) == b"<identifiers><identifier/></identifiers>"
+        assert result[DocumentURIString("a/2")] is None
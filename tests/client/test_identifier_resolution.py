@@ -1,5 +1,14 @@
-from caselawclient.identifier_resolution import IdentifierResolutions
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from caselawclient.Client import ROOT_DIR, MarklogicApiClient
+from caselawclient.identifier_resolution import IdentifierResolutionCache, IdentifierResolutions
 from caselawclient.models.identifiers.neutral_citation import NeutralCitationNumber
+from caselawclient.types import DocumentIdentifierSlug, DocumentIdentifierValue, DocumentURIString, PropertyWrite
+from caselawclient.xquery_type_dicts import MarkLogicDocumentURIString
 
 raw_marklogic_resolutions = [
     """
@@ -35,7 +44,286 @@ def test_decoded_identifier():
     assert res.document_published == False
 
 
+def test_decoded_identifiers_share_namespace_strings():
+    first, second = IdentifierResolutions.from_marklogic_output(raw_marklogic_resolutions)
+    assert first.identifier_namespace is second.identifier_namespace
+
+
 def test_published():
     decoded_resolutions = IdentifierResolutions.from_marklogic_output(raw_marklogic_resolutions)
     assert len(decoded_resolutions.published()) == 1
     assert decoded_resolutions.published()[0] == decoded_resolutions[1]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return IdentifierResolutionCache(max_entries=3, ttl=60, negative_ttl=5, clock=clock)
+
+
+@pytest.fixture
+def resolutions():
+    return IdentifierResolutions.from_marklogic_output(raw_marklogic_resolutions)
+
+
+class TestIdentifierResolutionCache:
+    def test_miss_then_hit(self, cache, resolutions):
+        assert cache.get("slug", "uksc/2025/123", True) is None
+        cache.put("slug", "uksc/2025/123", True, resolutions)
+
+        assert cache.get("slug", "uksc/2025/123", True) == resolutions
+        assert cache.get("slug", "uksc/2025/123", False) is None
+        assert cache.get("value", "uksc/2025/123", True) is None
+
+        stats = cache.stats
+        assert (stats.hits, stats.misses, stats.size) == (1, 3, 1)
+        assert stats.hit_ratio == 0.25
+
+    def test_cached_resolutions_cannot_be_changed_by_callers(self, cache, resolutions):
+        cache.put("slug", "uksc/2025/123", True, resolutions)
+        cache.get("slug", "uksc/2025/123", True).clear()
+        resolutions.clear()
+
+        assert len(cache.get("slug", "uksc/2025/123", True)) == 2
+
+    def test_entries_expire(self, cache, clock, resolutions):
+        cache.put("slug", "found", True, resolutions)
+        cache.put("slug", "missing", True, IdentifierResolutions())
+
+        clock.now = 10
+        assert cache.get("slug", "missing", True) is None
+        assert cache.get("slug", "found", True) == resolutions
+
+        clock.now = 60
+        assert cache.get("slug", "found", True) is None
+        assert cache.stats.size == 0
+
+    def test_negative_entries(self, cache):
+        cache.put("slug", "missing", True, IdentifierResolutions())
+
+        assert cache.get("slug", "missing", True) == []
+        assert cache.stats.negative_hits == 1
+        assert cache.stats.hits == 0
+
+    def test_least_recently_used_entry_is_evicted(self, cache, resolutions):
+        for slug in ["a", "b", "c"]:
+            cache.put("slug", slug, True, resolutions)
+        cache.get("slug", "a", True)
+        cache.put("slug", "d", True, resolutions)
+
+        assert cache.get("slug", "b", True) is None
+        assert cache.get("slug", "a", True) is not None
+        assert cache.stats.evictions == 1
+
+    def test_invalidate_document(self, cache, resolutions):
+        cache.put("slug", "ewca/civ/2003/54721", True, IdentifierResolutions(resolutions[:1]))
+        cache.put("value", "[2025] UKSC 123", True, IdentifierResolutions(resolutions[1:]))
+        cache.put("slug", "missing", True, IdentifierResolutions())
+
+        cache.invalidate_document(MarkLogicDocumentURIString("/ewca/civ/2003/547.xml"))
+
+        assert cache.get("slug", "ewca/civ/2003/54721", True) is None
+        assert cache.get("slug", "missing", True) is None
+        assert cache.get("value", "[2025] UKSC 123", True) is not None
+        assert cache.stats.invalidations == 2
+
+    def test_clear(self, cache, resolutions):
+        cache.put("slug", "a", True, resolutions)
+        cache.clear()
+
+        assert cache.get("slug", "a", True) is None
+
+
+class TestClientIdentifierResolutionCache:
+    def setup_method(self):
+        self.cache = IdentifierResolutionCache()
+        self.client = MarklogicApiClient("", "", "", False, identifier_resolution_cache=self.cache)
+
+    @patch("caselawclient.Client.get_multipart_strings_from_marklogic_response", return_value=raw_marklogic_resolutions)
+    def test_slug_resolution_is_cached(self, mock_decode):
+        with patch.object(self.client, "eval") as mock_eval:
+            first = self.client.resolve_from_identifier_slug(DocumentIdentifierSlug("uksc/2025/123"))
+            second = self.client.resolve_from_identifier_slug(DocumentIdentifierSlug("uksc/2025/123"))
+
+            assert first == second
+            mock_eval.assert_called_once()
+
+    @patch("caselawclient.Client.get_multipart_strings_from_marklogic_response", return_value=[])
+    def test_value_miss_is_cached(self, mock_decode):
+        with patch.object(self.client, "eval") as mock_eval:
+            self.client.resolve_from_identifier_value(DocumentIdentifierValue("[2025] UKSC 999"))
+            assert self.client.resolve_from_identifier_value(DocumentIdentifierValue("[2025] UKSC 999")) == []
+
+            mock_eval.assert_called_once()
+            assert self.cache.stats.negative_hits == 1
+
+    @pytest.mark.parametrize(
+        ("kind", "key", "resolve"),
+        [
+            (
+                "slug",
+                "uksc/2025/123",
+                lambda client, key, **kwargs: client.resolve_from_identifier_slug(
+                    DocumentIdentifierSlug(key), **kwargs
+                ),
+            ),
+            (
+                "value",
+                "[2025] UKSC 123",
+                lambda client, key, **kwargs: client.resolve_from_identifier_value(
+                    DocumentIdentifierValue(key), **kwargs
+                ),
+            ),
+        ],
+        ids=["slug", "value"],
+    )
+    @patch("caselawclient.Client.get_multipart_strings_from_marklogic_response", return_value=raw_marklogic_resolutions)
+    def test_resolution_can_bypass_cache(self, mock_decode, kind, key, resolve):
+        """
+        Given a stale cached resolution which says an identifier is unused,
+        When resolving that identifier without the cache,
+        Then MarkLogic is asked, the fresh resolutions are returned and the cache is refreshed with them.
+        """
+        self.cache.put(kind, key, False, IdentifierResolutions())
+
+        with patch.object(self.client, "eval") as mock_eval:
+            assert resolve(self.client, key, published_only=False) == []
+            mock_eval.assert_not_called()
+
+            resolutions = resolve(self.client, key, published_only=False, use_cache=False)
+            mock_eval.assert_called_once()
+
+        assert len(resolutions) == 2
+        assert self.cache.get(kind, key, False) == resolutions
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda client, uri: client.set_boolean_property(uri, "published", False),
+            lambda client, uri: client.set_property(uri, "identifiers", ""),
+            lambda client, uri: client.set_properties([PropertyWrite(uri, "published", True)]),
+            lambda client, uri: client.delete_judgment(uri),
+            lambda client, uri: client.move_document(uri, DocumentURIString("uksc/2025/124")),
+        ],
+    )
+    def test_changes_invalidate_resolutions(self, change):
+        resolutions = IdentifierResolutions.from_marklogic_output(raw_marklogic_resolutions)
+        self.cache.put("slug", "uksc/2025/123", True, resolutions)
+
+        with patch.object(self.client, "eval"):
+            change(self.client, DocumentURIString("uksc/2025/123"))
+
+        assert self.cache.get("slug", "uksc/2025/123", True) is None
+
+    def test_other_properties_do_not_invalidate_resolutions(self):
+        resolutions = IdentifierResolutions.from_marklogic_output(raw_marklogic_resolutions)
+        self.cache.put("slug", "uksc/2025/123", True, resolutions)
+
+        with patch.object(self.client, "eval"):
+            self.client.set_property(DocumentURIString("uksc/2025/123"), "assigned-to", "someone")
+
+        assert self.cache.get("slug", "uksc/2025/123", True) is not None
+
+
+class TestResolveMany:
+    def setup_method(self):
+        self.client = MarklogicApiClient("", "", "", False)
+
+    @patch("caselawclient.Client.get_multipart_strings_from_marklogic_response", return_value=raw_marklogic_resolutions)
+    def test_resolve_many_slugs(self, mock_decode):
+        with patch.object(self.client, "eval") as mock_eval:
+            result = self.client.resolve_many_slugs(
+                [
+                    DocumentIdentifierSlug("uksc/2025/123"),
+                    DocumentIdentifierSlug("ewca/civ/2003/54721"),
+                    DocumentIdentifierSlug("uksc/2025/123"),
+                    DocumentIdentifierSlug("missing"),
+                ],
+                published_only=False,
+            )
+
+            mock_eval.assert_called_once()
+            assert mock_eval.call_args.args[0] == os.path.join(
+                ROOT_DIR, "xquery", "resolve_many_from_identifier_slugs.xqy"
+            )
+            assert json.loads(mock_eval.call_args.kwargs["vars"]) == {
+                "identifier_slugs": ["uksc/2025/123", "ewca/civ/2003/54721", "missing"],
+                "published_only": 0,
+            }
+
+        assert list(result) == ["uksc/2025/123", "ewca/civ/2003/54721", "missing"]
+        assert [r.document_uri for r in result[DocumentIdentifierSlug("uksc/2025/123")]] == ["/uksc/2025/123.xml"]
+        assert [r.document_uri for r in result[DocumentIdentifierSlug("ewca/civ/2003/54721")]] == [
+            "/ewca/civ/2003/547.xml"
+        ]
+        assert result[DocumentIdentifierSlug("missing")] == []
+
+    @patch("caselawclient.Client.get_multipart_strings_from_marklogic_response", return_value=raw_marklogic_resolutions)
+    def test_resolve_many_values(self, mock_decode):
+        with patch.object(self.client, "eval") as mock_eval:
+            result = self.client.resolve_many_values([DocumentIdentifierValue("[2025] UKSC 123")])
+
+            assert mock_eval.call_args.args[0] == os.path.join(
+                ROOT_DIR, "xquery", "resolve_many_from_identifier_values.xqy"
+            )
+            assert json.loads(mock_eval.call_args.kwargs["vars"]) == {
+                "identifier_values": ["[2025] UKSC 123"],
+                "published_only": 1,
+            }
+
+        assert [r.identifier_value for r in result[DocumentIdentifierValue("[2025] UKSC 123")]] == ["[2025] UKSC 123"]
+
+    @patch("caselawclient.Client.IDENTIFIER_RESOLUTION_BATCH_SIZE", 2)
+    @patch("caselawclient.Client.get_multipart_strings_from_marklogic_response", return_value=[])
+    def test_large_requests_are_split(self, mock_decode):
+        with patch.object(self.client, "eval") as mock_eval:
+            result = self.client.resolve_many_slugs([DocumentIdentifierSlug(f"slug/{n}") for n in range(5)])
+
+            batches = [json.loads(call.kwargs["vars"])["identifier_slugs"] for call in mock_eval.call_args_list]
+            assert batches == [["slug/0", "slug/1"], ["slug/2", "slug/3"], ["slug/4"]]
+        assert len(result) == 5
+
+    def test_empty_request_does_not_query(self):
+        with patch.object(self.client, "eval") as mock_eval:
+            assert self.client.resolve_many_slugs([]) == {}
+            mock_eval.assert_not_called()
+
+    @patch("caselawclient.Client.get_multipart_strings_from_marklogic_response", return_value=[])
+    def test_uses_and_fills_cache(self, mock_decode):
+        cache = IdentifierResolutionCache()
+        cache.put("slug", "uksc/2025/123", True, IdentifierResolutions.from_marklogic_output(raw_marklogic_resolutions))
+        self.client.identifier_resolution_cache = cache
+
+        with patch.object(self.client, "eval") as mock_eval:
+            result = self.client.resolve_many_slugs(
+                [DocumentIdentifierSlug("uksc/2025/123"), DocumentIdentifierSlug("missing")]
+            )
+
+            assert json.loads(mock_eval.call_args.kwargs["vars"])["identifier_slugs"] == ["missing"]
+        assert len(result[DocumentIdentifierSlug("uksc/2025/123")]) == 2
+        assert cache.get("slug", "missing", True) == []
+
+    @patch("caselawclient.Client.get_multipart_strings_from_marklogic_response", return_value=[])
+    def test_can_bypass_cache(self, mock_decode):
+        cache = IdentifierResolutionCache()
+        cache.put("value", "[2025] UKSC 123", False, IdentifierResolutions())
+        self.client.identifier_resolution_cache = cache
+
+        with patch.object(self.client, "eval") as mock_eval:
+            self.client.resolve_many_values(
+                [DocumentIdentifierValue("[2025] UKSC 123")], published_only=False, use_cache=False
+            )
+
+            assert json.loads(mock_eval.call_args.kwargs["vars"])["identifier_values"] == ["[2025] UKSC 123"]
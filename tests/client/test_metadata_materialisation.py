@@ -0,0 +1,79 @@
+import json
+import os
+from unittest.mock import patch
+
+from caselawclient.Client import ROOT_DIR, MarklogicApiClient
+from caselawclient.types import DocumentURIString
+
+
+class TestGetPendingMetadataMaterialisation:
+    def setup_method(self):
+        self.client = MarklogicApiClient("", "", "", False)
+
+    def test_get_pending_metadata_materialisation(self):
+        with (
+            patch.object(self.client, "eval") as mock_eval,
+            patch("caselawclient.Client.get_multipart_strings_from_marklogic_response") as mock_decode,
+        ):
+            mock_decode.return_value = ["/uksc/2025/2.xml", "/uksc/2025/3.xml"]
+
+            result = self.client.get_pending_metadata_materialisation(
+                "version", after_uri=DocumentURIString("uksc/2025/1"), maximum_records=2
+            )
+
+            assert result == ["uksc/2025/2", "uksc/2025/3"]
+            assert mock_eval.call_args.args[0] == (
+                os.path.join(ROOT_DIR, "xquery", "get_pending_metadata_materialisation.xqy")
+            )
+            assert json.loads(mock_eval.call_args.kwargs["vars"]) == {
+                "current_version": "version",
+                "after_uri": "/uksc/2025/1.xml",
+                "maximum_records": 2,
+            }
+
+    def test_get_pending_metadata_materialisation_from_the_start(self):
+        with (
+            patch.object(self.client, "eval") as mock_eval,
+            patch("caselawclient.Client.get_multipart_strings_from_marklogic_response", return_value=[]),
+        ):
+            assert self.client.get_pending_metadata_materialisation("version") == []
+            assert json.loads(mock_eval.call_args.kwargs["vars"])["after_uri"] is None
+
+
+class TestGetDocumentSkeletons:
+    def setup_method(self):
+        self.client = MarklogicApiClient("", "", "", False)
+
+    def test_get_document_skeletons(self):
+        with (
+            patch.object(self.client, "eval") as mock_eval,
+            patch("caselawclient.Client.get_multipart_strings_from_marklogic_response") as mock_decode,
+        ):
+            mock_decode.return_value = [
+                (
+                    '<document-skeleton uri="/uksc/2025/1.xml">'
+                    '<akomaNtoso xmlns="http://docs.oasis-open.org/legaldocml/ns/akn/3.0"><judgment><meta/></judgment>'
+                    "</akomaNtoso><metadata_fields><field/></metadata_fields></document-skeleton>"
+                ),
+                (
+                    '<document-skeleton uri="/uksc/2025/2.xml">'
+                    '<akomaNtoso xmlns="http://docs.oasis-open.org/legaldocml/ns/akn/3.0"><judgment/></akomaNtoso>'
+                    "</document-skeleton>"
+                ),
+            ]
+
+            skeletons = self.client.get_document_skeletons(
+                [DocumentURIString("uksc/2025/1"), DocumentURIString("uksc/2025/2")]
+            )
+
+            assert mock_eval.call_args.args[0] == os.path.join(ROOT_DIR, "xquery", "get_document_skeletons.xqy")
+            assert json.loads(mock_eval.call_args.kwargs["vars"]) == {
+                "uris": ["/uksc/2025/1.xml", "/uksc/2025/2.xml"],
+            }
+
+            assert [skeleton.uri for skeleton in skeletons] == ["uksc/2025/1", "uksc/2025/2"]
+            assert skeletons[0].xml.startswith(b"<akomaNtoso")
+            assert b"<meta/>" in skeletons[0].xml
+            assert skeletons[0].metadata_fields is not None
+            assert len(skeletons[0].metadata_fields) == 1
+            assert skeletons[1].metadata_fields is None
@@ -182,3 +182,19 @@ class TestSaveCopyDeleteJudgment(unittest.TestCase):
 
             assert mock_eval.call_args.args[0] == (os.path.join(ROOT_DIR, "xquery", "copy_document.xqy"))
             assert mock_eval.call_args.kwargs["vars"] == json.dumps(expected_vars)
+
+    def test_move_document(self):
+        with patch.object(self.client, "eval") as mock_eval:
+            old_uri = DocumentURIString("judgment/old_uri")
+            new_uri = DocumentURIString("ewhc/2023/1")
+            expected_vars = {
+                "old_uri": "/judgment/old_uri.xml",
+                "new_uri": "/ewhc/2023/1.xml",
+                "content_with_id": "https://caselaw.nationalarchives.gov.uk/id/ewhc/2023/1",
+                "content_without_id": "https://caselaw.nationalarchives.gov.uk/ewhc/2023/1",
+                "content_with_xml": "https://caselaw.nationalarchives.gov.uk/ewhc/2023/1/data.xml",
+            }
+            self.client.move_document(old_uri, new_uri)
+
+            assert mock_eval.call_args.args[0] == (os.path.join(ROOT_DIR, "xquery", "move_document.xqy"))
+            assert mock_eval.call_args.kwargs["vars"] == json.dumps(expected_vars)
@@ -2,6 +2,7 @@ from unittest.mock import patch
 
 from caselawclient.Client import MarklogicApiClient
 from caselawclient.search_parameters import SearchParameters
+from caselawclient.search_response_cache import SearchResponseCache
 
 
 class TestSearchAndDecodeResponse:
@@ -73,3 +74,42 @@ class TestSearchAndDecodeResponse:
             )
 
             assert search_response == valid_search_response_xml
+
+
+class TestSearchAndDecodeResponseWithCache:
+    def setup_method(self):
+        self.cache = SearchResponseCache()
+        self.client = MarklogicApiClient(
+            host="",
+            username="",
+            password="",
+            use_https=False,
+            user_agent="marklogic-api-client-test",
+            search_response_cache=self.cache,
+        )
+
+    def teardown_method(self):
+        self.cache.close()
+
+    def test_equivalent_searches_share_a_response(self, valid_search_response_xml, generate_mock_search_response):
+        with patch.object(self.client, "advanced_search") as mock_advanced_search:
+            mock_advanced_search.return_value = generate_mock_search_response(valid_search_response_xml)
+
+            first = self.client.search_and_decode_response(SearchParameters(court="ewhc/qb,uksc"))
+            second = self.client.search_and_decode_response(SearchParameters(court="UKSC, ewhc/kb", page=0))
+
+            assert first == second == valid_search_response_xml
+            mock_advanced_search.assert_called_once()
+
+    def test_searches_which_may_show_unpublished_documents_are_not_cached(
+        self, valid_search_response_xml, generate_mock_search_response
+    ):
+        with patch.object(self.client, "advanced_search") as mock_advanced_search:
+            mock_advanced_search.return_value = generate_mock_search_response(valid_search_response_xml)
+
+            self.client.search_and_decode_response(SearchParameters(show_unpublished=True))
+            self.client.search_and_decode_response(SearchParameters(show_unpublished=True))
+            self.client.search_and_decode_response(SearchParameters(only_unpublished=True))
+
+            assert mock_advanced_search.call_count == 3
+            assert self.cache.stats.size == 0
@@ -120,3 +120,37 @@ class TestSearchParametersToMarklogicData:
         payload = search_parameters.as_marklogic_payload()
         assert payload["quoted_phrases"] == expected
         assert payload["q"] == test_input
+
+
+class TestSearchParametersCacheKey:
+    @pytest.mark.parametrize(
+        "first, second",
+        [
+            [SearchParameters(), SearchParameters(query=None, page=0, collections=[])],
+            [SearchParameters(court="uksc,ewca/civ"), SearchParameters(court="EWCA/Civ, UKSC")],
+            [SearchParameters(court="ewhc/qb"), SearchParameters(court="ewhc/kb,ewhc/qb")],
+            [
+                SearchParameters(collections=["judgment", "press-summary"]),
+                SearchParameters(collections=["press-summary", "judgment"]),
+            ],
+        ],
+    )
+    def test_equivalent_searches_have_the_same_key(self, first, second):
+        assert first.cache_key == second.cache_key
+
+    @pytest.mark.parametrize(
+        "first, second",
+        [
+            [SearchParameters(query="tax"), SearchParameters(query="Tax")],
+            [SearchParameters(court="uksc"), SearchParameters(court="ukpc")],
+            [SearchParameters(page=1), SearchParameters(page=2)],
+            [SearchParameters(), SearchParameters(show_unpublished=True)],
+        ],
+    )
+    def test_different_searches_have_different_keys(self, first, second):
+        assert first.cache_key != second.cache_key
+
+    def test_may_show_unpublished(self):
+        assert not SearchParameters().may_show_unpublished
+        assert SearchParameters(show_unpublished=True).may_show_unpublished
+        assert SearchParameters(only_unpublished=True).may_show_unpublished
@@ -1,8 +1,12 @@
 from unittest.mock import Mock
 
+import pytest
 from lxml import etree
 
 from caselawclient.client_helpers.search_helpers import (
+    iter_search,
+    search_and_stream_response,
+    search_facets,
     search_judgments_and_parse_response,
 )
 from caselawclient.search_parameters import SearchParameters
@@ -52,3 +56,94 @@ def test_search_judgments_and_parse_results(
     assert etree.tostring(search_response.node) == etree.tostring(
         etree.fromstring(search_response_xml),
     )
+
+
+def test_search_and_stream_response(generate_search_response_xml, valid_search_result_xml):
+    mock_api_client = Mock()
+    search_response_xml = generate_search_response_xml(2 * valid_search_result_xml)
+    mock_api_client.search_and_decode_response.return_value = search_response_xml
+    search_parameters = SearchParameters(query="test query", page_size=1000)
+
+    search_response = search_and_stream_response(mock_api_client, search_parameters)
+
+    mock_api_client.search_and_decode_response.assert_called_once_with(search_parameters)
+    assert search_response.total == 2
+    assert len(list(search_response.results)) == 2
+
+
+def test_search_facets(generate_search_response_xml, valid_facets_fixture_xml):
+    mock_api_client = Mock()
+    mock_api_client.search_and_decode_response.return_value = generate_search_response_xml("", valid_facets_fixture_xml)
+    search_parameters = SearchParameters(court="uksc", page=3, page_size=50)
+
+    search_response = search_facets(mock_api_client, search_parameters)
+
+    (facets_parameters,) = mock_api_client.search_and_decode_response.call_args.args
+    assert facets_parameters.as_marklogic_payload()["page-size"] == 0
+    assert facets_parameters.as_marklogic_payload()["page"] == 1
+    assert facets_parameters.court == "uksc"
+    assert search_parameters.page_size == 50
+    assert search_response.total == 2
+    assert search_response.results == []
+    assert search_response.named_facets["court"]["EAT"] == 649
+
+
+def _search_response_xml(total: int, uris: list[str]) -> bytes:
+    results = "".join(f'<search:result uri="/{uri}.xml"/>' for uri in uris)
+    return (
+        f'<search:response xmlns:search="http://marklogic.com/appservices/search" total="{total}">'
+        f"{results}"
+        "</search:response>"
+    ).encode()
+
+
+class TestIterSearch:
+    def setup_method(self):
+        self.pages = {
+            1: _search_response_xml(5, ["a/1", "a/2"]),
+            2: _search_response_xml(5, ["a/3", "a/4"]),
+            3: _search_response_xml(5, ["a/5"]),
+        }
+        self.api_client = Mock()
+        self.api_client.search_and_decode_response.side_effect = lambda parameters: self.pages[parameters.page]
+
+    @pytest.mark.parametrize("prefetch", [0, 1, 2, 5])
+    def test_yields_every_result_in_order(self, prefetch):
+        search_parameters = SearchParameters(query="test query", page_size=2)
+
+        results = list(iter_search(self.api_client, search_parameters, prefetch=prefetch))
+
+        assert [result.uri for result in results] == ["a/1", "a/2", "a/3", "a/4", "a/5"]
+        requested_pages = [call.args[0].page for call in self.api_client.search_and_decode_response.call_args_list]
+        assert sorted(requested_pages) == [1, 2, 3]
+        assert search_parameters.page == 1
+
+    def test_starts_from_the_given_page(self):
+        results = list(iter_search(self.api_client, SearchParameters(page=2, page_size=2)))
+
+        assert [result.uri for result in results] == ["a/3", "a/4", "a/5"]
+
+    def test_stops_at_an_empty_page(self):
+        self.pages[2] = _search_response_xml(5, [])
+
+        results = list(iter_search(self.api_client, SearchParameters(page_size=2), prefetch=0))
+
+        assert [result.uri for result in results] == ["a/1", "a/2"]
+        assert self.api_client.search_and_decode_response.call_count == 2
+
+    def test_hydrates_metadata_for_each_page(self):
+        self.api_client.get_properties_for_search_results.side_effect = lambda uris: (
+            "<property-results>"
+            + "".join(
+                f'<property-result uri="/{uri}.xml" last-modified="2025-01-01T00:00:00Z">'
+                f"<source-name>{uri}</source-name></property-result>"
+                for uri in uris
+            )
+            + "</property-results>"
+        )
+
+        results = list(iter_search(self.api_client, SearchParameters(page_size=2), hydrate_metadata=True))
+
+        assert [result.metadata.author for result in results] == ["a/1", "a/2", "a/3", "a/4", "a/5"]
+        assert self.api_client.get_properties_for_search_results.call_count == 3
+        self.api_client.get_last_modified.assert_not_called()
@@ -143,5 +143,8 @@ def mock_api_client():
     mock_client.get_property_as_node.return_value = None
     mock_client.get_next_document_sequence_number.return_value = 1
     mock_client.resolve_from_identifier_value.return_value = IdentifierResolutionsFactory.build()
+    mock_client.resolve_many_values.side_effect = lambda identifier_values, published_only=True, use_cache=True: {
+        value: IdentifierResolutionsFactory.build() for value in identifier_values
+    }
 
     return mock_client
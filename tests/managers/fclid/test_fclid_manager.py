@@ -0,0 +1,141 @@
+from lxml import etree
+
+from caselawclient.errors import MarklogicCommunicationError
+from caselawclient.managers import fclid
+from caselawclient.models.identifiers.collection import IdentifiersCollection
+from caselawclient.models.identifiers.fclid import FindCaseLawIdentifier, sqids
+from caselawclient.models.identifiers.neutral_citation import NeutralCitationNumber
+from caselawclient.models.identifiers.unpacker import unpack_all_identifiers_from_etree
+from caselawclient.types import DocumentURIString
+
+
+def pages(*pages):
+    """Return each page of MarkLogic URIs in turn, followed by an empty page."""
+    return [[f"/{uri}.xml" for uri in page] for page in pages] + [[]]
+
+
+def identifiers_etree(*identifiers):
+    collection = IdentifiersCollection()
+    for identifier in identifiers:
+        collection.add(identifier)
+    return collection.as_etree
+
+
+def no_identifiers(uris, name):
+    return {uri: None for uri in uris}
+
+
+def written_identifiers(mock_api_client):
+    return {
+        write.document_uri: unpack_all_identifiers_from_etree(write.value)
+        for call in mock_api_client.set_properties.call_args_list
+        for write in call.args[0]
+    }
+
+
+class TestBackfillFCLIDs:
+    def test_assigns_fclids_to_every_document(self, mock_api_client):
+        mock_api_client.get_missing_fclid.side_effect = pages(["a/1", "a/2"], ["a/3"])
+        mock_api_client.get_property_as_node_for_documents.side_effect = lambda uris, name: {
+            uri: identifiers_etree(NeutralCitationNumber(value="[2025] UKSC 1")) if uri == "a/1" else None
+            for uri in uris
+        }
+        mock_api_client.reserve_document_sequence_numbers.return_value = range(1, 101)
+
+        progress = fclid.backfill_fclids(mock_api_client, page_size=2)
+
+        assert progress.assigned_uris == ["a/1", "a/2", "a/3"]
+        assert progress.failed_uris == []
+        assert [call.kwargs["after_uri"] for call in mock_api_client.get_missing_fclid.call_args_list] == [
+            None,
+            "a/2",
+            "a/3",
+        ]
+
+        written = written_identifiers(mock_api_client)
+        assert set(written) == {"a/1", "a/2", "a/3"}
+        assert [
+            identifier.value for identifier in written[DocumentURIString("a/1")].of_type(NeutralCitationNumber)
+        ] == ["[2025] UKSC 1"]
+        minted = [
+            sqids.decode(identifiers.of_type(FindCaseLawIdentifier)[0].value)[0] for identifiers in written.values()
+        ]
+        assert sorted(minted) == [1, 2, 3]
+
+        mock_api_client.reserve_document_sequence_numbers.assert_called_once()
+        mock_api_client.get_next_document_sequence_number.assert_not_called()
+
+    def test_identifiers_are_fetched_and_written_in_batches(self, mock_api_client):
+        uris = [f"a/{n:03}" for n in range(fclid.IDENTIFIER_BATCH_SIZE + 1)]
+        mock_api_client.get_missing_fclid.side_effect = pages(uris)
+        mock_api_client.get_property_as_node_for_documents.side_effect = no_identifiers
+        mock_api_client.reserve_document_sequence_numbers.return_value = range(1, 101)
+
+        fclid.backfill_fclids(mock_api_client)
+
+        batch_sizes = sorted(
+            len(call.args[0]) for call in mock_api_client.get_property_as_node_for_documents.call_args_list
+        )
+        assert batch_sizes == [1, fclid.IDENTIFIER_BATCH_SIZE]
+        assert mock_api_client.set_properties.call_count == 2
+
+    def test_documents_which_already_have_an_fclid_are_skipped(self, mock_api_client):
+        mock_api_client.get_missing_fclid.side_effect = pages(["a/1"])
+        mock_api_client.get_property_as_node_for_documents.return_value = {
+            "a/1": identifiers_etree(FindCaseLawIdentifier(value="bcdfghjk"))
+        }
+
+        progress = fclid.backfill_fclids(mock_api_client)
+
+        assert progress.assigned_uris == []
+        assert progress.failed_uris == []
+        mock_api_client.set_properties.assert_not_called()
+        mock_api_client.reserve_document_sequence_numbers.assert_not_called()
+
+    def test_dry_run(self, mock_api_client):
+        mock_api_client.get_missing_fclid.side_effect = pages(["a/1", "a/2"])
+        mock_api_client.get_property_as_node_for_documents.side_effect = no_identifiers
+        reported = []
+
+        progress = fclid.backfill_fclids(
+            mock_api_client, dry_run=True, on_progress=lambda progress: reported.append(progress.assigned_count)
+        )
+
+        assert progress.dry_run is True
+        assert progress.assigned_uris == ["a/1", "a/2"]
+        assert reported == [2]
+        mock_api_client.reserve_document_sequence_numbers.assert_not_called()
+        mock_api_client.set_properties.assert_not_called()
+
+    def test_invalid_identifiers_fail_only_that_document(self, mock_api_client):
+        mock_api_client.get_missing_fclid.side_effect = pages(["a/1", "a/2"])
+        mock_api_client.get_property_as_node_for_documents.return_value = {
+            "a/1": etree.fromstring("<identifiers><identifier><value>x</value></identifier></identifiers>"),
+            "a/2": None,
+        }
+        mock_api_client.reserve_document_sequence_numbers.return_value = range(1, 101)
+
+        progress = fclid.backfill_fclids(mock_api_client)
+
+        assert progress.assigned_uris == ["a/2"]
+        assert progress.failed_uris == ["a/1"]
+
+    def test_failed_write_fails_the_batch(self, mock_api_client):
+        mock_api_client.get_missing_fclid.side_effect = pages(["a/1", "a/2"])
+        mock_api_client.get_property_as_node_for_documents.side_effect = no_identifiers
+        mock_api_client.reserve_document_sequence_numbers.return_value = range(1, 101)
+        mock_api_client.set_properties.side_effect = MarklogicCommunicationError()
+
+        progress = fclid.backfill_fclids(mock_api_client)
+
+        assert progress.assigned_uris == []
+        assert progress.failed_uris == ["a/1", "a/2"]
+
+    def test_stops_after_maximum_documents(self, mock_api_client):
+        mock_api_client.get_missing_fclid.side_effect = pages(["a/1", "a/2"], ["a/3"])
+        mock_api_client.get_property_as_node_for_documents.side_effect = no_identifiers
+
+        progress = fclid.backfill_fclids(mock_api_client, dry_run=True, maximum_documents=2)
+
+        assert progress.after_uri == "a/2"
+        assert mock_api_client.get_missing_fclid.call_count == 1
@@ -0,0 +1,155 @@
+from unittest.mock import patch
+
+from lxml import etree
+
+from caselawclient.Client import MarklogicApiClient
+from caselawclient.errors import MarklogicCommunicationError
+from caselawclient.factories import build_document_body_xml
+from caselawclient.managers import materialisation
+from caselawclient.managers.materialisation import MaterialisationCheckpoint
+from caselawclient.models.documents.metadata.materialisation import (
+    CURRENT_METADATA_MATERIALISATION_VERSION,
+    LATEST_METADATA_MATERIALISATION_VERSION_PROPERTY,
+)
+from caselawclient.types import DocumentSkeleton, DocumentURIString
+
+
+def skeleton(uri, name="Body Title"):
+    return DocumentSkeleton(
+        uri=DocumentURIString(uri),
+        xml=build_document_body_xml(name=name, court="UKSC").encode("utf-8"),
+        metadata_fields=None,
+    )
+
+
+def pages(*pages):
+    """Return each page of pending URIs in turn, followed by an empty page."""
+    return [[DocumentURIString(uri) for uri in page] for page in pages] + [[]]
+
+
+def skeletons_for(uris):
+    return [skeleton(uri) for uri in uris]
+
+
+class TestMaterialisationCheckpoint:
+    def test_load_missing_checkpoint(self, tmp_path):
+        assert MaterialisationCheckpoint.load(tmp_path / "checkpoint.json") == MaterialisationCheckpoint()
+
+    def test_save_and_load(self, tmp_path):
+        path = tmp_path / "checkpoint.json"
+        checkpoint = MaterialisationCheckpoint(DocumentURIString("a/2"), 2, [DocumentURIString("a/1")])
+
+        checkpoint.save(path)
+
+        assert MaterialisationCheckpoint.load(path) == checkpoint
+        assert [p.name for p in tmp_path.iterdir()] == ["checkpoint.json"]
+
+
+class TestBackfillMetadataMaterialisation:
+    def test_materialises_every_pending_document(self, mock_api_client):
+        mock_api_client.get_pending_metadata_materialisation.side_effect = pages(["a/1", "a/2"], ["a/3"])
+        mock_api_client.get_document_skeletons.side_effect = skeletons_for
+
+        checkpoint = materialisation.backfill_metadata_materialisation(mock_api_client, page_size=2)
+
+        assert checkpoint == MaterialisationCheckpoint(DocumentURIString("a/3"), 3, [])
+        after_uris = [
+            call.kwargs["after_uri"] for call in mock_api_client.get_pending_metadata_materialisation.call_args_list
+        ]
+        assert after_uris == [None, "a/2", "a/3"]
+
+        writes = [write for call in mock_api_client.set_properties.call_args_list for write in call.args[0]]
+        assert {write.document_uri for write in writes} == {"a/1", "a/2", "a/3"}
+        version_writes = [write for write in writes if write.name == LATEST_METADATA_MATERIALISATION_VERSION_PROPERTY]
+        assert len(version_writes) == 3
+        assert all(write.value == CURRENT_METADATA_MATERIALISATION_VERSION for write in version_writes)
+
+        fields_write = next(write for write in writes if write.name == "metadata_fields")
+        assert b"Body Title" in etree.tostring(fields_write.value)
+
+    def test_documents_are_fetched_and_written_in_batches(self, mock_api_client):
+        uris = [f"a/{n:03}" for n in range(materialisation.SKELETON_BATCH_SIZE + 1)]
+        mock_api_client.get_pending_metadata_materialisation.side_effect = pages(uris)
+        mock_api_client.get_document_skeletons.side_effect = skeletons_for
+
+        materialisation.backfill_metadata_materialisation(mock_api_client)
+
+        batch_sizes = sorted(len(call.args[0]) for call in mock_api_client.get_document_skeletons.call_args_list)
+        assert batch_sizes == [1, materialisation.SKELETON_BATCH_SIZE]
+        assert mock_api_client.set_properties.call_count == 2
+
+    def test_each_document_is_updated_once(self, mock_api_client):
+        client = MarklogicApiClient("", "", "", False)
+        mock_api_client.get_pending_metadata_materialisation.side_effect = pages(["a/1", "a/2"])
+        mock_api_client.get_document_skeletons.side_effect = skeletons_for
+        mock_api_client.set_properties.side_effect = client.set_properties
+
+        with patch.object(client, "_send_to_eval") as mock_send_to_eval:
+            materialisation.backfill_metadata_materialisation(mock_api_client)
+
+        documents = mock_send_to_eval.call_args.args[0]["documents"]
+        assert [(document["uri"], [p["name"] for p in document["properties"]]) for document in documents] == [
+            ("/a/1.xml", ["metadata_fields", LATEST_METADATA_MATERIALISATION_VERSION_PROPERTY]),
+            ("/a/2.xml", ["metadata_fields", LATEST_METADATA_MATERIALISATION_VERSION_PROPERTY]),
+        ]
+
+    def test_failed_document_does_not_stop_the_others(self, mock_api_client):
+        mock_api_client.get_pending_metadata_materialisation.side_effect = pages(["a/1", "a/2"])
+        mock_api_client.get_document_skeletons.return_value = [
+            skeleton("a/1"),
+            DocumentSkeleton(DocumentURIString("a/2"), b"<not-xml", None),
+        ]
+
+        checkpoint = materialisation.backfill_metadata_materialisation(mock_api_client)
+
+        assert checkpoint.materialised_count == 1
+        assert checkpoint.failed_uris == ["a/2"]
+        writes = mock_api_client.set_properties.call_args.args[0]
+        assert {write.document_uri for write in writes} == {"a/1"}
+
+    def test_failed_write_fails_the_batch(self, mock_api_client):
+        mock_api_client.get_pending_metadata_materialisation.side_effect = pages(["a/1", "a/2"])
+        mock_api_client.get_document_skeletons.side_effect = skeletons_for
+        mock_api_client.set_properties.side_effect = MarklogicCommunicationError()
+
+        checkpoint = materialisation.backfill_metadata_materialisation(mock_api_client)
+
+        assert checkpoint == MaterialisationCheckpoint(DocumentURIString("a/2"), 0, ["a/1", "a/2"])
+
+    def test_missing_documents_are_failed(self, mock_api_client):
+        mock_api_client.get_pending_metadata_materialisation.side_effect = pages(["a/1", "a/2"])
+        mock_api_client.get_document_skeletons.return_value = [skeleton("a/1")]
+
+        checkpoint = materialisation.backfill_metadata_materialisation(mock_api_client)
+
+        assert checkpoint.failed_uris == ["a/2"]
+
+    def test_resumes_from_checkpoint(self, mock_api_client, tmp_path):
+        path = tmp_path / "checkpoint.json"
+        MaterialisationCheckpoint(DocumentURIString("a/2"), 2, [DocumentURIString("a/1")]).save(path)
+        mock_api_client.get_pending_metadata_materialisation.side_effect = pages(["a/3"])
+        mock_api_client.get_document_skeletons.side_effect = skeletons_for
+
+        checkpoint = materialisation.backfill_metadata_materialisation(mock_api_client, checkpoint_path=path)
+
+        assert mock_api_client.get_pending_metadata_materialisation.call_args_list[0].kwargs["after_uri"] == "a/2"
+        assert checkpoint == MaterialisationCheckpoint(DocumentURIString("a/3"), 3, ["a/1"])
+        assert MaterialisationCheckpoint.load(path) == checkpoint
+
+    @patch.object(MaterialisationCheckpoint, "save")
+    def test_saves_checkpoint_after_each_page(self, save, mock_api_client, tmp_path):
+        mock_api_client.get_pending_metadata_materialisation.side_effect = pages(["a/1"], ["a/2"])
+        mock_api_client.get_document_skeletons.side_effect = skeletons_for
+
+        materialisation.backfill_metadata_materialisation(mock_api_client, checkpoint_path=tmp_path / "checkpoint.json")
+
+        assert save.call_count == 2
+
+    def test_stops_after_maximum_documents(self, mock_api_client):
+        mock_api_client.get_pending_metadata_materialisation.side_effect = pages(["a/1", "a/2"], ["a/3"])
+        mock_api_client.get_document_skeletons.side_effect = skeletons_for
+
+        checkpoint = materialisation.backfill_metadata_materialisation(mock_api_client, maximum_documents=2)
+
+        assert checkpoint.after_uri == "a/2"
+        assert mock_api_client.get_pending_metadata_materialisation.call_count == 1
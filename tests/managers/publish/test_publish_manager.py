@@ -0,0 +1,181 @@
+import datetime
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+from caselawclient.errors import MarklogicCommunicationError
+from caselawclient.managers import publish
+from caselawclient.models.documents import Document
+from caselawclient.models.documents.exceptions import CannotPublishUnpublishableDocument
+from caselawclient.models.utilities.aws import announce_document_event
+from caselawclient.models.utilities.sns import SNSBatchPublisher, SNSBatchPublishError, SNSMessage
+from caselawclient.types import DocumentURIString, PropertyWrite
+
+
+def mock_document(uri, first_published=None, enriched_recently=False, can_enrich=True):
+    document = Mock(spec=Document)
+    document.uri = uri
+    document.first_published_datetime = first_published
+    document.enriched_recently = enriched_recently
+    document.can_enrich = can_enrich
+    return document
+
+
+@pytest.fixture
+def publisher():
+    publisher = Mock(spec=SNSBatchPublisher)
+    publisher.failed_messages = []
+    return publisher
+
+
+@patch("caselawclient.managers.publish.announce_document_event")
+@patch("caselawclient.managers.publish.publish_documents")
+class TestPublishMany:
+    def test_publishes_all_documents(self, mock_publish_documents, mock_announce, mock_api_client, publisher):
+        uris = [DocumentURIString("a/1"), DocumentURIString("a/2")]
+        documents = {
+            uris[0]: mock_document(uris[0]),
+            uris[1]: mock_document(
+                uris[1], first_published=datetime.datetime(2020, 1, 1, tzinfo=datetime.UTC), enriched_recently=True
+            ),
+        }
+        mock_api_client.get_document_by_uri.side_effect = documents.get
+
+        results = publish.publish_many(mock_api_client, uris, concurrency=2, publisher=publisher)
+
+        assert [result.uri for result in results] == uris
+        assert all(result.success for result in results)
+        assert set(results[0].timings) == {"load", "validate", "assets", "properties", "announce"}
+        for document in documents.values():
+            document.assert_is_publishable.assert_called_once()
+            document.assign_fclid_if_missing.assert_called_once()
+        assert sorted(call.args[0] for call in mock_publish_documents.call_args_list) == uris
+
+        mock_api_client.set_properties.assert_called_once()
+        writes = mock_api_client.set_properties.call_args.args[0]
+        assert [(write.document_uri, write.name) for write in writes] == [
+            ("a/1", "published"),
+            ("a/1", "first_published_datetime"),
+            ("a/1", "latest_published_datetime"),
+            ("a/1", "last_sent_to_enrichment"),
+            ("a/2", "published"),
+            ("a/2", "latest_published_datetime"),
+        ]
+
+        assert [call.kwargs["status"] for call in mock_announce.call_args_list] == ["publish", "enrich", "publish"]
+        assert all(call.kwargs["publisher"] is publisher for call in mock_announce.call_args_list)
+        publisher.flush.assert_called_once()
+        assert results[0].enrichment_requested is True
+        assert results[1].enrichment_requested is False
+
+    def test_unpublishable_document_is_skipped(self, mock_publish_documents, mock_announce, mock_api_client, publisher):
+        uris = [DocumentURIString("a/1"), DocumentURIString("a/2")]
+        unpublishable = mock_document(uris[0])
+        unpublishable.assert_is_publishable.side_effect = CannotPublishUnpublishableDocument("nope")
+        documents = {uris[0]: unpublishable, uris[1]: mock_document(uris[1])}
+        mock_api_client.get_document_by_uri.side_effect = documents.get
+
+        results = publish.publish_many(mock_api_client, uris, publisher=publisher)
+
+        assert isinstance(results[0].error, CannotPublishUnpublishableDocument)
+        assert results[1].success
+        mock_publish_documents.assert_called_once_with("a/2")
+        writes = mock_api_client.set_properties.call_args.args[0]
+        assert {write.document_uri for write in writes} == {"a/2"}
+        assert {call.kwargs["uri"] for call in mock_announce.call_args_list} == {"a/2"}
+
+    def test_property_writes_are_batched(self, mock_publish_documents, mock_announce, mock_api_client, publisher):
+        uris = [DocumentURIString(f"a/{n}") for n in range(5)]
+        mock_api_client.get_document_by_uri.side_effect = mock_document
+
+        with patch.object(publish, "PROPERTY_WRITE_BATCH_SIZE", 2):
+            results = publish.publish_many(mock_api_client, uris, publisher=publisher)
+
+        assert mock_api_client.set_properties.call_count == 3
+        assert all(result.success for result in results)
+
+    def test_failed_property_batch_is_not_announced(
+        self, mock_publish_documents, mock_announce, mock_api_client, publisher
+    ):
+        mock_api_client.get_document_by_uri.side_effect = mock_document
+        mock_api_client.set_properties.side_effect = MarklogicCommunicationError("MarkLogic is down")
+
+        results = publish.publish_many(mock_api_client, [DocumentURIString("a/1")], publisher=publisher)
+
+        assert isinstance(results[0].error, MarklogicCommunicationError)
+        mock_announce.assert_not_called()
+
+    def test_failed_announcement_is_recorded(self, mock_publish_documents, mock_announce, mock_api_client, publisher):
+        mock_api_client.get_document_by_uri.side_effect = mock_document
+        failed_message = SNSMessage(
+            topic_arn="topic",
+            message="{}",
+            message_attributes={"uri_reference": {"DataType": "String", "StringValue": "a/1"}},
+        )
+        publisher.failed_messages = []
+
+        def fail_to_flush():
+            publisher.failed_messages.append(failed_message)
+            raise SNSBatchPublishError("failed", [failed_message])
+
+        publisher.flush.side_effect = fail_to_flush
+
+        results = publish.publish_many(
+            mock_api_client, [DocumentURIString("a/1"), DocumentURIString("a/2")], publisher=publisher
+        )
+
+        assert isinstance(results[0].error, SNSBatchPublishError)
+        assert results[1].success
+
+    def test_failed_announcement_in_full_batch_is_recorded(
+        self, mock_publish_documents, mock_announce, mock_api_client
+    ):
+        mock_api_client.get_document_by_uri.side_effect = lambda uri: mock_document(uri, enriched_recently=True)
+        mock_announce.side_effect = announce_document_event
+        sns_client = Mock()
+        sns_client.publish_batch.return_value = {
+            "Successful": [{"Id": str(n)} for n in range(1, 10)],
+            "Failed": [{"Id": "0", "Code": "InvalidParameter", "SenderFault": True}],
+        }
+        uris = [DocumentURIString(f"a/{n}") for n in range(10)]
+
+        with patch.dict(os.environ, {"SNS_TOPIC": "topic"}):
+            results = publish.publish_many(
+                mock_api_client,
+                uris,
+                publisher=SNSBatchPublisher(client=sns_client, flush_at_exit=False),
+            )
+
+        assert isinstance(results[0].error, SNSBatchPublishError)
+        assert all(result.success for result in results[1:])
+
+    @patch("caselawclient.managers.publish.SNSBatchPublisher")
+    def test_uses_and_closes_own_publisher(
+        self, mock_publisher_class, mock_publish_documents, mock_announce, mock_api_client
+    ):
+        mock_api_client.get_document_by_uri.side_effect = mock_document
+
+        mock_publisher_class.return_value.failed_messages = []
+
+        publish.publish_many(mock_api_client, [DocumentURIString("a/1")])
+
+        mock_publisher_class.return_value.close.assert_called_once()
+
+
+@patch("caselawclient.managers.publish.announce_document_event")
+@patch("caselawclient.managers.publish.unpublish_documents")
+class TestUnpublishMany:
+    def test_unpublishes_all_documents(self, mock_unpublish_documents, mock_announce, mock_api_client, publisher):
+        uris = [DocumentURIString("a/1"), DocumentURIString("a/2")]
+
+        results = publish.unpublish_many(mock_api_client, uris, concurrency=2, publisher=publisher)
+
+        assert all(result.success for result in results)
+        assert sorted(call.args[0] for call in mock_api_client.break_checkout.call_args_list) == uris
+        assert sorted(call.args[0] for call in mock_unpublish_documents.call_args_list) == uris
+        mock_api_client.set_properties.assert_called_once_with(
+            [PropertyWrite(uris[0], "published", False), PropertyWrite(uris[1], "published", False)]
+        )
+        assert [call.kwargs["status"] for call in mock_announce.call_args_list] == ["unpublish", "unpublish"]
+        publisher.flush.assert_called_once()
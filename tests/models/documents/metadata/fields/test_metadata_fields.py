@@ -1,3 +1,5 @@
+import copy
+import pickle
 from datetime import UTC, datetime
 
 import pytest
@@ -44,6 +46,13 @@ class TestMetadataFieldPacking:
         assert element.get("rejected") == "false"
         assert element.text == "A Judgment"
 
+    def test_fields_are_slotted_and_share_names(self):
+        field = MetadataField(name="TITLE".lower(), value="A Judgment", source=MetadataSource.DOCUMENT)
+        other_field = MetadataField(name="TITLE".lower(), value="Another Judgment", source=MetadataSource.EDITOR)
+
+        assert not hasattr(field, "__dict__")
+        assert field.name is other_field.name
+
     def test_pack_category_value(self):
         field = MetadataField(
             name="categories",
@@ -396,3 +405,127 @@ class TestMetadataFieldsMutation:
             collection.remove(field.id)
 
         assert field.id in collection
+
+
+class TestMetadataFieldsIndexing:
+    def test_resolution_is_cached_until_a_claim_changes(self):
+        collection = MetadataFieldsCollection()
+        collection.add(MetadataField(name="name", value="First", source=MetadataSource.DOCUMENT))
+
+        resolved = collection.resolve("name")
+        assert collection.resolve("name") is resolved
+
+        editor_claim = MetadataField(name="name", value="Second", source=MetadataSource.EDITOR)
+        collection.add(editor_claim)
+        assert collection.resolve("name") is not resolved
+        assert collection.resolve("name").value == "Second"
+
+        collection.remove(editor_claim.id)
+        assert collection.resolve("name").value == "First"
+
+    def test_changing_one_name_keeps_other_resolutions(self):
+        collection = MetadataFieldsCollection()
+        collection.add(MetadataField(name="name", value="A v B", source=MetadataSource.DOCUMENT))
+        resolved = collection.resolve("name")
+
+        court = MetadataField(name="court", value="UKSC", source=MetadataSource.DOCUMENT)
+        collection.add(court)
+        collection.reject(court.id)
+
+        assert collection.resolve("name") is resolved
+        assert collection.resolve("court").value is None
+
+        collection.restore(court.id)
+        assert collection.resolve("court").value == "UKSC"
+
+    def test_has_claim_tracks_added_and_removed_claims(self):
+        collection = MetadataFieldsCollection()
+        value = MetadataCategoryValue(name="Tax", parent="Finance")
+        field = MetadataField(name="categories", value=value, source=MetadataSource.EDITOR)
+
+        assert not collection.has_claim("categories", value, MetadataSource.EDITOR)
+
+        collection.add(field)
+        assert collection.has_claim(
+            "categories", MetadataCategoryValue(name="Tax", parent="Finance"), MetadataSource.EDITOR
+        )
+        assert not collection.has_claim("categories", value, MetadataSource.DOCUMENT)
+
+        collection.remove(field.id)
+        assert not collection.has_claim("categories", value, MetadataSource.EDITOR)
+        assert collection.by_name("categories") == []
+
+    def test_replacing_a_claim_by_key_reindexes_it(self):
+        collection = MetadataFieldsCollection()
+        collection["key"] = MetadataField(name="name", value="Old", source=MetadataSource.DOCUMENT)
+        collection["key"] = MetadataField(name="court", value="UKSC", source=MetadataSource.DOCUMENT)
+
+        assert collection.by_name("name") == []
+        assert not collection.has_claim("name", "Old", MetadataSource.DOCUMENT)
+        assert [field.value for field in collection.by_name("court")] == ["UKSC"]
+
+    @pytest.mark.parametrize(
+        "remove_claim",
+        [
+            lambda collection, key: collection.pop(key),
+            lambda collection, key: collection.popitem(),
+            lambda collection, key: collection.clear(),
+        ],
+        ids=["pop", "popitem", "clear"],
+    )
+    def test_every_removal_updates_indexes(self, remove_claim):
+        collection = MetadataFieldsCollection()
+        field = MetadataField(name="name", value="A v B", source=MetadataSource.DOCUMENT)
+        collection.add(field)
+        assert collection.resolve("name").value == "A v B"
+
+        remove_claim(collection, field.id)
+
+        assert collection.by_name("name") == []
+        assert not collection.has_claim("name", "A v B", MetadataSource.DOCUMENT)
+        assert collection.resolve("name").value is None
+
+    @pytest.mark.parametrize(
+        "add_claim",
+        [
+            lambda collection, field: collection.update({field.id: field}),
+            lambda collection, field: collection.setdefault(field.id, field),
+            lambda collection, field: collection.__ior__({field.id: field}),
+        ],
+        ids=["update", "setdefault", "ior"],
+    )
+    def test_every_addition_updates_indexes(self, add_claim):
+        collection = MetadataFieldsCollection()
+        assert collection.resolve("name").value is None
+        field = MetadataField(name="name", value="A v B", source=MetadataSource.DOCUMENT)
+
+        add_claim(collection, field)
+
+        assert collection.by_name("name") == [field]
+        assert collection.has_claim("name", "A v B", MetadataSource.DOCUMENT)
+        assert collection.resolve("name").value == "A v B"
+
+    @pytest.mark.parametrize(
+        "duplicate",
+        [
+            lambda collection: MetadataFieldsCollection(collection),
+            lambda collection: collection.copy(),
+            copy.copy,
+            copy.deepcopy,
+            lambda collection: pickle.loads(pickle.dumps(collection)),  # noqa: S301
+        ],
+        ids=["constructor", "copy", "copy.copy", "copy.deepcopy", "pickle"],
+    )
+    def test_duplicates_have_their_own_indexes(self, duplicate):
+        collection = MetadataFieldsCollection()
+        field = MetadataField(name="name", value="A v B", source=MetadataSource.DOCUMENT)
+        collection.add(field)
+
+        duplicated = duplicate(collection)
+        duplicated.pop(field.id)
+
+        assert isinstance(duplicated, MetadataFieldsCollection)
+        assert duplicated.by_name("name") == []
+        assert not duplicated.has_claim("name", "A v B", MetadataSource.DOCUMENT)
+        assert [claim.value for claim in collection.by_name("name")] == ["A v B"]
+        assert collection.resolve("name").value == "A v B"
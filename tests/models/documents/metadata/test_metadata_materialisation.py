@@ -1,8 +1,10 @@
 from datetime import UTC, date, datetime
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
 
+from caselawclient.Client import MarklogicApiClient
 from caselawclient.factories import DocumentBodyFactory, DocumentFactory
 from caselawclient.models.documents.metadata.base import Metadata
 from caselawclient.models.documents.metadata.fields.field import MetadataCategoryValue, MetadataField
@@ -14,6 +16,7 @@ from caselawclient.models.documents.metadata.materialisation import (
     document_needs_metadata_materialisation,
     metadata_logic_versions,
 )
+from caselawclient.types import PropertyWrite
 
 TIMESTAMP = datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
 
@@ -223,18 +226,33 @@ class TestDocumentMaterialiseMetadataClaims:
 
         document.materialise_metadata_claims()
 
-        mock_api_client.set_property_as_node.assert_called_once()
-        uri, property_name, _tree = mock_api_client.set_property_as_node.call_args.args
-        assert uri == document.uri
-        assert property_name == "metadata_fields"
-        mock_api_client.set_property.assert_any_call(
+        mock_api_client.set_properties.assert_called_once()
+        metadata_fields_write, version_write = mock_api_client.set_properties.call_args.args[0]
+        assert metadata_fields_write.document_uri == document.uri
+        assert metadata_fields_write.name == "metadata_fields"
+        assert version_write == PropertyWrite(
             document.uri,
             LATEST_METADATA_MATERIALISATION_VERSION_PROPERTY,
             CURRENT_METADATA_MATERIALISATION_VERSION,
         )
+        mock_api_client.set_property_as_node.assert_not_called()
         assert document.metadata_fields.resolve("title").value == "Saved Title"
         assert document.metadata_fields.resolve("court").value == "Saved Court"
 
+    def test_materialise_updates_properties_once(self, mock_api_client):
+        client = MarklogicApiClient("", "", "", False)
+        mock_api_client.set_properties.side_effect = client.set_properties
+        document = DocumentFactory.build(api_client=mock_api_client)
+
+        with patch.object(client, "_send_to_eval") as mock_send_to_eval:
+            document.materialise_metadata_claims()
+
+        (written_document,) = mock_send_to_eval.call_args.args[0]["documents"]
+        assert [p["name"] for p in written_document["properties"]] == [
+            "metadata_fields",
+            LATEST_METADATA_MATERIALISATION_VERSION_PROPERTY,
+        ]
+
     def test_needs_metadata_materialisation(self, mock_api_client):
         document = DocumentFactory.build(api_client=mock_api_client)
         mock_api_client.get_property.return_value = ""
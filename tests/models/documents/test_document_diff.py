@@ -0,0 +1,84 @@
+from caselawclient.models.documents.body import DocumentBody
+from caselawclient.models.documents.diff import ChangeType
+
+
+def body(paragraphs: str, name: str = "A v B") -> DocumentBody:
+    return DocumentBody(
+        f"""
+        <akomaNtoso xmlns="http://docs.oasis-open.org/legaldocml/ns/akn/3.0">
+            <judgment>
+                <meta>
+                    <identification>
+                        <FRBRWork><FRBRname value="{name}"/></FRBRWork>
+                    </identification>
+                </meta>
+                <judgmentBody><decision>{paragraphs}</decision></judgmentBody>
+            </judgment>
+        </akomaNtoso>
+        """.encode()
+    )
+
+
+PARAGRAPHS = "".join(f'<paragraph eId="para_{n}"><p>Paragraph <b>{n}</b> text.</p></paragraph>' for n in range(1, 6))
+DECISION_XPATH = "/akn:akomaNtoso[1]/akn:judgment[1]/akn:judgmentBody[1]/akn:decision[1]"
+
+
+class TestDocumentBodyDiff:
+    def test_identical_bodies(self):
+        assert body(PARAGRAPHS).diff(body(PARAGRAPHS)) == []
+
+    def test_changed_text(self):
+        changes = body(PARAGRAPHS).diff(body(PARAGRAPHS.replace("Paragraph <b>3</b> text.", "Paragraph <b>3</b> new.")))
+
+        assert len(changes) == 1
+        assert changes[0].change_type == ChangeType.CHANGED
+        assert changes[0].xpath == DECISION_XPATH + "/akn:paragraph[3]/akn:p[1]"
+        assert changes[0].this_text == "Paragraph 3 text."
+        assert changes[0].that_text == "Paragraph 3 new."
+        assert not changes[0].in_metadata
+
+    def test_changed_metadata(self):
+        changes = body(PARAGRAPHS).diff(body(PARAGRAPHS, name="C v D"))
+
+        assert [change.xpath for change in changes] == [
+            "/akn:akomaNtoso[1]/akn:judgment[1]/akn:meta[1]/akn:identification[1]/akn:FRBRWork[1]/akn:FRBRname[1]"
+        ]
+        assert changes[0].in_metadata
+
+    def test_changed_attribute(self):
+        changes = body(PARAGRAPHS).diff(body(PARAGRAPHS.replace('eId="para_2"', 'eId="para_two"')))
+
+        assert [(change.change_type, change.xpath) for change in changes] == [
+            (ChangeType.CHANGED, DECISION_XPATH + "/akn:paragraph[2]"),
+        ]
+
+    def test_added_paragraph(self):
+        added = '<paragraph eId="new"><p>New paragraph</p></paragraph>'
+        changes = body(PARAGRAPHS).diff(
+            body(PARAGRAPHS.replace('<paragraph eId="para_4">', added + '<paragraph eId="para_4">'))
+        )
+
+        assert [(change.change_type, change.xpath) for change in changes] == [
+            (ChangeType.ADDED, DECISION_XPATH + "/akn:paragraph[4]"),
+        ]
+        assert changes[0].this_element is None
+        assert changes[0].that_text == "New paragraph"
+
+    def test_removed_paragraph(self):
+        removed = '<paragraph eId="para_2"><p>Paragraph <b>2</b> text.</p></paragraph>'
+        changes = body(PARAGRAPHS).diff(body(PARAGRAPHS.replace(removed, "")))
+
+        assert [(change.change_type, change.xpath) for change in changes] == [
+            (ChangeType.REMOVED, DECISION_XPATH + "/akn:paragraph[2]"),
+        ]
+        assert changes[0].that_element is None
+
+    def test_comments_are_ignored(self):
+        with_comment = PARAGRAPHS.replace("<p>Paragraph <b>1</b>", "<p><!-- a comment -->Paragraph <b>1</b>")
+
+        assert body(PARAGRAPHS).diff(body(with_comment)) == []
+
+    def test_whitespace_around_added_paragraph_is_not_a_change(self):
+        changes = body(PARAGRAPHS).diff(body(PARAGRAPHS + '\n    <paragraph eId="para_6"><p>Six</p></paragraph>\n'))
+
+        assert [change.change_type for change in changes] == [ChangeType.ADDED]
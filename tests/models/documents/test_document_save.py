@@ -2,7 +2,7 @@
 
 from unittest.mock import patch
 
-from caselawclient.factories import DocumentFactory
+from caselawclient.factories import DocumentBodyFactory, DocumentFactory
 from caselawclient.models.documents import DocumentURIString
 from caselawclient.models.documents.metadata.materialisation import (
     CURRENT_METADATA_MATERIALISATION_VERSION,
@@ -11,13 +11,18 @@ from caselawclient.models.documents.metadata.materialisation import (
 from caselawclient.models.documents.versions import VersionAnnotation, VersionType
 
 
+def build_edited_document(uri: DocumentURIString):
+    """Build a document whose body differs from the one loaded from MarkLogic."""
+    return DocumentFactory.build(uri=uri, body=DocumentBodyFactory.build(name="Edited name"))
+
+
 class TestDocumentSave:
     """Tests for the Document.save() method."""
 
     def test_save_calls_update_document_xml(self):
         """Test that save() calls update_document_xml exactly once."""
         uri = DocumentURIString("test/2023/101")
-        document = DocumentFactory.build(uri=uri)
+        document = build_edited_document(uri)
 
         with (
             patch.object(document.api_client, "update_document_xml") as mock_update,
@@ -31,7 +36,7 @@ class TestDocumentSave:
     def test_save_creates_edit_annotation(self):
         """Test that save() creates an EDIT annotation with automated=False."""
         uri = DocumentURIString("test/2023/123")
-        document = DocumentFactory.build(uri=uri)
+        document = build_edited_document(uri)
 
         with (
             patch.object(document.api_client, "update_document_xml") as mock_update,
@@ -49,7 +54,7 @@ class TestDocumentSave:
     def test_save_passes_uri_and_xml_to_api(self):
         """Test that save() passes the correct URI and XML to the API."""
         uri = DocumentURIString("test/2023/456")
-        document = DocumentFactory.build(uri=uri)
+        document = build_edited_document(uri)
         expected_xml = document.body.content_as_xml_tree
 
         with (
@@ -66,7 +71,7 @@ class TestDocumentSave:
     def test_save_with_message_includes_message_in_annotation(self):
         """Test that save() includes the message in the annotation."""
         uri = DocumentURIString("test/2023/789")
-        document = DocumentFactory.build(uri=uri)
+        document = build_edited_document(uri)
         test_message = "Fixed typo in court name"
 
         with (
@@ -104,9 +109,38 @@ class TestDocumentSave:
         with patch.object(document.api_client, "update_document_xml"):
             document.save(message="Changed document")
 
-        mock_api_client.set_property_as_node.assert_called()
-        mock_api_client.set_property.assert_any_call(
-            document.uri,
-            LATEST_METADATA_MATERIALISATION_VERSION_PROPERTY,
-            CURRENT_METADATA_MATERIALISATION_VERSION,
-        )
+        writes = mock_api_client.set_properties.call_args.args[0]
+        assert [write.name for write in writes] == ["metadata_fields", LATEST_METADATA_MATERIALISATION_VERSION_PROPERTY]
+        assert writes[1].value == CURRENT_METADATA_MATERIALISATION_VERSION
+
+    def test_save_does_not_send_unchanged_body(self):
+        document = DocumentFactory.build()
+
+        with (
+            patch.object(document.api_client, "update_document_xml") as mock_update,
+            patch.object(document, "materialise_metadata_claims") as mock_materialise,
+        ):
+            document.save(message="No changes")
+
+        mock_update.assert_not_called()
+        mock_materialise.assert_called_once()
+        assert document.skipped_writes["body"] == 1
+
+    def test_loading_keeps_the_body_hash_rather_than_the_body_bytes(self):
+        document = DocumentFactory.build()
+
+        assert document._loaded_body_hash == document.body.canonical_hash  # noqa: SLF001
+        assert not any(isinstance(value, bytes) for value in vars(document).values())
+
+    def test_save_does_not_send_body_again_after_saving(self):
+        document = build_edited_document(DocumentURIString("test/2023/123"))
+
+        with (
+            patch.object(document.api_client, "update_document_xml") as mock_update,
+            patch.object(document, "materialise_metadata_claims"),
+        ):
+            document.save(message="Changed document")
+            document.save(message="Changed document again")
+
+        mock_update.assert_called_once()
+        assert document.skipped_writes["body"] == 1
@@ -1,11 +1,14 @@
 import datetime
 import json
 import os
+from collections import Counter
 from unittest.mock import ANY, Mock, PropertyMock, call, patch
 
 import pytest
 import time_machine
+from lxml import etree
 
+from caselawclient.Client import MarklogicApiClient
 from caselawclient.errors import MarklogicResourceVersionInvalidError
 from caselawclient.factories import JudgmentFactory
 from caselawclient.models.documents import (
@@ -23,7 +26,7 @@ from caselawclient.models.identifiers.exceptions import IdentifierValidationExce
 from caselawclient.models.identifiers.fclid import FindCaseLawIdentifier
 from caselawclient.models.judgments import Judgment
 from caselawclient.models.neutral_citation_mixin import NeutralCitationString
-from caselawclient.types import SuccessFailureMessageTuple
+from caselawclient.types import PropertyWrite, SuccessFailureMessageTuple
 
 
 class TestDocumentSaveIdentifiers:
@@ -69,6 +72,111 @@ class TestDocumentSaveIdentifiers:
             mock_api_client.set_property_as_node.assert_not_called()
 
 
+class TestDocumentChanges:
+    def test_changes_are_written_together(self, mock_api_client):
+        document = Document(DocumentURIString("test/1234"), mock_api_client)
+        when = datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC)
+
+        with document.changes():
+            document.hold()
+            document._set_datetime_property("latest_published_datetime", when)  # noqa: SLF001
+            mock_api_client.set_properties.assert_not_called()
+
+        mock_api_client.set_properties.assert_called_once_with(
+            [
+                PropertyWrite(DocumentURIString("test/1234"), "editor-hold", "true"),
+                PropertyWrite(DocumentURIString("test/1234"), "latest_published_datetime", when),
+            ]
+        )
+        mock_api_client.set_property.assert_not_called()
+        mock_api_client.set_datetime_property.assert_not_called()
+
+    def test_changes_are_discarded_on_exception(self, mock_api_client):
+        document = Document(DocumentURIString("test/1234"), mock_api_client)
+
+        with pytest.raises(RuntimeError), document.changes():
+            document.hold()
+            raise RuntimeError
+
+        mock_api_client.set_properties.assert_not_called()
+        document.unhold()
+        mock_api_client.set_property.assert_called_once_with("test/1234", "editor-hold", "false")
+
+    def test_nested_changes_join_outer_block(self, mock_api_client):
+        document = Document(DocumentURIString("test/1234"), mock_api_client)
+
+        with document.changes():
+            document.hold()
+            with document.changes():
+                document.unhold()
+            mock_api_client.set_properties.assert_not_called()
+
+        mock_api_client.set_properties.assert_called_once()
+        assert len(mock_api_client.set_properties.call_args.args[0]) == 2
+
+    @patch("caselawclient.models.documents.announce_document_event")
+    @patch("caselawclient.models.documents.publish_documents")
+    @patch("caselawclient.models.documents.Document.enrich")
+    def test_publish_writes_new_fclid_with_other_properties(
+        self,
+        mock_enrich,
+        mock_publish_documents,
+        mock_announce_document_event,
+        mock_api_client,
+    ):
+        document = Document(DocumentURIString("test/1234"), mock_api_client)
+        document.is_publishable = True
+        document.first_published_datetime = None
+        mock_api_client.get_next_document_sequence_number.return_value = 123
+
+        document.publish()
+
+        mock_api_client.set_properties.assert_called_once()
+        assert [write.name for write in mock_api_client.set_properties.call_args.args[0]] == [
+            "identifiers",
+            "published",
+            "first_published_datetime",
+            "latest_published_datetime",
+        ]
+        mock_api_client.set_property_as_node.assert_not_called()
+
+    @patch("caselawclient.models.documents.announce_document_event")
+    @patch("caselawclient.models.documents.publish_documents")
+    @patch("caselawclient.models.documents.Document.enrich")
+    def test_publish_updates_properties_once(
+        self,
+        mock_enrich,
+        mock_publish_documents,
+        mock_announce_document_event,
+        mock_api_client,
+    ):
+        """
+        Given a document being published, which writes several properties in one `changes()` block,
+        When the writes reach MarkLogic,
+        Then they are sent as a single update to that document, rather than one conflicting update per property.
+        """
+        client = MarklogicApiClient("", "", "", False)
+        mock_api_client.set_properties.side_effect = client.set_properties
+        document = Document(DocumentURIString("test/1234"), mock_api_client)
+        document.is_publishable = True
+        document.first_published_datetime = None
+        mock_api_client.get_next_document_sequence_number.return_value = 123
+
+        with patch.object(client, "_send_to_eval") as mock_send_to_eval:
+            document.publish()
+
+        ((vars, query), _) = mock_send_to_eval.call_args
+        assert query == "set_properties.xqy"
+        (written_document,) = vars["documents"]
+        assert written_document["uri"] == "/test/1234.xml"
+        assert [p["name"] for p in written_document["properties"]] == [
+            "identifiers",
+            "published",
+            "first_published_datetime",
+            "latest_published_datetime",
+        ]
+
+
 class TestDocumentPublish:
     def test_publish_fails_if_not_publishable(self, mock_api_client):
         with pytest.raises(CannotPublishUnpublishableDocument):
@@ -91,7 +199,9 @@ class TestDocumentPublish:
         document.is_publishable = True
         document.publish()
         mock_publish_documents.assert_called_once_with("test/1234")
-        mock_api_client.set_published.assert_called_once_with("test/1234", True)
+        written = [(write.name, write.value) for write in mock_api_client.set_properties.call_args.args[0]]
+        assert ("published", True) in written
+        mock_api_client.set_published.assert_not_called()
         mock_announce_document_event.assert_called_once_with(
             uri="test/1234",
             status="publish",
@@ -156,9 +266,10 @@ class TestDocumentPublish:
         document.publish()
 
         expected_now = datetime.datetime(1955, 11, 5, 6, 0, tzinfo=datetime.timezone.utc)
-        mock_api_client.set_datetime_property.assert_any_call("test/1234", "first_published_datetime", expected_now)
-        mock_api_client.set_datetime_property.assert_any_call("test/1234", "latest_published_datetime", expected_now)
-        assert mock_api_client.set_datetime_property.call_count == 2
+        writes = mock_api_client.set_properties.call_args.args[0]
+        assert PropertyWrite(DocumentURIString("test/1234"), "first_published_datetime", expected_now) in writes
+        assert PropertyWrite(DocumentURIString("test/1234"), "latest_published_datetime", expected_now) in writes
+        mock_api_client.set_datetime_property.assert_not_called()
 
     @time_machine.travel(datetime.datetime(1955, 11, 5, 6, tzinfo=datetime.UTC))
     @patch("caselawclient.models.documents.announce_document_event")
@@ -178,11 +289,11 @@ class TestDocumentPublish:
         )
         document.publish()
 
-        mock_api_client.set_datetime_property.assert_called_once_with(
-            "test/1234",
-            "latest_published_datetime",
-            datetime.datetime(1955, 11, 5, 6, 0, tzinfo=datetime.timezone.utc),
-        )
+        writes = mock_api_client.set_properties.call_args.args[0]
+        assert [write.name for write in writes if write.name.endswith("_published_datetime")] == [
+            "latest_published_datetime"
+        ]
+        assert writes[-1].value == datetime.datetime(1955, 11, 5, 6, 0, tzinfo=datetime.timezone.utc)
 
     @time_machine.travel(datetime.datetime(1955, 11, 5, 6, tzinfo=datetime.UTC))
     @patch("caselawclient.models.documents.announce_document_event")
@@ -205,11 +316,11 @@ class TestDocumentPublish:
         )
         document.publish()
 
-        mock_api_client.set_datetime_property.assert_called_once_with(
-            "test/1234",
-            "latest_published_datetime",
-            datetime.datetime(1955, 11, 5, 6, 0, tzinfo=datetime.timezone.utc),
-        )
+        writes = mock_api_client.set_properties.call_args.args[0]
+        assert [write.name for write in writes if write.name.endswith("_published_datetime")] == [
+            "latest_published_datetime"
+        ]
+        assert writes[-1].value == datetime.datetime(1955, 11, 5, 6, 0, tzinfo=datetime.timezone.utc)
 
 
 class TestDocumentUnpublish:
@@ -224,7 +335,7 @@ class TestDocumentUnpublish:
         document = Document(DocumentURIString("test/1234"), mock_api_client)
         document.unpublish()
         mock_unpublish_documents.assert_called_once_with("test/1234")
-        mock_api_client.set_published.assert_called_once_with("test/1234", False)
+        mock_api_client.set_boolean_property.assert_called_once_with("test/1234", "published", False)
         mock_api_client.break_checkout.assert_called_once_with("test/1234")
         mock_announce_document_event.assert_called_once_with(
             uri="test/1234",
@@ -372,6 +483,75 @@ class TestDocumentHold:
             "false",
         )
 
+    def test_hold_when_already_held_is_skipped(self, mock_api_client):
+        mock_api_client.get_property.return_value = "true"
+        document = Document(DocumentURIString("test/1234"), mock_api_client)
+
+        assert document.is_held is True
+        document.hold()
+
+        mock_api_client.set_property.assert_not_called()
+        assert document.skipped_writes["editor-hold"] == 1
+
+    def test_repeated_hold_is_skipped(self, mock_api_client):
+        document = Document(DocumentURIString("test/1234"), mock_api_client)
+
+        document.hold()
+        document.hold()
+        document.unhold()
+
+        assert mock_api_client.set_property.call_args_list == [
+            call("test/1234", "editor-hold", "true"),
+            call("test/1234", "editor-hold", "false"),
+        ]
+        assert document.skipped_writes["editor-hold"] == 1
+
+
+class TestDocumentSkipUnchangedWrites:
+    def test_unchanged_identifiers_are_not_saved(self, mock_api_client):
+        document = Document(DocumentURIString("test/1234"), mock_api_client)
+        document.identifiers.add(FindCaseLawIdentifier(value="tn4t35ts"))
+
+        document.save_identifiers()
+        document.save_identifiers()
+
+        mock_api_client.set_property_as_node.assert_called_once()
+        assert document.skipped_writes["identifiers"] == 1
+
+    def test_loaded_node_property_is_compared_by_content(self, mock_api_client):
+        mock_api_client.get_property_as_node.return_value = etree.fromstring("<metadata_fields></metadata_fields>")
+        document = Document(DocumentURIString("test/1234"), mock_api_client)
+
+        document.save_metadata_fields()
+
+        mock_api_client.set_property_as_node.assert_not_called()
+        assert document.skipped_writes["metadata_fields"] == 1
+
+    def test_write_reverting_pending_change_is_kept(self, mock_api_client):
+        mock_api_client.get_property.return_value = "false"
+        document = Document(DocumentURIString("test/1234"), mock_api_client)
+        assert document.is_held is False
+
+        with document.changes():
+            document.hold()
+            document.unhold()
+
+        assert [write.value for write in mock_api_client.set_properties.call_args.args[0]] == ["true", "false"]
+
+    def test_unchanged_writes_within_changes_are_skipped(self, mock_api_client):
+        mock_api_client.get_published.return_value = True
+        document = Document(DocumentURIString("test/1234"), mock_api_client)
+        assert document.is_published is True
+
+        with document.changes():
+            document._set_boolean_property("published", True)  # noqa: SLF001
+            document.hold()
+
+        mock_api_client.set_properties.assert_called_once_with(
+            [PropertyWrite(DocumentURIString("test/1234"), "editor-hold", "true")]
+        )
+        assert document.skipped_writes == Counter({"published": 1})
+
 
 class TestDocumentDelete:
     def test_not_safe_to_delete_if_published(self, mock_api_client):
@@ -655,16 +835,16 @@ def _make_version_document(
 def _assert_tdr_metadata_set(
     mock_api_client, organisation: str, contact_name: str, contact_email: str, sender_id: str, completed_at: str
 ):
-    mock_api_client.set_property.assert_has_calls(
+    mock_api_client.set_properties.assert_called_once_with(
         [
-            call("test/1234", name="source-organisation", value=organisation),
-            call("test/1234", name="source-name", value=contact_name),
-            call("test/1234", name="source-email", value=contact_email),
-            call("test/1234", name="transfer-consignment-reference", value=sender_id),
-            call("test/1234", name="transfer-received-at", value=completed_at),
+            PropertyWrite(DocumentURIString("test/1234"), "source-organisation", organisation),
+            PropertyWrite(DocumentURIString("test/1234"), "source-name", contact_name),
+            PropertyWrite(DocumentURIString("test/1234"), "source-email", contact_email),
+            PropertyWrite(DocumentURIString("test/1234"), "transfer-consignment-reference", sender_id),
+            PropertyWrite(DocumentURIString("test/1234"), "transfer-received-at", completed_at),
         ]
     )
-    assert mock_api_client.set_property.call_count == 5
+    mock_api_client.set_property.assert_not_called()
 
 
 # Reusable consignment metadata so restores have the consignment reference now required to proceed.
@@ -709,7 +889,7 @@ class TestAssertIsRestorable:
         document = Document(DocumentURIString("test/1234"), mock_api_client)
 
         with (
-            patch.object(Document, "versions_as_documents", new_callable=PropertyMock, return_value=[]),
+            patch.object(Document, "version_references", new_callable=PropertyMock, return_value=[]),
             pytest.raises(CannotRestoreDocumentWithoutConsignmentReference),
         ):
             document.assert_is_restorable(3)
@@ -721,7 +901,7 @@ class TestAssertIsRestorable:
         with (
             patch.object(
                 Document,
-                "versions_as_documents",
+                "version_references",
                 new_callable=PropertyMock,
                 return_value=[_make_version_document(3, payload=payload)],
             ),
@@ -734,7 +914,7 @@ class TestAssertIsRestorable:
 
         with patch.object(
             Document,
-            "versions_as_documents",
+            "version_references",
             new_callable=PropertyMock,
             return_value=[_make_version_document(3, payload=_standard_tdr_payload())],
         ):
@@ -759,7 +939,7 @@ class TestDocumentRestoreVersion:
 
         with patch.object(
             Document,
-            "versions_as_documents",
+            "version_references",
             new_callable=PropertyMock,
             return_value=[
                 _make_version_document(
@@ -795,7 +975,7 @@ class TestDocumentRestoreVersion:
         with (
             patch.object(
                 Document,
-                "versions_as_documents",
+                "version_references",
                 new_callable=PropertyMock,
                 return_value=[_make_version_document(3, payload=_standard_tdr_payload())],
             ),
@@ -815,7 +995,7 @@ class TestDocumentRestoreVersion:
         document = Document(DocumentURIString("test/1234"), mock_api_client)
 
         with (
-            patch.object(Document, "versions_as_documents", new_callable=PropertyMock, return_value=versions),
+            patch.object(Document, "version_references", new_callable=PropertyMock, return_value=versions),
             pytest.raises(ValueError, match=f"Version {target_version} not found"),
         ):
             document.restore_version(target_version, automated=False)
@@ -832,7 +1012,7 @@ class TestDocumentRestoreVersion:
         )
         with patch.object(
             Document,
-            "versions_as_documents",
+            "version_references",
             new_callable=PropertyMock,
             return_value=[_make_version_document(7, payload=payload)],
         ):
@@ -853,7 +1033,7 @@ class TestDocumentRestoreVersion:
 
         with patch.object(
             Document,
-            "versions_as_documents",
+            "version_references",
             new_callable=PropertyMock,
             return_value=[_make_version_document(3, payload=_standard_tdr_payload(other="value"))],
         ):
@@ -873,7 +1053,7 @@ class TestDocumentRestoreVersion:
 
         with patch.object(
             Document,
-            "versions_as_documents",
+            "version_references",
             new_callable=PropertyMock,
             return_value=[_make_version_document(3, payload=_standard_tdr_payload(other="value"))],
         ):
@@ -977,7 +1157,7 @@ class TestDocumentRestoreVersion:
         document = Document(DocumentURIString("test/1234"), mock_api_client)
 
         with (
-            patch.object(Document, "versions_as_documents", new_callable=PropertyMock, return_value=versions),
+            patch.object(Document, "version_references", new_callable=PropertyMock, return_value=versions),
             patch.object(document, "_initialise_document_body"),
         ):
             document.restore_version(target_version, automated=False)
@@ -991,7 +1171,7 @@ class TestDocumentRestoreVersion:
         with (
             patch.object(
                 Document,
-                "versions_as_documents",
+                "version_references",
                 new_callable=PropertyMock,
                 return_value=[_make_version_document(4, payload=_standard_tdr_payload())],
             ),
@@ -1011,7 +1191,7 @@ class TestDocumentRestoreVersion:
         with (
             patch.object(
                 Document,
-                "versions_as_documents",
+                "version_references",
                 new_callable=PropertyMock,
                 return_value=[
                     _make_version_document(
@@ -1043,7 +1223,7 @@ class TestDocumentRestoreVersion:
         with (
             patch.object(
                 Document,
-                "versions_as_documents",
+                "version_references",
                 new_callable=PropertyMock,
                 return_value=[
                     _make_version_document(4, "edit", payload={}),
@@ -1070,11 +1250,15 @@ class TestDocumentRestoreVersion:
 
         mock_api_client.assert_has_calls(
             [
-                call.set_property("test/1234", name="source-organisation", value="Example Organisation"),
-                call.set_property("test/1234", name="source-name", value="Example Contact"),
-                call.set_property("test/1234", name="source-email", value="contact@example.com"),
-                call.set_property("test/1234", name="transfer-consignment-reference", value="TDR-12345"),
-                call.set_property("test/1234", name="transfer-received-at", value="2026-01-01T12:00:00Z"),
+                call.set_properties(
+                    [
+                        PropertyWrite(DocumentURIString("test/1234"), "source-organisation", "Example Organisation"),
+                        PropertyWrite(DocumentURIString("test/1234"), "source-name", "Example Contact"),
+                        PropertyWrite(DocumentURIString("test/1234"), "source-email", "contact@example.com"),
+                        PropertyWrite(DocumentURIString("test/1234"), "transfer-consignment-reference", "TDR-12345"),
+                        PropertyWrite(DocumentURIString("test/1234"), "transfer-received-at", "2026-01-01T12:00:00Z"),
+                    ]
+                ),
                 call.restore_document("test/1234", 4, ANY),
             ]
         )
@@ -1105,7 +1289,7 @@ class TestDocumentRestoreVersion:
         with (
             patch.object(
                 Document,
-                "versions_as_documents",
+                "version_references",
                 new_callable=PropertyMock,
                 return_value=[
                     _make_version_document(
@@ -1135,7 +1319,7 @@ class TestDocumentRestoreVersion:
         with (
             patch.object(
                 Document,
-                "versions_as_documents",
+                "version_references",
                 new_callable=PropertyMock,
                 return_value=[_make_version_document(3, payload={"other": "value"})],
             ),
@@ -1157,7 +1341,7 @@ class TestDocumentRestoreVersion:
         with (
             patch.object(
                 Document,
-                "versions_as_documents",
+                "version_references",
                 new_callable=PropertyMock,
                 return_value=[_make_version_document(3, payload=_standard_tdr_payload())],
             ),
@@ -1178,7 +1362,7 @@ class TestDocumentRestoreVersion:
         with (
             patch.object(
                 Document,
-                "versions_as_documents",
+                "version_references",
                 new_callable=PropertyMock,
                 return_value=[_make_version_document(3, payload=_standard_tdr_payload())],
             ),
@@ -1227,7 +1411,7 @@ class TestDocumentRestoreVersion:
     ):
         document = Document(DocumentURIString("test/1234"), mock_api_client)
 
-        with patch.object(Document, "versions_as_documents", new_callable=PropertyMock, return_value=versions):
+        with patch.object(Document, "version_references", new_callable=PropertyMock, return_value=versions):
             result = document._get_restore_metadata_source_version(target_version)  # noqa: SLF001
 
         if expected_version_number is None:
@@ -30,6 +30,22 @@ class TestDocumentXMLRepresentationMethods:
         assert etree.tostring(document_xml.xml_as_tree) == b"<xml/>"
 
 
+class TestDocumentXMLCanonicalHash:
+    def test_canonical_hash_ignores_serialisation_differences(self):
+        assert (
+            XML(b'<?xml version="1.0"?><xml b="2" a="1"><empty/></xml>').canonical_hash
+            == XML(b"<xml a='1' b='2'><empty></empty></xml>").canonical_hash
+        )
+
+    def test_canonical_hash_changes_with_content(self):
+        document_xml = XML(b"<xml>content</xml>")
+        original_hash = document_xml.canonical_hash
+
+        document_xml.xml_as_tree.text = "changed content"
+
+        assert document_xml.canonical_hash != original_hash
+
+
 class TestDocumentXMLRootCheckingMethods:
     def test_root_element_akomantoso(self):
         document_xml = XML(
@@ -282,6 +282,71 @@ class TestDocument:
         ]
         version_document.versions_as_documents[0].uri = DocumentURIString("test/1234_xml_versions/2-1234")
 
+    def test_document_versions(self, mock_api_client):
+        document = Document(DocumentURIString("test/1234"), mock_api_client)
+
+        assert document.versions == mock_api_client.list_versions_detailed.return_value
+        mock_api_client.list_versions_detailed.assert_called_once_with("test/1234")
+
+    def test_document_versions_are_loaded_on_demand(self, mock_api_client):
+        annotation = {"type": "edit", "calling_function": "f", "calling_agent": "a", "automated": False}
+        document = Document(DocumentURIString("test/1234"), mock_api_client)
+        document.versions = [
+            {
+                "uri": DocumentURIString(f"test/1234_xml_versions/{n}-1234"),
+                "version": n,
+                "created": datetime.datetime(2024, 1, n, tzinfo=datetime.UTC) if n <= 28 else None,
+                "annotation": annotation,
+                "size": None,
+            }
+            for n in range(40, 0, -1)
+        ]
+
+        version = document._get_version(3)  # noqa: SLF001
+
+        assert version is not None
+        assert version.uri == "test/1234_xml_versions/3-1234"
+        assert version.created == datetime.datetime(2024, 1, 3, tzinfo=datetime.UTC)
+        assert version.structured_annotation == annotation
+        mock_api_client.get_document_by_uri.assert_not_called()
+        mock_api_client.get_version_annotation.assert_not_called()
+        mock_api_client.get_version_created_datetime.assert_not_called()
+
+        assert version.document == mock_api_client.get_document_by_uri.return_value
+        mock_api_client.get_document_by_uri.assert_called_once_with("test/1234_xml_versions/3-1234")
+
+    def test_document_versions_as_documents_are_documents(self, mock_api_client):
+        document = Document(DocumentURIString("test/1234"), mock_api_client)
+        document.versions = [
+            {"uri": DocumentURIString("test/1234_xml_versions/2-1234"), "version": 2},
+            {"uri": DocumentURIString("test/1234_xml_versions/1-1234"), "version": 1},
+        ]
+        mock_api_client.get_document_by_uri.side_effect = lambda uri: Document(uri, mock_api_client)
+
+        versions = document.versions_as_documents
+
+        assert all(isinstance(version, Document) for version in versions)
+        assert [version.uri for version in versions] == [
+            "test/1234_xml_versions/2-1234",
+            "test/1234_xml_versions/1-1234",
+        ]
+
+    def test_document_version_without_known_annotation(self, mock_api_client):
+        document = Document(DocumentURIString("test/1234"), mock_api_client)
+        document.versions = [{"uri": DocumentURIString("test/1234_xml_versions/1-1234"), "version": 1}]
+        mock_api_client.get_version_annotation.return_value = "Not structured"
+
+        with pytest.raises(ValueError, match="Not structured"):
+            _ = document.version_references[0].structured_annotation
+
+        mock_api_client.get_version_annotation.assert_called_once_with("test/1234_xml_versions/1-1234")
+
+    def test_document_missing_version(self, mock_api_client):
+        document = Document(DocumentURIString("test/1234"), mock_api_client)
+        document.versions = [{"uri": DocumentURIString("test/1234_xml_versions/1-1234"), "version": 1}]
+
+        assert document._get_version(2) is None  # noqa: SLF001
+
     def test_document_version_number_when_not_version(self, mock_api_client):
         base_document = Document(DocumentURIString("test/1234"), mock_api_client)
         with pytest.raises(OnlySupportedOnVersion):
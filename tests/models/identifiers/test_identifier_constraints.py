@@ -56,7 +56,7 @@ class TestRequireGloballyUniqueIdentifierConstraint:
 
         validation = new_identifier.validate_require_globally_unique(api_client=mock_api_client)
         mock_api_client.resolve_from_identifier_value.assert_called_once_with(
-            identifier_value="TEST-123", published_only=False
+            identifier_value="TEST-123", published_only=False, use_cache=False
         )
 
         assert validation.success is False
@@ -74,7 +74,7 @@ class TestRequireGloballyUniqueIdentifierConstraint:
 
         validation = new_identifier.validate_require_globally_unique(api_client=mock_api_client)
         mock_api_client.resolve_from_identifier_value.assert_called_once_with(
-            identifier_value="TEST-123", published_only=False
+            identifier_value="TEST-123", published_only=False, use_cache=False
         )
 
         assert validation.success is True
@@ -87,7 +87,7 @@ class TestRequireGloballyUniqueIdentifierConstraint:
 
         validation = new_identifier.validate_require_globally_unique(api_client=mock_api_client)
         mock_api_client.resolve_from_identifier_value.assert_called_once_with(
-            identifier_value="TEST-123", published_only=False
+            identifier_value="TEST-123", published_only=False, use_cache=False
         )
 
         assert validation.success is True
@@ -105,7 +105,7 @@ class TestRequireGloballyUniqueIdentifierConstraint:
 
         validation = new_identifier.validate_require_globally_unique(api_client=mock_api_client)
         mock_api_client.resolve_from_identifier_value.assert_called_once_with(
-            identifier_value="TEST-123", published_only=False
+            identifier_value="TEST-123", published_only=False, use_cache=False
         )
 
         assert validation.success is True
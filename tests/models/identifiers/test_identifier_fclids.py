@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from caselawclient.models.identifiers import fclid
 
 
@@ -23,3 +25,39 @@ class TestFCLIDSchemaImplementation:
     def test_fclid_schema_compile_url_slug(self):
         schema = fclid.FindCaseLawIdentifierSchema
         assert schema.compile_identifier_url_slug("a1b2c3d4") == "tna.a1b2c3d4"
+
+
+class TestFCLIDAllocator:
+    def test_mints_from_reserved_blocks(self, mock_api_client):
+        mock_api_client.reserve_document_sequence_numbers.side_effect = [range(11, 13), range(20, 22)]
+        allocator = fclid.FCLIDAllocator(mock_api_client, block_size=2)
+
+        identifiers = [allocator.mint() for _ in range(3)]
+
+        assert [fclid.sqids.decode(identifier.value) for identifier in identifiers] == [[11], [12], [20]]
+        assert all(fclid.VALID_FCLID_PATTERN.match(identifier.value) for identifier in identifiers)
+        assert allocator.reservation_count == 2
+        mock_api_client.reserve_document_sequence_numbers.assert_called_with(2)
+        mock_api_client.get_next_document_sequence_number.assert_not_called()
+
+    def test_is_safe_to_share_between_threads(self, mock_api_client):
+        next_block_start = iter(range(1, 1000, 10))
+        mock_api_client.reserve_document_sequence_numbers.side_effect = lambda count: range(
+            start := next(next_block_start), start + count
+        )
+        allocator = fclid.FCLIDAllocator(mock_api_client, block_size=10)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            sequence_numbers = list(executor.map(lambda _: allocator.next_sequence_number(), range(200)))
+
+        assert sorted(sequence_numbers) == list(range(1, 201))
+        assert allocator.reservation_count == 20
+
+    def test_schema_mint_uses_allocator(self, mock_api_client):
+        mock_api_client.reserve_document_sequence_numbers.return_value = range(5, 6)
+        allocator = fclid.FCLIDAllocator(mock_api_client)
+
+        identifier = fclid.FindCaseLawIdentifierSchema.mint(mock_api_client, allocator=allocator)
+
+        assert identifier.value == fclid.sqids.encode([5])
+        mock_api_client.get_next_document_sequence_number.assert_not_called()
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from caselawclient.models.identifiers import neutral_citation
@@ -91,3 +93,45 @@ class TestNeutralCitationSchemaImplementation:
     def test_ncn_schema_compile_url_slug(self, value, slug):
         schema = neutral_citation.NeutralCitationNumberSchema
         assert schema.compile_identifier_url_slug(value) == slug
+
+
+class TestParseNeutralCitation:
+    def test_parse_components_and_slug(self):
+        parsed = neutral_citation.parse_neutral_citation("[2022] EWHC 1 (Comm)")
+
+        assert parsed.matches_pattern is True
+        assert (parsed.year, parsed.court, parsed.first_qualifier, parsed.number, parsed.second_qualifier) == (
+            "2022",
+            "EWHC",
+            None,
+            "1",
+            "Comm",
+        )
+        assert parsed.url_slug == "ewhc/comm/2022/1"
+
+    def test_parse_invalid_value(self):
+        parsed = neutral_citation.parse_neutral_citation("not an NCN")
+
+        assert parsed.matches_pattern is False
+        assert parsed.url_slug is None
+
+    def test_parse_results_are_remembered(self):
+        neutral_citation._parse_neutral_citation.cache_clear()  # noqa: SLF001
+        with patch("caselawclient.models.identifiers.neutral_citation.neutral_url", return_value="uksc/2022/1") as url:
+            identifier = neutral_citation.NeutralCitationNumber(value="[2022] UKSC 1")
+            assert identifier.url_slug == "uksc/2022/1"
+            assert neutral_citation.NeutralCitationNumber(value="[2022] UKSC 1").url_slug == "uksc/2022/1"
+
+        url.assert_called_once()
+        neutral_citation._parse_neutral_citation.cache_clear()  # noqa: SLF001
+
+    def test_identifier_compiles_url_slug_once(self):
+        identifier = neutral_citation.NeutralCitationNumber(value="[2022] UKSC 1")
+
+        with patch.object(
+            neutral_citation.NeutralCitationNumberSchema, "compile_identifier_url_slug", return_value="uksc/2022/1"
+        ) as compile_slug:
+            assert identifier.url_slug == "uksc/2022/1"
+            assert identifier.url_slug == "uksc/2022/1"
+
+        compile_slug.assert_called_once()
@@ -3,11 +3,14 @@ from unittest.mock import patch
 import pytest
 from lxml import etree
 
+from caselawclient.factories import IdentifierResolutionFactory, IdentifierResolutionsFactory
 from caselawclient.models.documents import Document
 from caselawclient.models.identifiers import Identifier, IdentifierSchema
 from caselawclient.models.identifiers.collection import IdentifiersCollection
 from caselawclient.models.identifiers.exceptions import IdentifierValidationException
+from caselawclient.models.identifiers.fclid import FindCaseLawIdentifier
 from caselawclient.models.identifiers.neutral_citation import NeutralCitationNumber
+from caselawclient.models.identifiers.press_summary_ncn import PressSummaryRelatedNCNIdentifier
 from caselawclient.types import DocumentIdentifierSlug, SuccessFailureMessageTuple
 
 
@@ -118,6 +121,17 @@ class TestIdentifierBase:
     def test_repr(self):
         assert f"{TEST_NCN_1234!r}" == "<Neutral Citation Number [1234] UKSC 999: id-1234>"
 
+    @pytest.mark.parametrize(
+        "identifier",
+        [
+            NeutralCitationNumber("[2025] UKSC 1"),
+            PressSummaryRelatedNCNIdentifier("[2025] UKSC 1"),
+            FindCaseLawIdentifier("tn4t35ts"),
+        ],
+    )
+    def test_supported_identifiers_have_no_instance_dict(self, identifier):
+        assert not hasattr(identifier, "__dict__")
+
 
 class TestIdentifiersCRUD:
     def test_delete(self, identifiers: IdentifiersCollection):
@@ -174,6 +188,94 @@ class TestIdentifierScoring:
     def test_preferred_identifier_with_type(self, mixed_identifiers: IdentifiersCollection):
         assert mixed_identifiers.preferred(type=NeutralCitationNumber) == TEST_NCN_1701
 
+    def test_ordering_is_cached_until_changed(self, mixed_identifiers: IdentifiersCollection):
+        with patch.object(IdentifiersCollection, "of_type") as mock_of_type:
+            mixed_identifiers.preferred(type=NeutralCitationNumber)
+            mock_of_type.assert_not_called()
+
+        with patch("caselawclient.models.identifiers.collection.sorted", create=True, side_effect=sorted) as sort:
+            mixed_identifiers.preferred()
+            mixed_identifiers.preferred()
+            mixed_identifiers.by_score()
+            assert sort.call_count == 1
+
+    def test_adding_identifier_updates_ordering(self, mixed_identifiers: IdentifiersCollection):
+        assert mixed_identifiers.preferred(type=NeutralCitationNumber) == TEST_NCN_1701
+
+        new_ncn = NeutralCitationNumber(value="[2025] UKSC 1")
+        mixed_identifiers.add(new_ncn)
+
+        assert mixed_identifiers.by_score(type=NeutralCitationNumber) == [TEST_NCN_1701, TEST_NCN_1234, new_ncn]
+
+    def test_removing_identifier_updates_ordering(self, mixed_identifiers: IdentifiersCollection):
+        assert mixed_identifiers.preferred() == TEST_IDENTIFIER_999
+
+        del mixed_identifiers["id-B"]
+
+        assert mixed_identifiers.preferred() == TEST_NCN_1701
+
+    def test_delete_type_updates_type_index(self, mixed_identifiers: IdentifiersCollection):
+        assert len(mixed_identifiers.of_type(NeutralCitationNumber)) == 2
+
+        mixed_identifiers.delete_type(NeutralCitationNumber)
+
+        assert mixed_identifiers.of_type(NeutralCitationNumber) == []
+        assert mixed_identifiers.preferred(type=NeutralCitationNumber) is None
+
+    @pytest.mark.parametrize(
+        "remove_identifier",
+        [
+            lambda collection: collection.pop("id-B"),
+            lambda collection: collection.popitem(),
+            lambda collection: collection.clear(),
+        ],
+        ids=["pop", "popitem", "clear"],
+    )
+    def test_every_removal_updates_ordering(self, mixed_identifiers: IdentifiersCollection, remove_identifier):
+        assert mixed_identifiers.preferred() == TEST_IDENTIFIER_999
+        assert len(mixed_identifiers.of_type(NeutralCitationNumber)) == 2
+
+        remove_identifier(mixed_identifiers)
+
+        assert mixed_identifiers.by_score() == sorted(mixed_identifiers.values(), key=lambda v: v.score, reverse=True)
+        assert mixed_identifiers.of_type(NeutralCitationNumber) == [
+            identifier for identifier in mixed_identifiers.values() if isinstance(identifier, NeutralCitationNumber)
+        ]
+
+    @pytest.mark.parametrize(
+        "add_identifier",
+        [
+            lambda collection, identifier: collection.update({identifier.uuid: identifier}),
+            lambda collection, identifier: collection.setdefault(identifier.uuid, identifier),
+            lambda collection, identifier: collection.__ior__({identifier.uuid: identifier}),
+        ],
+        ids=["update", "setdefault", "ior"],
+    )
+    def test_every_addition_updates_ordering(self, mixed_identifiers: IdentifiersCollection, add_identifier):
+        assert mixed_identifiers.preferred(type=NeutralCitationNumber) == TEST_NCN_1701
+
+        new_ncn = NeutralCitationNumber(value="[2025] UKSC 1")
+        add_identifier(mixed_identifiers, new_ncn)
+
+        assert mixed_identifiers.by_score(type=NeutralCitationNumber) == [TEST_NCN_1701, TEST_NCN_1234, new_ncn]
+        assert new_ncn in mixed_identifiers.by_score()
+
+    def test_copies_have_their_own_ordering(self, mixed_identifiers: IdentifiersCollection):
+        assert mixed_identifiers.preferred() == TEST_IDENTIFIER_999
+
+        duplicate = mixed_identifiers.copy()
+        del duplicate["id-B"]
+
+        assert duplicate.preferred() == TEST_NCN_1701
+        assert mixed_identifiers.preferred() == TEST_IDENTIFIER_999
+
+    def test_returned_lists_do_not_change_the_cache(self, mixed_identifiers: IdentifiersCollection):
+        mixed_identifiers.by_score().clear()
+        mixed_identifiers.of_type(NeutralCitationNumber).clear()
+
+        assert len(mixed_identifiers.by_score()) == 3
+        assert len(mixed_identifiers.of_type(NeutralCitationNumber)) == 2
+
 
 class TestIdentifierValidation:
     def test_validate_uuids_match_keys(self):
@@ -199,8 +301,43 @@ class TestIdentifierValidation:
         ):
             identifiers.perform_all_validations(document_type=Document, api_client=mock_api_client)
             mock_validate_uuids_match_keys.assert_called_once()
-            mock_identifier_1_validate.assert_called_once_with(document_type=Document, api_client=mock_api_client)
-            mock_identifier_2_validate.assert_called_once_with(document_type=Document, api_client=mock_api_client)
+            mock_api_client.resolve_many_values.assert_called_once_with(
+                ["TEST-123", "TEST-456"], published_only=False, use_cache=False
+            )
+            mock_identifier_1_validate.assert_called_once_with(
+                document_type=Document, api_client=mock_api_client, resolutions=IdentifierResolutionsFactory.build()
+            )
+            mock_identifier_2_validate.assert_called_once_with(
+                document_type=Document, api_client=mock_api_client, resolutions=IdentifierResolutionsFactory.build()
+            )
+
+    @patch(
+        "caselawclient.identifier_resolution.IDENTIFIER_NAMESPACE_MAP",
+        {"test": TestIdentifier},
+    )
+    def test_perform_all_validations_checks_uniqueness_in_one_query(self, mock_api_client):
+        identifiers = IdentifiersCollection(
+            {
+                "id-1": TestIdentifier(uuid="id-1", value="TEST-123"),
+                "id-2": TestIdentifier(uuid="id-2", value="TEST-456"),
+            }
+        )
+        mock_api_client.resolve_many_values.side_effect = None
+        mock_api_client.resolve_many_values.return_value = {
+            "TEST-123": IdentifierResolutionsFactory.build(
+                [IdentifierResolutionFactory.build(resolution_uuid="id-9", namespace="test", value="TEST-123")]
+            ),
+            "TEST-456": IdentifierResolutionsFactory.build(
+                [IdentifierResolutionFactory.build(resolution_uuid="id-2", namespace="test", value="TEST-456")]
+            ),
+        }
+
+        validations = identifiers.perform_all_validations(document_type=Document, api_client=mock_api_client)
+
+        mock_api_client.resolve_many_values.assert_called_once()
+        mock_api_client.resolve_from_identifier_value.assert_not_called()
+        assert validations.success is False
+        assert validations.messages == ['Identifiers in scheme "test" must be unique; "TEST-123" already exists!']
 
 
 class TestIdentifierCollectionValidation:
@@ -0,0 +1,201 @@
+import os
+import time
+from unittest.mock import Mock, patch
+
+import botocore.exceptions
+import pytest
+
+from caselawclient.models.utilities.aws import announce_document_event, request_parse
+from caselawclient.models.utilities.sns import SNSBatchPublisher, SNSBatchPublishError, SNSMessage
+from caselawclient.types import DocumentURIString
+
+
+def successful_publish_batch(TopicArn, PublishBatchRequestEntries):
+    return {"Successful": [{"Id": entry["Id"]} for entry in PublishBatchRequestEntries], "Failed": []}
+
+
+@pytest.fixture
+def sns_client():
+    client = Mock()
+    client.publish_batch.side_effect = successful_publish_batch
+    return client
+
+
+def message(topic_arn="topic", n=0):
+    return SNSMessage(topic_arn=topic_arn, message=f"message {n}", subject=f"Subject {n}")
+
+
+class TestSNSMessage:
+    def test_as_batch_entry(self):
+        entry = SNSMessage(
+            topic_arn="topic",
+            message="body",
+            subject="subject",
+            message_attributes={"a": {"DataType": "String", "StringValue": "b"}},
+        ).as_batch_entry("3")
+
+        assert entry == {
+            "Id": "3",
+            "Message": "body",
+            "Subject": "subject",
+            "MessageAttributes": {"a": {"DataType": "String", "StringValue": "b"}},
+        }
+
+    def test_as_batch_entry_omits_empty_fields(self):
+        assert SNSMessage(topic_arn="topic", message="body").as_batch_entry("0") == {"Id": "0", "Message": "body"}
+
+    def test_publish(self):
+        client = Mock()
+
+        SNSMessage(topic_arn="topic", message="body", subject="subject").publish(client)
+
+        client.publish.assert_called_once_with(TopicArn="topic", Message="body", Subject="subject")
+
+
+class TestSNSBatchPublisher:
+    def test_full_batch_is_sent_immediately(self, sns_client):
+        publisher = SNSBatchPublisher(client=sns_client, flush_at_exit=False)
+
+        for n in range(9):
+            publisher.enqueue(message(n=n))
+        sns_client.publish_batch.assert_not_called()
+
+        publisher.enqueue(message(n=9))
+        sns_client.publish_batch.assert_called_once()
+        assert len(sns_client.publish_batch.call_args.kwargs["PublishBatchRequestEntries"]) == 10
+        assert publisher.pending_count == 0
+        assert publisher.published_count == 10
+
+    def test_partial_batch_is_sent_when_context_exits(self, sns_client):
+        with SNSBatchPublisher(client=sns_client, flush_at_exit=False) as publisher:
+            publisher.enqueue(message())
+            publisher.enqueue(message(n=1))
+            sns_client.publish_batch.assert_not_called()
+
+        sns_client.publish_batch.assert_called_once()
+        assert publisher.published_count == 2
+
+    def test_batches_are_grouped_by_topic(self, sns_client):
+        publisher = SNSBatchPublisher(client=sns_client, flush_at_exit=False)
+        publisher.enqueue(message(topic_arn="announce"))
+        publisher.enqueue(message(topic_arn="reparse"))
+        publisher.enqueue(message(topic_arn="announce", n=1))
+        publisher.flush()
+
+        topics = [call.kwargs["TopicArn"] for call in sns_client.publish_batch.call_args_list]
+        sizes = [len(call.kwargs["PublishBatchRequestEntries"]) for call in sns_client.publish_batch.call_args_list]
+        assert topics == ["announce", "reparse"]
+        assert sizes == [2, 1]
+
+    @patch("caselawclient.models.utilities.sns.time.sleep")
+    def test_retries_failed_messages(self, sleep, sns_client):
+        sns_client.publish_batch.side_effect = [
+            {
+                "Successful": [{"Id": "0"}],
+                "Failed": [{"Id": "1", "Code": "InternalError", "SenderFault": False}],
+            },
+            {"Successful": [{"Id": "1"}], "Failed": []},
+        ]
+        publisher = SNSBatchPublisher(client=sns_client, flush_at_exit=False)
+        publisher.enqueue(message())
+        publisher.enqueue(message(n=1))
+        publisher.flush()
+
+        retried_entries = sns_client.publish_batch.call_args_list[1].kwargs["PublishBatchRequestEntries"]
+        assert [entry["Message"] for entry in retried_entries] == ["message 1"]
+        assert publisher.published_count == 2
+        sleep.assert_called_once_with(0.5)
+
+    @patch("caselawclient.models.utilities.sns.time.sleep")
+    def test_retries_client_errors(self, sleep, sns_client):
+        sns_client.publish_batch.side_effect = [
+            botocore.exceptions.ClientError({"Error": {"Code": "Throttling"}}, "PublishBatch"),
+            {"Successful": [{"Id": "0"}], "Failed": []},
+        ]
+        publisher = SNSBatchPublisher(client=sns_client, flush_at_exit=False)
+        publisher.enqueue(message())
+        publisher.flush()
+
+        assert sns_client.publish_batch.call_count == 2
+        assert publisher.published_count == 1
+
+    @patch("caselawclient.models.utilities.sns.time.sleep")
+    def test_sender_faults_are_not_retried(self, sleep, sns_client):
+        sns_client.publish_batch.side_effect = None
+        sns_client.publish_batch.return_value = {
+            "Successful": [{"Id": "0"}],
+            "Failed": [{"Id": "1", "Code": "InvalidParameter", "SenderFault": True}],
+        }
+        publisher = SNSBatchPublisher(client=sns_client, flush_at_exit=False)
+        publisher.enqueue(message())
+        publisher.enqueue(message(n=1))
+
+        with pytest.raises(SNSBatchPublishError) as error:
+            publisher.flush()
+
+        assert [failed.message for failed in error.value.failed_messages] == ["message 1"]
+        assert publisher.failed_messages == error.value.failed_messages
+        sns_client.publish_batch.assert_called_once()
+        sleep.assert_not_called()
+
+    @patch("caselawclient.models.utilities.sns.time.sleep")
+    def test_gives_up_after_max_retries(self, sleep, sns_client):
+        sns_client.publish_batch.side_effect = None
+        sns_client.publish_batch.return_value = {
+            "Successful": [],
+            "Failed": [{"Id": "0", "Code": "InternalError", "SenderFault": False}],
+        }
+        publisher = SNSBatchPublisher(client=sns_client, max_retries=2, flush_at_exit=False)
+        publisher.enqueue(message())
+
+        with pytest.raises(SNSBatchPublishError):
+            publisher.flush()
+
+        assert sns_client.publish_batch.call_count == 3
+        assert [call.args[0] for call in sleep.call_args_list] == [0.5, 1.0]
+
+    def test_cannot_enqueue_after_close(self, sns_client):
+        publisher = SNSBatchPublisher(client=sns_client, flush_at_exit=False)
+        publisher.close()
+
+        with pytest.raises(RuntimeError):
+            publisher.enqueue(message())
+
+    def test_background_flush(self, sns_client):
+        publisher = SNSBatchPublisher(client=sns_client, flush_interval=0.01, flush_at_exit=False)
+        publisher.enqueue(message())
+
+        for _ in range(100):
+            if publisher.published_count:
+                break
+            time.sleep(0.01)
+
+        publisher.close()
+        assert publisher.published_count == 1
+
+
+@patch.dict(
+    os.environ, {"SNS_TOPIC": "ANNOUNCE_TOPIC", "REPARSE_SNS_TOPIC": "REPARSE_TOPIC", "PRIVATE_ASSET_BUCKET": "X"}
+)
+@patch("caselawclient.models.utilities.aws.create_sns_client")
+class TestPublishingWithBatchPublisher:
+    def test_announce_document_event_enqueues(self, create_sns_client):
+        publisher = Mock(spec=SNSBatchPublisher)
+
+        announce_document_event(DocumentURIString("uksc/2023/1"), "publish", publisher=publisher)
+
+        create_sns_client.return_value.publish.assert_not_called()
+        queued = publisher.enqueue.call_args.args[0]
+        assert queued.topic_arn == "ANNOUNCE_TOPIC"
+        assert queued.subject == "Updated: uksc/2023/1 publish"
+        assert queued.message_attributes["uri_reference"] == {"DataType": "String", "StringValue": "uksc/2023/1"}
+
+    def test_request_parse_enqueues(self, create_sns_client):
+        publisher = Mock(spec=SNSBatchPublisher)
+
+        request_parse(DocumentURIString("uksc/2023/1"), "TDR-1", publisher=publisher)
+
+        create_sns_client.return_value.publish.assert_not_called()
+        queued = publisher.enqueue.call_args.args[0]
+        assert queued.topic_arn == "REPARSE_TOPIC"
+        assert queued.subject == "Reparse request: uksc/2023/1"
@@ -0,0 +1,46 @@
+from unittest.mock import patch
+
+import pytest
+from ds_caselaw_utils.courts import CourtNotFoundException, CourtWithJurisdiction
+
+from caselawclient.models.utilities.courts import find_court
+
+
+@pytest.fixture(autouse=True)
+def clear_court_cache():
+    find_court.cache_clear()
+    yield
+    find_court.cache_clear()
+
+
+class TestFindCourt:
+    def test_court(self):
+        court = find_court("UKSC")
+        assert court and court.name == "United Kingdom Supreme Court"
+
+    def test_court_with_jurisdiction(self):
+        court = find_court("UKFTT-GRC", "InformationRights")
+        assert isinstance(court, CourtWithJurisdiction)
+
+    @pytest.mark.parametrize(
+        "court_code, jurisdiction_code",
+        [("A-C", ""), ("", ""), ("UKFTT-GRC", "DoesntExist"), ("A-C", "InformationRights")],
+    )
+    def test_unknown_court(self, court_code, jurisdiction_code):
+        assert find_court(court_code, jurisdiction_code) is None
+
+    def test_lookups_are_cached(self):
+        with patch("caselawclient.models.utilities.courts.courts.get_court_by_code") as get_court_by_code:
+            find_court("UKSC")
+            find_court("UKSC")
+
+        get_court_by_code.assert_called_once_with("UKSC")
+
+    def test_lookups_which_found_nothing_are_cached(self):
+        with patch(
+            "caselawclient.models.utilities.courts.courts.get_court_by_code", side_effect=CourtNotFoundException
+        ) as get_court_by_code:
+            assert find_court("A-C") is None
+            assert find_court("A-C") is None
+
+        get_court_by_code.assert_called_once_with("A-C")
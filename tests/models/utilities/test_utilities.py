@@ -7,10 +7,12 @@ from unittest.mock import ANY, MagicMock, Mock, patch
 from urllib import parse
 
 import boto3
+import botocore.exceptions
 import ds_caselaw_utils
 import pytest
 from moto import mock_aws
 
+from caselawclient.errors import MarklogicAPIError
 from caselawclient.models.documents import DocumentURIString
 from caselawclient.models.neutral_citation_mixin import NeutralCitationString
 from caselawclient.models.utilities import aws as aws_utils
@@ -342,28 +344,64 @@ class TestSignedLinks:
 class TestMove:
     @patch.dict(os.environ, {"PRIVATE_ASSET_BUCKET": "MY_BUCKET"})
     @patch("boto3.session.Session.client")
-    @patch("caselawclient.models.utilities.move.set_metadata")
     @patch("caselawclient.models.utilities.move.copy_assets")
     def test_move_judgment_success(
         self,
         fake_copy,
-        fake_metadata,
         fake_boto3_client,
     ):
         """Given the target judgment does not exist,
-        we continue to move the judgment to the new location
-        (where moving is copy + delete)"""
-        # fake_judgment.return_value = JudgmentFactory.build()
+        we move the judgment to the new location in a single query
+        and then copy its assets"""
         ds_caselaw_utils.neutral_url = MagicMock(return_value="new/uri")
         fake_api_client = MagicMock()
         fake_api_client.document_exists.return_value = False
         move.update_document_uri(DocumentURIString("old/uri"), NeutralCitationString("[2023] EAT 1"), fake_api_client)
 
-        fake_api_client.copy_document.assert_called_with("old/uri", "new/uri")
-        fake_metadata.assert_called_with("old/uri", "new/uri", fake_api_client)
+        fake_api_client.move_document.assert_called_once_with("old/uri", "new/uri")
         fake_copy.assert_called_with("old/uri", "new/uri")
-        fake_api_client.set_judgment_this_uri.assert_called_with("new/uri")
-        fake_api_client.delete_judgment.assert_called_with("old/uri")
+        fake_api_client.copy_document.assert_not_called()
+        fake_api_client.delete_judgment.assert_not_called()
+
+    @patch("caselawclient.models.utilities.move.copy_assets")
+    def test_move_judgment_failure(self, fake_copy):
+        ds_caselaw_utils.neutral_url = MagicMock(return_value="new/uri")
+        fake_api_client = MagicMock()
+        fake_api_client.document_exists.return_value = False
+        fake_api_client.move_document.side_effect = MarklogicAPIError("failed")
+
+        with pytest.raises(move.MoveJudgmentError):
+            move.update_document_uri(
+                DocumentURIString("old/uri"), NeutralCitationString("[2023] EAT 1"), fake_api_client
+            )
+
+        fake_copy.assert_not_called()
+
+    @patch("caselawclient.models.utilities.move.copy_assets")
+    def test_move_judgment_asset_copy_failure(self, fake_copy):
+        ds_caselaw_utils.neutral_url = MagicMock(return_value="new/uri")
+        fake_api_client = MagicMock()
+        fake_api_client.document_exists.return_value = False
+        fake_copy.side_effect = botocore.exceptions.NoCredentialsError()
+
+        with pytest.raises(move.MoveJudgmentError, match="could not be copied"):
+            move.update_document_uri(
+                DocumentURIString("old/uri"), NeutralCitationString("[2023] EAT 1"), fake_api_client
+            )
+
+        fake_api_client.move_document.assert_called_once_with("old/uri", "new/uri")
+
+    def test_move_judgment_target_exists(self):
+        ds_caselaw_utils.neutral_url = MagicMock(return_value="new/uri")
+        fake_api_client = MagicMock()
+        fake_api_client.document_exists.return_value = True
+
+        with pytest.raises(move.MoveJudgmentError):
+            move.update_document_uri(
+                DocumentURIString("old/uri"), NeutralCitationString("[2023] EAT 1"), fake_api_client
+            )
+
+        fake_api_client.move_document.assert_not_called()
 
 
 class TestCheckCleaningTags:
@@ -1,8 +1,12 @@
+import io
+import json
+from unittest.mock import patch
+
 import pytest
 from lxml import etree
 
 from caselawclient.Client import MarklogicApiClient
-from caselawclient.responses.search_response import SearchResponse
+from caselawclient.responses.search_response import SearchResponse, StreamingSearchResponse
 
 
 class TestSearchResponse:
@@ -151,3 +155,166 @@ class TestSearchResponse:
         assert results[" UKUT-AAC"] == "1"
         assert results["EAT"] == "649"
         assert results["EWCA-Civil"] == "5768"
+
+    def test_named_facets(self, valid_facets_fixture_xml, generate_search_response_xml):
+        """
+        Given a SearchResponse instance with more than one facet
+        When calling 'named_facets' on it
+        Then it should return the values and counts of each facet under that facet's name
+        """
+        year_facets_xml = (
+            '<search:facet name="year" type="xs:string">'
+            '<search:facet-value name="2023" count="12">2023</search:facet-value>'
+            '<search:facet-value name="EAT" count="3">EAT</search:facet-value>'
+            "</search:facet>"
+        )
+        search_response = SearchResponse(
+            etree.fromstring(generate_search_response_xml("", valid_facets_fixture_xml + year_facets_xml)),
+            self.client,
+        )
+
+        assert search_response.named_facets == {
+            "court": {"": 14, " UKUT-AAC": 1, "EAT": 649, "EWCA-Civil": 5768},
+            "year": {"2023": 12, "EAT": 3},
+        }
+
+    def test_to_records(self, valid_search_result_xml, generate_search_response_xml):
+        search_response = SearchResponse(
+            etree.fromstring(generate_search_response_xml(2 * valid_search_result_xml)),
+            self.client,
+        )
+
+        records = search_response.to_records()
+
+        assert records == 2 * [
+            {
+                "uri": "a/c/2015/20",
+                "slug": "uksc/2015/123",
+                "neutral_citation": "[2015] UKSC 123",
+                "name": "Another made up case name",
+                "court_code": "A-C",
+                "jurisdiction_code": "",
+                "court_name": None,
+                "date": "2017-08-08T00:00:00",
+                "transformation_date": "2023-04-09T18:05:45",
+                "content_hash": "test_content_hash",
+            }
+        ]
+
+    def test_to_records_survives_an_unconvertible_ncn(self, valid_search_result_xml, generate_search_response_xml):
+        bad_result_xml = valid_search_result_xml.replace("[2015] UKSC 123", "[2245] NCC 1701")
+        search_response = SearchResponse(
+            etree.fromstring(generate_search_response_xml(bad_result_xml + valid_search_result_xml)),
+            self.client,
+        )
+
+        records = search_response.to_records()
+
+        assert [(record["slug"], record["neutral_citation"]) for record in records] == [
+            (None, "[2245] NCC 1701"),
+            ("uksc/2015/123", "[2015] UKSC 123"),
+        ]
+
+    def test_to_jsonl(self, valid_search_result_xml, generate_search_response_xml):
+        search_response = SearchResponse(
+            etree.fromstring(generate_search_response_xml(2 * valid_search_result_xml)),
+            self.client,
+        )
+        stream = io.StringIO()
+
+        assert search_response.to_jsonl(stream) == 2
+        lines = stream.getvalue().splitlines()
+        assert [json.loads(line) for line in lines] == search_response.to_records()
+
+    def test_results_are_built_once(self, valid_search_result_xml, generate_search_response_xml):
+        search_response = SearchResponse(
+            etree.fromstring(generate_search_response_xml(2 * valid_search_result_xml)),
+            self.client,
+        )
+
+        assert search_response.results is search_response.results
+
+
+class TestStreamingSearchResponse:
+    def setup_method(self):
+        self.client = MarklogicApiClient(
+            host="",
+            username="",
+            password="",
+            use_https=False,
+            user_agent="marklogic-api-client-test",
+        )
+
+    def test_total(self, valid_search_result_xml, generate_search_response_xml):
+        search_response = StreamingSearchResponse(
+            generate_search_response_xml(2 * valid_search_result_xml),
+            self.client,
+        )
+
+        assert search_response.total == 2
+
+    def test_results_match_search_response(self, valid_search_result_xml, generate_search_response_xml):
+        """
+        Given a search response with n results
+        When iterating over the results of a StreamingSearchResponse
+        Then each result should be the same as the corresponding result of a SearchResponse
+        """
+        content = generate_search_response_xml(2 * valid_search_result_xml)
+        streaming_results = list(StreamingSearchResponse(content, self.client).results)
+        results = SearchResponse(etree.fromstring(content), self.client).results
+
+        assert len(streaming_results) == 2
+        for streaming_result, result in zip(streaming_results, results, strict=True):
+            assert streaming_result.uri == result.uri
+            assert streaming_result.name == result.name
+            assert streaming_result.slug == result.slug
+            assert streaming_result.matches == result.matches
+
+    def test_results_are_detached_as_they_are_yielded(self, valid_search_result_xml, generate_search_response_xml):
+        search_response = StreamingSearchResponse(
+            generate_search_response_xml(3 * valid_search_result_xml),
+            self.client,
+        )
+
+        results = iter(search_response.results)
+        first = next(results)
+        second = next(results)
+
+        assert first.node.getparent() is None
+        assert second.node.getparent() is None
+        assert first.uri == "a/c/2015/20"
+
+    def test_to_jsonl(self, valid_search_result_xml, generate_search_response_xml):
+        content = generate_search_response_xml(3 * valid_search_result_xml)
+        stream = io.StringIO()
+
+        assert StreamingSearchResponse(content, self.client).to_jsonl(stream) == 3
+        assert [json.loads(line) for line in stream.getvalue().splitlines()] == SearchResponse(
+            etree.fromstring(content), self.client
+        ).to_records()
+
+    def test_facets(self, valid_search_result_xml, valid_facets_fixture_xml, generate_search_response_xml):
+        search_response = StreamingSearchResponse(
+            generate_search_response_xml(valid_search_result_xml, valid_facets_fixture_xml),
+            self.client,
+        )
+
+        assert (
+            search_response.facets
+            == SearchResponse(
+                etree.fromstring(generate_search_response_xml(valid_search_result_xml, valid_facets_fixture_xml)),
+                self.client,
+            ).facets
+        )
+
+    def test_facets_do_not_build_a_tree(
+        self, valid_search_result_xml, valid_facets_fixture_xml, generate_search_response_xml
+    ):
+        search_response = StreamingSearchResponse(
+            generate_search_response_xml(3 * valid_search_result_xml, valid_facets_fixture_xml),
+            self.client,
+        )
+
+        with patch("caselawclient.responses.search_response.etree.iterparse") as mock_iterparse:
+            assert search_response.facets
+            mock_iterparse.assert_not_called()
@@ -1,4 +1,5 @@
 import datetime
+from contextlib import nullcontext
 from unittest.mock import patch
 
 import pytest
@@ -7,6 +8,10 @@ from lxml import etree
 
 from caselawclient.Client import MarklogicApiClient
 from caselawclient.models.identifiers.collection import IdentifiersCollection
+from caselawclient.models.identifiers.neutral_citation import (
+    NCNCannotConvertToValidURLSlugException,
+    NeutralCitationNumber,
+)
 from caselawclient.responses.search_result import (
     EditorPriority,
     EditorStatus,
@@ -62,6 +67,44 @@ class TestSearchResult:
                 == "<SearchResult a/c/2015/20 uksc/2015/123 Another made up case name 2017-08-08 00:00:00>"
             )
 
+            assert search_result.metadata is search_result.metadata
+            mock_get_properties_for_search_results.assert_called_once()
+
+    def test_has_no_instance_dict(self, valid_search_result_xml):
+        search_result = SearchResult(etree.fromstring(valid_search_result_xml), self.client)
+        assert not hasattr(search_result, "__dict__")
+
+    def test_fields_are_extracted_once(self, valid_search_result_xml):
+        search_result = SearchResult(etree.fromstring(valid_search_result_xml), self.client)
+
+        fields = search_result.fields
+
+        assert search_result.fields is fields
+        assert fields.uri == search_result.uri == "a/c/2015/20"
+        assert fields.name == search_result.name == "Another made up case name"
+        assert type(fields.name) is str
+        assert fields.content_hash == "test_content_hash"
+
+    def test_iso_dates_are_parsed_without_dateutil(self, valid_search_result_xml):
+        search_result = SearchResult(etree.fromstring(valid_search_result_xml), self.client)
+
+        with patch("caselawclient.responses.search_result.dateparser.parse") as mock_parse:
+            assert search_result.date == datetime.datetime(2017, 8, 8)
+
+        mock_parse.assert_not_called()
+
+    def test_other_dates_are_parsed_with_dateutil(self):
+        xml = (
+            '<search:result xmlns:search="http://marklogic.com/appservices/search" uri="/a/c/2015/20.xml">'
+            '<search:extracted kind="element">'
+            '<FRBRdate date="8 August 2017" name="judgment" xmlns="http://docs.oasis-open.org/legaldocml/ns/akn/3.0"/>'
+            "</search:extracted>"
+            "</search:result>"
+        )
+        search_result = SearchResult(etree.fromstring(xml), self.client)
+
+        assert search_result.date == datetime.datetime(2017, 8, 8)
+
     def test_create_from_node_with_unparsable_date(self):
         """
         GIVEN an XML node with an unparsable date
@@ -202,6 +245,8 @@ class TestSearchResultIdentifierHandling:
         assert search_result.slug == "uksc/1901/1"
         assert str(search_result) == "<SearchResult a/c/2015/20 uksc/1901/1 **NO NAME** None>"
 
+        assert search_result.identifiers is identifiers
+
     def test_identifiers_absent(self):
         """
         GIVEN an XML node with no identifiers node
@@ -265,7 +310,65 @@ class TestSearchResultIdentifierHandling:
         (identifier_1,) = identifiers.values()
         assert identifier_1.value == "[1901] UKSC 1"
         assert search_result.slug == "uksc/1901/1"
-        logging_warning.assert_called_with("%s //identifiers nodes found in search result, expected 1.", 2)
+        logging_warning.assert_any_call("%s //identifiers nodes found in search result, expected 1.", 2)
+
+    @pytest.mark.parametrize(
+        "identifiers_xml",
+        [
+            [("ukncn", "[2025] UKSC 1", False), ("fclid", "tn4t35ts", False)],
+            [("ukncn", "[2025] UKSC 1", True), ("fclid", "tn4t35ts", False)],
+            [("uksummaryofncn", "[2025] UKSC 2", False), ("fclid", "tn4t35ts", False)],
+            [("ukncn", "[2025] UKSC 1", True), ("uksummaryofncn", "[2025] UKSC 2", False)],
+            [("ukncn", "[2025] UKSC 1", False), ("ukncn", "[2025] UKSC 3", False)],
+            [("unknown", "something", False), ("fclid", "tn4t35ts", True)],
+        ],
+        ids=["ncn", "deprecated ncn", "press summary ncn", "deprecated ncn and press summary", "tie", "deprecated"],
+    )
+    def test_preferred_slug_and_neutral_citation_match_identifiers(self, identifiers_xml):
+        """
+        GIVEN an XML node with several identifiers
+        WHEN reading the slug and neutral citation of a SearchResult
+        THEN they are the same as those of the preferred identifiers in its IdentifiersCollection
+        """
+        identifiers = "".join(
+            f"<identifier><namespace>{namespace}</namespace><uuid>id-{index}</uuid><value>{value}</value>"
+            f"<deprecated>{str(deprecated).lower()}</deprecated></identifier>"
+            for index, (namespace, value, deprecated) in enumerate(identifiers_xml)
+        )
+        node = etree.fromstring(
+            '<search:result xmlns:search="http://marklogic.com/appservices/search" uri="/a/c/2015/20.xml">'
+            f'<search:extracted kind="identifiers"><identifiers>{identifiers}</identifiers></search:extracted>'
+            "</search:result>"
+        )
+        search_result = SearchResult(node, self.client)
+
+        with pytest.warns(UserWarning) if identifiers_xml[0][0] == "unknown" else nullcontext():
+            collection = search_result.identifiers
+        preferred_ncn = collection.preferred(type=NeutralCitationNumber)
+
+        assert search_result.slug == collection.preferred().url_slug
+        assert search_result.neutral_citation == (preferred_ncn.value if preferred_ncn else None)
+
+    def test_unconvertible_preferred_ncn_only_affects_the_slug(self):
+        """
+        GIVEN an XML node whose preferred identifier is an NCN which can't be converted to a URL slug
+        WHEN reading its fields
+        THEN only the slug raises, and its record has no slug
+        """
+        node = etree.fromstring(
+            '<search:result xmlns:search="http://marklogic.com/appservices/search" uri="/a/b/c.xml">'
+            '<search:extracted kind="identifiers"><identifiers><identifier><namespace>ukncn</namespace>'
+            "<uuid>id-1</uuid><value>[2245] NCC 1701</value></identifier></identifiers></search:extracted>"
+            "</search:result>"
+        )
+        search_result = SearchResult(node, self.client)
+
+        assert search_result.uri == "a/b/c"
+        assert search_result.neutral_citation == "[2245] NCC 1701"
+        with pytest.raises(NCNCannotConvertToValidURLSlugException):
+            _ = search_result.slug
+        assert search_result.as_record()["slug"] is None
+        assert "**NO SLUG**" in repr(search_result)
 
 
 class TestSearchResultMeta:
@@ -379,6 +482,61 @@ class TestSearchResultMeta:
         assert meta.submission_datetime == datetime.datetime.min.replace(tzinfo=datetime.UTC)
 
 
+class TestSearchResultPrefetchMetadata:
+    def setup_method(self):
+        self.client = MarklogicApiClient(
+            host="",
+            username="",
+            password="",
+            use_https=False,
+            user_agent="marklogic-api-client-test",
+        )
+
+    def test_prefetch_metadata(self):
+        """
+        GIVEN several search results
+        WHEN their metadata is prefetched
+        THEN the properties of every result are fetched in one query
+        AND each result's metadata only contains its own properties
+        """
+        results = [
+            SearchResult(
+                etree.fromstring(
+                    f'<search:result xmlns:search="{SearchResult.NAMESPACES["search"]}" uri="/{uri}.xml"/>'
+                ),
+                self.client,
+            )
+            for uri in ("a/1", "a/2")
+        ]
+        with (
+            patch.object(
+                self.client,
+                "get_properties_for_search_results",
+                return_value=(
+                    "<property-results>"
+                    '<property-result uri="/a/1.xml" last-modified="2025-01-01T00:00:00Z">'
+                    "<source-name>first</source-name>"
+                    "</property-result>"
+                    '<property-result uri="/a/2.xml" last-modified="2025-02-01T00:00:00Z">'
+                    "<source-name>second</source-name>"
+                    "</property-result>"
+                    "</property-results>"
+                ),
+            ) as mock_get_properties_for_search_results,
+            patch.object(self.client, "get_last_modified") as mock_get_last_modified,
+        ):
+            SearchResult.prefetch_metadata(self.client, results)
+            SearchResult.prefetch_metadata(self.client, results)
+
+            assert [result.metadata.author for result in results] == ["first", "second"]
+            assert [result.metadata.last_modified for result in results] == [
+                "2025-01-01T00:00:00Z",
+                "2025-02-01T00:00:00Z",
+            ]
+            mock_get_properties_for_search_results.assert_called_once_with(["a/1", "a/2"])
+            mock_get_last_modified.assert_not_called()
+
+
 class TestSearchResultMetadataSubmissionDatetime:
     def test_submission_datetime_TDR_only(self):
         """
@@ -0,0 +1,177 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from caselawclient.search_response_cache import SearchResponseCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def wait_for_misses(cache, misses):
+    deadline = time.monotonic() + 5
+    while cache.stats.misses < misses:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    cache = SearchResponseCache(max_entries=2, ttl=60, stale_ttl=300, clock=clock)
+    yield cache
+    cache.close()
+
+
+class TestSearchResponseCache:
+    def test_miss_then_hit(self, cache):
+        fetch = Mock(return_value=b"<response/>")
+
+        assert cache.get_or_fetch("key", fetch) == b"<response/>"
+        assert cache.get_or_fetch("key", fetch) == b"<response/>"
+
+        fetch.assert_called_once_with()
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_stale_response_is_served_while_it_is_refreshed(self, cache, clock):
+        cache.get_or_fetch("key", Mock(return_value=b"<old/>"))
+        clock.now = 61
+        refresh = Mock(return_value=b"<new/>")
+
+        assert cache.get_or_fetch("key", refresh) == b"<old/>"
+        cache.close()
+
+        refresh.assert_called_once_with()
+        assert cache.get_or_fetch("key", Mock()) == b"<new/>"
+        assert cache.stats.stale_hits == 1
+        assert cache.stats.hits == 1
+
+    def test_failed_refresh_keeps_stale_response(self, cache, clock):
+        cache.get_or_fetch("key", Mock(return_value=b"<old/>"))
+        clock.now = 61
+
+        assert cache.get_or_fetch("key", Mock(side_effect=Exception("MarkLogic is down"))) == b"<old/>"
+        cache.close()
+
+        assert cache.get_or_fetch("key", Mock()) == b"<old/>"
+        assert cache.stats.refresh_failures == 1
+
+    def test_expired_response_is_fetched_again(self, cache, clock):
+        cache.get_or_fetch("key", Mock(return_value=b"<old/>"))
+        clock.now = 361
+        fetch = Mock(return_value=b"<new/>")
+
+        assert cache.get_or_fetch("key", fetch) == b"<new/>"
+        fetch.assert_called_once_with()
+        assert cache.stats.misses == 2
+
+    def test_least_recently_used_entry_is_evicted(self, cache):
+        cache.put("first", b"<first/>")
+        cache.put("second", b"<second/>")
+        cache.get_or_fetch("first", Mock())
+        cache.put("third", b"<third/>")
+
+        fetch = Mock(return_value=b"<second again/>")
+        assert cache.get_or_fetch("second", fetch) == b"<second again/>"
+        fetch.assert_called_once_with()
+        assert cache.stats.evictions == 2
+
+    def test_clear(self, cache):
+        cache.put("key", b"<response/>")
+        cache.clear()
+
+        assert cache.stats.size == 0
+
+    def test_concurrent_misses_share_one_fetch(self, cache):
+        fetch_started = threading.Event()
+        release_fetch = threading.Event()
+
+        def slow_fetch():
+            fetch_started.set()
+            release_fetch.wait(timeout=5)
+            return b"<response/>"
+
+        other_fetch = Mock(return_value=b"<other/>")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(cache.get_or_fetch, "key", slow_fetch)
+            fetch_started.wait(timeout=5)
+            second = executor.submit(cache.get_or_fetch, "key", other_fetch)
+            wait_for_misses(cache, 2)
+            release_fetch.set()
+
+            assert first.result(timeout=5) == b"<response/>"
+            assert second.result(timeout=5) == b"<response/>"
+
+        other_fetch.assert_not_called()
+
+    def test_concurrent_misses_share_a_failed_fetch(self, cache):
+        fetch_started = threading.Event()
+        release_fetch = threading.Event()
+
+        def failing_fetch():
+            fetch_started.set()
+            release_fetch.wait(timeout=5)
+            raise RuntimeError("MarkLogic is down")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(cache.get_or_fetch, "key", failing_fetch)
+            fetch_started.wait(timeout=5)
+            second = executor.submit(cache.get_or_fetch, "key", Mock())
+            wait_for_misses(cache, 2)
+            release_fetch.set()
+
+            with pytest.raises(RuntimeError, match="MarkLogic is down"):
+                first.result(timeout=5)
+            with pytest.raises(RuntimeError, match="MarkLogic is down"):
+                second.result(timeout=5)
+
+        fetch = Mock(return_value=b"<response/>")
+        assert cache.get_or_fetch("key", fetch) == b"<response/>"
+        fetch.assert_called_once_with()
+
+    def test_fetch_finishing_after_clear_is_not_cached(self, cache):
+        def fetch_then_clear():
+            cache.clear()
+            return b"<old/>"
+
+        assert cache.get_or_fetch("key", fetch_then_clear) == b"<old/>"
+        assert cache.stats.size == 0
+
+    def test_refresh_finishing_after_clear_is_not_cached(self, cache, clock):
+        cache.get_or_fetch("key", Mock(return_value=b"<old/>"))
+        clock.now = 61
+
+        def refresh_then_clear():
+            cache.clear()
+            return b"<refreshed/>"
+
+        assert cache.get_or_fetch("key", refresh_then_clear) == b"<old/>"
+        cache.close()
+
+        assert cache.stats.size == 0
+
+    def test_context_manager_closes_the_cache(self, clock):
+        with SearchResponseCache(clock=clock) as cache:
+            cache.get_or_fetch("key", Mock(return_value=b"<old/>"))
+            clock.now = 61
+            refresh = Mock(return_value=b"<new/>")
+            cache.get_or_fetch("key", refresh)
+
+        refresh.assert_called_once_with()
+        clock.now = 122
+        cache.get_or_fetch("key", Mock(return_value=b"<newer/>"))
+        assert cache.stats.stale_hits == 2
+        assert cache.get_or_fetch("key", Mock()) == b"<new/>"